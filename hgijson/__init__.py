@@ -1,7 +1,67 @@
-from hgijson.json_converters.primitive import IntJSONEncoder, StrJSONEncoder, IntJSONDecoder, FloatJSONEncoder, \
-    FloatJSONDecoder, DatetimeISOFormatJSONEncoder, DatetimeISOFormatJSONDecoder, DatetimeEpochJSONEncoder, \
-    DatetimeEpochJSONDecoder, ItemType, StrJSONDecoder
+import sys
+from importlib import import_module
 
-from hgijson.json_converters.builders import MappingJSONDecoderClassBuilder, MappingJSONEncoderClassBuilder
+# Public names, indexed by the module that they are imported from when first used (so that importing this package does
+# not import slow to import modules that may not be used)
+_LAZY_IMPORTS = {
+    "IntJSONEncoder": "hgijson.json_converters.primitive",
+    "StrJSONEncoder": "hgijson.json_converters.primitive",
+    "IntJSONDecoder": "hgijson.json_converters.primitive",
+    "FloatJSONEncoder": "hgijson.json_converters.primitive",
+    "FloatJSONDecoder": "hgijson.json_converters.primitive",
+    "DatetimeISOFormatJSONEncoder": "hgijson.json_converters.primitive",
+    "DatetimeISOFormatJSONDecoder": "hgijson.json_converters.primitive",
+    "DatetimeEpochJSONEncoder": "hgijson.json_converters.primitive",
+    "DatetimeEpochJSONDecoder": "hgijson.json_converters.primitive",
+    "ItemType": "hgijson.json_converters.primitive",
+    "StrJSONDecoder": "hgijson.json_converters.primitive",
+    "MappingJSONDecoderClassBuilder": "hgijson.json_converters.builders",
+    "MappingJSONEncoderClassBuilder": "hgijson.json_converters.builders",
+    "JsonPropertyMapping": "hgijson.json_converters.models",
+    "EncodedObjectCache": "hgijson.json_converters.caching",
+    "SerializationLimits": "hgijson.serialization",
+    "SerializationLimitExceededError": "hgijson.serialization",
+    "JSONRecordIndex": "hgijson.json_converters.indexing",
+    "RawJSON": "hgijson.json_converters.raw",
+    "RawJSONEncoder": "hgijson.json_converters.raw",
+    "RawJSONDecoder": "hgijson.json_converters.raw",
+    "derive_json_property_mappings": "hgijson.json_converters.derivation",
+    "derive_json_encoder_cls": "hgijson.json_converters.derivation",
+    "derive_json_decoder_cls": "hgijson.json_converters.derivation",
+    "iterencode_with_digest": "hgijson.json_converters.digests",
+    "dump_with_digest": "hgijson.json_converters.digests",
+    "dumps_with_digest": "hgijson.json_converters.digests",
+    "compile_codecs": "hgijson.json_converters.compilation",
+    "load_compiled_codecs": "hgijson.json_converters.compilation",
+    "fingerprint_codecs": "hgijson.json_converters.compilation",
+    "binary_dumps": "hgijson.binary_converters.formats",
+    "binary_loads": "hgijson.binary_converters.formats",
+    "CBORBinaryFormat": "hgijson.binary_converters.formats",
+    "MessagePackBinaryFormat": "hgijson.binary_converters.formats"
+}
 
-from hgijson.json_converters.models import JsonPropertyMapping
+__all__ = list(_LAZY_IMPORTS.keys())
+
+
+def __getattr__(name: str):
+    """
+    Imports the public name on first use (PEP 562).
+    :param name: the name
+    :return: the object with the given name
+    :raises AttributeError: raised if the name is not public
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError("module \"%s\" has no attribute \"%s\"" % (__name__, name))
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # Module `__getattr__` is not supported so import everything now
+    for _name in __all__:
+        __getattr__(_name)
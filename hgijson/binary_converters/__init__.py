@@ -0,0 +1,2 @@
+from hgijson.binary_converters.formats import BinaryFormat, CBORBinaryFormat, MessagePackBinaryFormat, binary_dumps, \
+    binary_loads
@@ -0,0 +1,211 @@
+import struct
+from typing import Any, Callable, Tuple
+
+# Major types (RFC 7049)
+_UNSIGNED_INT = 0
+_NEGATIVE_INT = 1
+_BYTES = 2
+_TEXT = 3
+_ARRAY = 4
+_MAP = 5
+_TAG = 6
+_SIMPLE_AND_FLOAT = 7
+
+_SIMPLE_FALSE = 20
+_SIMPLE_TRUE = 21
+_SIMPLE_NULL = 22
+_SIMPLE_UNDEFINED = 23
+_FALSE = bytes([(_SIMPLE_AND_FLOAT << 5) | _SIMPLE_FALSE])
+_TRUE = bytes([(_SIMPLE_AND_FLOAT << 5) | _SIMPLE_TRUE])
+_NULL = bytes([(_SIMPLE_AND_FLOAT << 5) | _SIMPLE_NULL])
+_INDEFINITE_LENGTH = 31
+_BREAK = 0xff
+
+_POSITIVE_BIGNUM_TAG = 2
+_NEGATIVE_BIGNUM_TAG = 3
+_MAX_UINT64 = 2 ** 64 - 1
+
+
+def _encode_head(major_type: int, value: int) -> bytes:
+    """
+    Encodes the head of a data item, which holds the major type and an unsigned integer argument.
+    :param major_type: the major type of the data item
+    :param value: the argument (e.g. the length of a string)
+    :return: the encoded head
+    """
+    major_type <<= 5
+    if value < 24:
+        return struct.pack(">B", major_type | value)
+    elif value < 2 ** 8:
+        return struct.pack(">BB", major_type | 24, value)
+    elif value < 2 ** 16:
+        return struct.pack(">BH", major_type | 25, value)
+    elif value < 2 ** 32:
+        return struct.pack(">BI", major_type | 26, value)
+    else:
+        return struct.pack(">BQ", major_type | 27, value)
+
+
+def _encode_int(value: int) -> bytes:
+    """
+    Encodes the given integer, using a bignum if it does not fit in 64 bits.
+    :param value: the integer
+    :return: the encoded integer
+    """
+    major_type, value = (_UNSIGNED_INT, value) if value >= 0 else (_NEGATIVE_INT, -1 - value)
+    if value <= _MAX_UINT64:
+        return _encode_head(major_type, value)
+    tag = _POSITIVE_BIGNUM_TAG if major_type == _UNSIGNED_INT else _NEGATIVE_BIGNUM_TAG
+    value_as_bytes = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return _encode_head(_TAG, tag) + _encode_head(_BYTES, len(value_as_bytes)) + value_as_bytes
+
+
+def dumps(obj: Any, default: Callable[[Any], Any]=None) -> bytes:
+    """
+    Encodes the given object as CBOR.
+    :param obj: the object to encode, made of `None`, `bool`, `int`, `float`, `str`, `bytes`, `list`, `tuple` and
+    `dict` values
+    :param default: called with any other type of value to get a value that can be encoded
+    :return: the CBOR encoding
+    :raises TypeError: raised if a value cannot be encoded and no `default` is given
+    """
+    encoded = []
+
+    def encode(value: Any):
+        # Checking `bool` before `int` as `bool` is a subclass of `int`
+        if value is None:
+            encoded.append(_NULL)
+        elif value is True:
+            encoded.append(_TRUE)
+        elif value is False:
+            encoded.append(_FALSE)
+        elif isinstance(value, int):
+            encoded.append(_encode_int(value))
+        elif isinstance(value, float):
+            encoded.append(struct.pack(">Bd", (_SIMPLE_AND_FLOAT << 5) | 27, value))
+        elif isinstance(value, str):
+            value_as_bytes = value.encode("utf-8")
+            encoded.append(_encode_head(_TEXT, len(value_as_bytes)))
+            encoded.append(value_as_bytes)
+        elif isinstance(value, (bytes, bytearray)):
+            encoded.append(_encode_head(_BYTES, len(value)))
+            encoded.append(bytes(value))
+        elif isinstance(value, (list, tuple)):
+            encoded.append(_encode_head(_ARRAY, len(value)))
+            for item in value:
+                encode(item)
+        elif isinstance(value, dict):
+            encoded.append(_encode_head(_MAP, len(value)))
+            for key, item in value.items():
+                encode(key)
+                encode(item)
+        elif default is not None:
+            encode(default(value))
+        else:
+            raise TypeError("Object of type %s cannot be encoded as CBOR" % type(value).__name__)
+
+    encode(obj)
+    return b"".join(encoded)
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decodes the given CBOR.
+    :param data: the CBOR encoding of a single data item
+    :return: the decoded object, where arrays are decoded as `list` and maps as `dict`
+    :raises ValueError: raised if the given data is not well-formed CBOR
+    """
+    data = bytes(data)
+
+    def read(length: int, offset: int) -> int:
+        end = offset + length
+        if end > len(data):
+            raise ValueError("Unexpected end of CBOR data at offset %d" % offset)
+        return end
+
+    def decode_argument(additional_information: int, offset: int) -> Tuple[int, int]:
+        if additional_information < 24:
+            return additional_information, offset
+        if additional_information > 27:
+            raise ValueError("Invalid CBOR additional information %d at offset %d" % (additional_information, offset))
+        size = 1 << (additional_information - 24)
+        end = read(size, offset)
+        return int.from_bytes(data[offset:end], "big"), end
+
+    def decode_float(additional_information: int, offset: int) -> Tuple[float, int]:
+        size = 1 << (additional_information - 24)
+        end = read(size, offset)
+        return struct.unpack(">" + {2: "e", 4: "f", 8: "d"}[size], data[offset:end])[0], end
+
+    def decode(offset: int) -> Tuple[Any, int]:
+        end = read(1, offset)
+        major_type, additional_information = data[offset] >> 5, data[offset] & 0x1f
+        offset = end
+
+        if major_type == _SIMPLE_AND_FLOAT:
+            if additional_information in (25, 26, 27):
+                return decode_float(additional_information, offset)
+            elif additional_information in (_SIMPLE_NULL, _SIMPLE_UNDEFINED):
+                return None, offset
+            elif additional_information in (_SIMPLE_FALSE, _SIMPLE_TRUE):
+                return additional_information == _SIMPLE_TRUE, offset
+            raise ValueError("Unsupported CBOR simple value %d at offset %d" % (additional_information, offset - 1))
+
+        if additional_information == _INDEFINITE_LENGTH:
+            return decode_indefinite_length(major_type, offset)
+        argument, offset = decode_argument(additional_information, offset)
+
+        if major_type == _UNSIGNED_INT:
+            return argument, offset
+        elif major_type == _NEGATIVE_INT:
+            return -1 - argument, offset
+        elif major_type in (_BYTES, _TEXT):
+            end = read(argument, offset)
+            value = data[offset:end]
+            return (value.decode("utf-8") if major_type == _TEXT else value), end
+        elif major_type == _ARRAY:
+            items = []
+            for _ in range(argument):
+                item, offset = decode(offset)
+                items.append(item)
+            return items, offset
+        elif major_type == _MAP:
+            items = {}
+            for _ in range(argument):
+                key, offset = decode(offset)
+                items[key], offset = decode(offset)
+            return items, offset
+        else:
+            value, offset = decode(offset)
+            if argument in (_POSITIVE_BIGNUM_TAG, _NEGATIVE_BIGNUM_TAG) and isinstance(value, bytes):
+                value = int.from_bytes(value, "big")
+                return (value if argument == _POSITIVE_BIGNUM_TAG else -1 - value), offset
+            # Other tags are not understood so only the tagged value is returned
+            return value, offset
+
+    def decode_indefinite_length(major_type: int, offset: int) -> Tuple[Any, int]:
+        items = []
+        while True:
+            read(1, offset)
+            if data[offset] == _BREAK:
+                offset += 1
+                break
+            item, offset = decode(offset)
+            items.append(item)
+
+        if major_type == _BYTES:
+            return b"".join(items), offset
+        elif major_type == _TEXT:
+            return "".join(items), offset
+        elif major_type == _ARRAY:
+            return items, offset
+        elif major_type == _MAP:
+            if len(items) % 2 != 0:
+                raise ValueError("CBOR map at offset %d has a key without a value" % offset)
+            return dict(zip(items[::2], items[1::2])), offset
+        raise ValueError("Invalid indefinite length CBOR data item of major type %d" % major_type)
+
+    decoded, offset = decode(0)
+    if offset != len(data):
+        raise ValueError("Unexpected data after CBOR data item at offset %d" % offset)
+    return decoded
@@ -0,0 +1,105 @@
+import json
+from abc import ABCMeta, abstractmethod
+from json import JSONEncoder, JSONDecoder
+from typing import Any, Callable, Type
+
+from hgijson.binary_converters import cbor
+from hgijson.custom_types import SerializableType, PrimitiveJsonType
+from hgijson.json_converters._serialization import MappingJSONEncoder
+from hgijson.json_converters.interfaces import ParsedJSONDecoder
+from hgijson.json_converters.raw import RawJSON
+
+
+class BinaryFormat(metaclass=ABCMeta):
+    """
+    Binary format that JSON-like primitive Python objects can be written to and read from.
+    """
+    @abstractmethod
+    def dumps(self, obj: PrimitiveJsonType, default: Callable[[Any], PrimitiveJsonType]=None) -> bytes:
+        """
+        Writes the given object in the binary format.
+        :param obj: the object to write
+        :param default: called with any value that is not a JSON-like primitive to get a value that can be written
+        :return: the object in the binary format
+        """
+
+    @abstractmethod
+    def loads(self, data: bytes) -> PrimitiveJsonType:
+        """
+        Reads an object from the given data in the binary format.
+        :param data: the data to read
+        :return: the object, represented using JSON-like primitive Python objects
+        """
+
+
+class CBORBinaryFormat(BinaryFormat):
+    """
+    CBOR (RFC 7049) binary format, using a pure-Python implementation.
+    """
+    def dumps(self, obj: PrimitiveJsonType, default: Callable[[Any], PrimitiveJsonType]=None) -> bytes:
+        return cbor.dumps(obj, default=default)
+
+    def loads(self, data: bytes) -> PrimitiveJsonType:
+        return cbor.loads(data)
+
+
+class MessagePackBinaryFormat(BinaryFormat):
+    """
+    MessagePack binary format (requires `msgpack`).
+    """
+    def __init__(self):
+        # Imported here so `msgpack` is only imported if used
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError("msgpack must be installed to use %s" % type(self).__name__) from e
+        self._msgpack = msgpack
+
+    def dumps(self, obj: PrimitiveJsonType, default: Callable[[Any], PrimitiveJsonType]=None) -> bytes:
+        return self._msgpack.packb(obj, default=default, use_bin_type=True)
+
+    def loads(self, data: bytes) -> PrimitiveJsonType:
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def binary_dumps(obj: Any, cls: Type[JSONEncoder], binary_format: BinaryFormat=None, **kwargs) -> bytes:
+    """
+    Encodes the given object using the given JSON encoder and writes the result in a binary format, without the
+    object being encoded as JSON text.
+    :param obj: the object to encode
+    :param cls: the JSON encoder to encode the object with
+    :param binary_format: the binary format to write (defaults to CBOR)
+    :param kwargs: keyword arguments to pass to the encoder's constructor (e.g. `fields`)
+    :return: the encoded object in the binary format
+    """
+    binary_format = binary_format if binary_format is not None else CBORBinaryFormat()
+    encoder = cls(**kwargs)
+    if isinstance(encoder, MappingJSONEncoder):
+        # Encodes lists of objects together, as done when encoding to JSON text
+        obj = encoder._encode_collection(obj)
+
+    def default(value: Any) -> PrimitiveJsonType:
+        if isinstance(value, RawJSON):
+            # Raw JSON cannot be embedded verbatim in a binary format so is written as parsed
+            return value.parse()
+        return encoder.default(value)
+
+    return binary_format.dumps(obj, default=default)
+
+
+def binary_loads(data: bytes, cls: Type[JSONDecoder], binary_format: BinaryFormat=None, **kwargs) -> SerializableType:
+    """
+    Reads the given data in a binary format and decodes the result using the given JSON decoder. The decoder must be
+    a `ParsedJSONDecoder` for this to be done without going via JSON text.
+    :param data: the data to read
+    :param cls: the JSON decoder to decode the read object with
+    :param binary_format: the binary format to read (defaults to CBOR)
+    :param kwargs: keyword arguments to pass to the decoder's constructor
+    :return: the decoded object
+    """
+    binary_format = binary_format if binary_format is not None else CBORBinaryFormat()
+    decoder = cls(**kwargs)
+    parsed = binary_format.loads(data)
+    if isinstance(decoder, ParsedJSONDecoder):
+        return decoder.decode_parsed(parsed)
+    return decoder.decode(json.dumps(parsed))
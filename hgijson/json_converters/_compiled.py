@@ -0,0 +1,188 @@
+import json
+from importlib import import_module
+from json import JSONEncoder, JSONDecoder
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from hgijson.custom_types import PrimitiveJsonType, SerializableType
+from hgijson.json_converters.interfaces import ParsedJSONDecoder
+from hgijson.json_converters.raw import RawJSONEmbeddingEncoder
+
+
+def resolve(module_name: str, qualified_name: str) -> Any:
+    """
+    Gets the object with the given qualified name from the module with the given name.
+    :param module_name: the name of the module
+    :param qualified_name: the qualified name of the object in the module (e.g. "Outer.Inner")
+    :return: the object
+    """
+    obj = import_module(module_name)
+    for name in qualified_name.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def encode_with(encoder: JSONEncoder, value: Any) -> PrimitiveJsonType:
+    """
+    Encodes the given value using the given (non-mapping) encoder, in the same way as the encoder's serializer.
+    :param encoder: the encoder
+    :param value: the value to encode
+    :return: the encoded value
+    """
+    default_many = getattr(encoder, "default_many", None)
+    if default_many is not None:
+        return default_many([value])[0]
+    return encoder.default(value)
+
+
+def decode_with(decoder: JSONDecoder, value: PrimitiveJsonType) -> Any:
+    """
+    Decodes the given value using the given (non-mapping) decoder, in the same way as the decoder's deserializer.
+    :param decoder: the decoder
+    :param value: the value to decode
+    :return: the decoded value
+    """
+    decode_parsed_many = getattr(decoder, "decode_parsed_many", None)
+    if decode_parsed_many is not None:
+        return decode_parsed_many([value])[0]
+    elif isinstance(decoder, ParsedJSONDecoder):
+        return decoder.decode_parsed(value)
+    return decoder.decode(json.dumps(value))
+
+
+def encode_nested(encode: Callable[[Any, Optional[Callable]], PrimitiveJsonType], value: Any,
+                  sort_key: Optional[Callable[[PrimitiveJsonType], Any]]) -> PrimitiveJsonType:
+    """
+    Encodes the given object, or (nested) list of objects, which may contain `None`.
+    :param encode: function that encodes a single object, given the object and the sort key
+    :param value: the object, or list of objects, to encode
+    :param sort_key: key by which the encoded items of sets are sorted (not sorted if `None`)
+    :return: the encoded value
+    """
+    if value is None:
+        return None
+    elif isinstance(value, list):
+        return [encode_nested(encode, item, sort_key) for item in value]
+    return encode(value, sort_key)
+
+
+def decode_nested(decode: Callable[[PrimitiveJsonType], Any], value: PrimitiveJsonType) -> Any:
+    """
+    Decodes the given JSON object, or (nested) list of JSON objects, which may contain `None`.
+    :param decode: function that decodes a single JSON object
+    :param value: the JSON object, or list of JSON objects, to decode
+    :return: the decoded value
+    """
+    if value is None:
+        return None
+    elif isinstance(value, list):
+        return [decode_nested(decode, item) for item in value]
+    return decode(value)
+
+
+def get_parent(parsed_json: dict, parents: Tuple[str, ...]) -> Optional[dict]:
+    """
+    Gets the innermost of the given parent JSON properties of the given JSON object.
+    :param parsed_json: the JSON object
+    :param parents: names of the parent properties, from the root of the JSON object
+    :return: the innermost parent else `None` if it does not exist
+    """
+    for parent in parents:
+        parsed_json = parsed_json.get(parent, None)
+        if parsed_json is None:
+            return None
+    return parsed_json
+
+
+def missing_key(parsed_json: dict, name: str):
+    """
+    Raises the error for a JSON object that is missing a non-optional property.
+    :param parsed_json: the JSON object
+    :param name: name of the property
+    :raises KeyError: always raised
+    """
+    raise KeyError("No value for the non-optional key \"%s\" in the input JSON: %s" % (name, parsed_json))
+
+
+def missing_parent(parsed_json: dict, parents: Tuple[str, ...]):
+    """
+    Raises the error for a JSON object that is missing the parent of a non-optional property.
+    :param parsed_json: the JSON object
+    :param parents: names of the parent properties, from the root of the JSON object
+    :raises KeyError: always raised
+    """
+    raise KeyError("Parent keys missing \"%s\" in the input: %s" % (".".join(parents), parsed_json))
+
+
+def set_existing_attribute(obj: Any, name: str, value: Any):
+    """
+    Sets the attribute with the given name of the given object, if the object has the attribute.
+    :param obj: the object
+    :param name: the name of the attribute
+    :param value: the value to set the attribute to
+    :raises AttributeError: raised if the object does not have the attribute
+    """
+    if not hasattr(obj, name):
+        raise AttributeError("Object \"%s\" does not have the attribute \"%s\"" % (obj, name))
+    setattr(obj, name, value)
+
+
+class CompiledJSONEncoder(RawJSONEmbeddingEncoder):
+    """
+    JSON encoder generated by `compile_codecs`.
+    """
+    _SERIALIZABLE_CLS = type(None)
+    # Encodes a single (non-`None`) object, given the key by which the encoded items of sets are sorted
+    _ENCODE = None  # type: Callable[[Any, Optional[Callable]], PrimitiveJsonType]
+
+    def __init__(self, *args, fields: Iterable[str]=None, columnar: bool=False, limits: Any=None, **kwargs):
+        """
+        Constructor.
+        :raises ValueError: raised if `fields`, `columnar` or `limits` are given, which are not supported
+        """
+        if fields is not None or columnar or limits is not None:
+            raise ValueError("Compiled encoders do not support `fields`, `columnar` or `limits`")
+        super().__init__(*args, **kwargs)
+        self._sort_key = None   # type: Optional[Callable[[PrimitiveJsonType], Any]]
+        if self.sort_keys:
+            # Encoded deterministically, as by the built encoders
+            from hgijson.json_converters._serialization import _canonical_json
+            self._sort_key = _canonical_json
+
+    def default(self, serializable: Any) -> PrimitiveJsonType:
+        if serializable is None:
+            return None
+        elif isinstance(serializable, list):
+            return encode_nested(self._ENCODE, serializable, self._sort_key)
+        elif not isinstance(serializable, self._SERIALIZABLE_CLS):
+            return super().default(serializable)
+        return self._ENCODE(serializable, self._sort_key)
+
+    def default_many(self, serializables: Iterable[Any]) -> List[PrimitiveJsonType]:
+        return [self.default(serializable) for serializable in serializables]
+
+
+class CompiledJSONDecoder(ParsedJSONDecoder):
+    """
+    JSON decoder generated by `compile_codecs`.
+    """
+    # Decodes a single JSON object
+    _DECODE = None  # type: Callable[[PrimitiveJsonType], Any]
+
+    def __init__(self, *args, columnar: bool=False, intern_keys: bool=False, limits: Any=None, **kwargs):
+        """
+        Constructor.
+        :raises ValueError: raised if `columnar`, `intern_keys` or `limits` are given, which are not supported
+        """
+        if columnar or intern_keys or limits is not None:
+            raise ValueError("Compiled decoders do not support `columnar`, `intern_keys` or `limits`")
+        super().__init__(*args, **kwargs)
+
+    def decode(self, json_as_string: str, **kwargs) -> SerializableType:
+        return self.decode_parsed(super().decode(json_as_string))
+
+    def decode_parsed(self, parsed_json: PrimitiveJsonType) -> SerializableType:
+        return decode_nested(self._DECODE, parsed_json)
+
+    def decode_parsed_many(self, parsed_jsons: Iterable[PrimitiveJsonType]) -> List[SerializableType]:
+        decode = self._DECODE
+        return [decode_nested(decode, parsed_json) for parsed_json in parsed_jsons]
@@ -1,7 +1,7 @@
 import json
 from abc import ABCMeta, abstractmethod
 from json import JSONDecoder, JSONEncoder
-from typing import Optional, Union, Callable, Type
+from typing import Optional, Union, Callable, Type, Iterable, List
 
 from hgijson.json_converters.interfaces import ParsedJSONDecoder
 from hgijson.serialization import Deserializer, Serializer
@@ -20,9 +20,17 @@ class _JSONEncoderAsSerializer(Serializer, metaclass=ABCMeta):
         :return: the encoder type (must be a subclass of `JSONEncoder`)
         """
 
+    # Additional keyword arguments that are given to the encoder if it is a `MappingJSONEncoder`
+    _MAPPING_JSON_ENCODER_KWARGS = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__([])
-        self._encoder = self.encoder_type(*args, **kwargs)
+        encoder_type = self.encoder_type
+        if len(self._MAPPING_JSON_ENCODER_KWARGS) > 0:
+            from hgijson.json_converters._serialization import MappingJSONEncoder
+            if issubclass(encoder_type, MappingJSONEncoder):
+                kwargs = dict(kwargs, **self._MAPPING_JSON_ENCODER_KWARGS)
+        self._encoder = encoder_type(*args, **kwargs)
 
     def serialize(self, serializable: Optional[SerializableType]) -> PrimitiveUnionType:
         if type(self._encoder) == JSONEncoder:
@@ -31,6 +39,26 @@ class _JSONEncoderAsSerializer(Serializer, metaclass=ABCMeta):
         else:
             return self._encoder.default(serializable)
 
+    def serialize_many(self, serializables: Iterable[Optional[SerializableType]]) -> List[PrimitiveUnionType]:
+        if type(self._encoder) == JSONEncoder:
+            # Single round trip through a string for all of the values
+            return json.loads(self._encoder.encode(list(serializables)))
+        default_many = getattr(self._encoder, "default_many", None)
+        if default_many is not None:
+            # Encoder supports encoding all values in one call
+            return default_many(serializables)
+        else:
+            return [self._encoder.default(serializable) for serializable in serializables]
+
+    def _get_iterative_serializer(self) -> Optional[Serializer]:
+        from hgijson.json_converters._serialization import MappingJSONEncoder
+        encoder_type = type(self._encoder)
+        if isinstance(self._encoder, MappingJSONEncoder) and getattr(
+                encoder_type, "_MAPPING_ONLY_DEFAULT", encoder_type.default_many is MappingJSONEncoder.default_many):
+            # Encoding values with the encoder is equivalent to using its serializer
+            return self._encoder._create_serializer()._get_iterative_serializer()
+        return None
+
     def _create_serializer_of_type(self, serializer_type: Type[Serializer]) -> None:
         """
         Unused - implemented to satisfy the interface only.
@@ -68,6 +96,23 @@ class _JSONDecoderAsDeserializer(Deserializer, metaclass=ABCMeta):
             # again!)
             return self._decoder.decode_parsed(deserializable)
 
+    def deserialize_many(self, deserializables: Iterable[PrimitiveJsonType]) -> List[Optional[SerializableType]]:
+        decode_parsed_many = getattr(self._decoder, "decode_parsed_many", None)
+        if decode_parsed_many is not None:
+            # Decoder supports decoding all values in one call
+            return decode_parsed_many(deserializables)
+        else:
+            return [self.deserialize(deserializable) for deserializable in deserializables]
+
+    def _get_iterative_deserializer(self) -> Optional[Deserializer]:
+        from hgijson.json_converters._serialization import MappingJSONDecoder
+        if isinstance(self._decoder, MappingJSONDecoder) \
+                and type(self._decoder).decode_parsed_many is MappingJSONDecoder.decode_parsed_many \
+                and type(self._decoder).decode_parsed is MappingJSONDecoder.decode_parsed:
+            # Decoding values with the decoder is equivalent to using its deserializer
+            return self._decoder._create_deserializer()._get_iterative_deserializer()
+        return None
+
     def _create_deserializer_of_type(self, deserializer_type: Type[JSONDecoder]) -> None:
         """
         Unused - implemented to satisfy the interface only.
@@ -86,7 +131,9 @@ def json_encoder_to_serializer(encoder_cls: Union[Type[JSONEncoder], Callable[[]
         "%sAsSerializer" % name,
         (_JSONEncoderAsSerializer,),
         {
-            "encoder_type": property(lambda self: encoder_cls if isinstance(encoder_cls, type) else encoder_cls())
+            "encoder_type": property(lambda self: encoder_cls if isinstance(encoder_cls, type) else encoder_cls()),
+            # The encoder class (or function that returns it) given, which can be inspected without calling it
+            "_ENCODER_CLS": encoder_cls
         }
     )
 
@@ -103,6 +150,8 @@ def json_decoder_to_deserializer(decoder_cls: Union[Type[JSONDecoder], Callable[
         "%sAsDeserializer" % name,
         (_JSONDecoderAsDeserializer,),
         {
-            "decoder_type": property(lambda self: decoder_cls if isinstance(decoder_cls, type) else decoder_cls())
+            "decoder_type": property(lambda self: decoder_cls if isinstance(decoder_cls, type) else decoder_cls()),
+            # The decoder class (or function that returns it) given, which can be inspected without calling it
+            "_DECODER_CLS": decoder_cls
         }
     )
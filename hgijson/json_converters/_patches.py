@@ -0,0 +1,135 @@
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from hgijson.custom_types import PrimitiveJsonType
+
+# Change to an encoding, where `path` is the names of the JSON properties from the root of the encoding to the changed
+# property, `operation` is "add", "replace" or "remove" (as in RFC 6902), `value` is the new value (`None` if removed)
+# and `previous_value` is the value that has been replaced or removed (`None` if added)
+Change = NamedTuple("Change", [("path", Tuple[str, ...]), ("operation", str), ("value", PrimitiveJsonType),
+                               ("previous_value", PrimitiveJsonType)])
+
+
+def json_equal(value: PrimitiveJsonType, other: PrimitiveJsonType) -> bool:
+    """
+    Gets whether the given JSON values are the same, opposed to just equal in Python (e.g. `1 == True`).
+    :param value: the first value
+    :param other: the second value
+    :return: whether the values are the same
+    """
+    if value is other:
+        return True
+    elif isinstance(value, dict):
+        return isinstance(other, dict) and value.keys() == other.keys() \
+            and all(json_equal(item, other[key]) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        return isinstance(other, (list, tuple)) and len(value) == len(other) \
+            and all(json_equal(item, other_item) for item, other_item in zip(value, other))
+    return type(value) == type(other) and value == other
+
+
+def diff_encodings(previous: PrimitiveJsonType, current: PrimitiveJsonType, path: Tuple[str, ...],
+                   changes: List[Change]):
+    """
+    Compares the given encodings, adding the changes from the previous encoding to the current encoding to the given
+    list of changes.
+    :param previous: the previous encoding
+    :param current: the current encoding
+    :param path: the path of the encodings from the root of the encoding
+    :param changes: the list to which changes are added
+    """
+    if isinstance(previous, dict) and isinstance(current, dict):
+        for key, previous_value in previous.items():
+            if key not in current:
+                changes.append(Change(path + (key, ), "remove", None, previous_value))
+        for key, value in current.items():
+            if key not in previous:
+                changes.append(Change(path + (key, ), "add", value, None))
+            else:
+                diff_encodings(previous[key], value, path + (key, ), changes)
+    elif not json_equal(previous, current):
+        changes.append(Change(path, "replace", current, previous))
+
+
+def _escape_json_pointer_token(name: str) -> str:
+    return name.replace("~", "~0").replace("/", "~1")
+
+
+def to_json_patch(changes: List[Change]) -> List[Dict[str, Any]]:
+    """
+    Converts the given changes into a JSON Patch (RFC 6902).
+    :param changes: the changes
+    :return: the operations of the patch
+    """
+    patch = []
+    for change in changes:
+        operation = {"op": change.operation, "path": "".join("/%s" % _escape_json_pointer_token(name)
+                                                            for name in change.path)}
+        if change.operation != "remove":
+            operation["value"] = change.value
+        patch.append(operation)
+    return patch
+
+
+def _check_merge_patch_value(value: PrimitiveJsonType):
+    """
+    Checks that the given value can be represented in a JSON Merge Patch.
+    :param value: the value
+    :raises ValueError: raised if the value is, or is a JSON object that contains, `null`, which would be interpreted
+    as a removal
+    """
+    if value is None:
+        raise ValueError("A value of `null` cannot be represented in a JSON Merge Patch")
+    elif isinstance(value, dict):
+        for item in value.values():
+            _check_merge_patch_value(item)
+
+
+def _create_merge_patch(previous: Dict, current: Dict) -> Dict:
+    """
+    Creates the JSON Merge Patch that changes the given previous JSON object into the given current JSON object.
+    :param previous: the previous JSON object
+    :param current: the current JSON object
+    :return: the patch
+    :raises ValueError: raised if the current JSON object cannot be represented in a JSON Merge Patch
+    """
+    patch = {key: None for key in previous.keys() if key not in current}
+    for key, value in current.items():
+        previous_value = previous.get(key, None)
+        if isinstance(value, dict) and isinstance(previous_value, dict):
+            sub_patch = _create_merge_patch(previous_value, value)
+            if len(sub_patch) > 0:
+                patch[key] = sub_patch
+        elif key not in previous or not json_equal(previous_value, value):
+            _check_merge_patch_value(value)
+            patch[key] = value
+    return patch
+
+
+def to_merge_patch(changes: List[Change]) -> PrimitiveJsonType:
+    """
+    Converts the given changes into a JSON Merge Patch (RFC 7396).
+    :param changes: the changes
+    :return: the patch
+    :raises ValueError: raised if a changed value cannot be represented in a JSON Merge Patch (i.e. if it is `null`)
+    """
+    patch = {}
+    for change in changes:
+        if len(change.path) == 0:
+            # Replacement of the whole encoding
+            if isinstance(change.value, dict) and isinstance(change.previous_value, dict):
+                return _create_merge_patch(change.previous_value, change.value)
+            _check_merge_patch_value(change.value)
+            return change.value
+
+        container = patch
+        for name in change.path[:-1]:
+            container = container.setdefault(name, {})
+        if change.operation == "remove":
+            container[change.path[-1]] = None
+        elif isinstance(change.value, dict) and isinstance(change.previous_value, dict):
+            # Setting a JSON object to a JSON object merges them
+            container[change.path[-1]] = _create_merge_patch(change.previous_value, change.value)
+        else:
+            _check_merge_patch_value(change.value)
+            container[change.path[-1]] = change.value
+    return patch
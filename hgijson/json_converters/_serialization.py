@@ -1,13 +1,350 @@
+import copy
+import json
 from abc import ABCMeta, abstractmethod
-from json import JSONEncoder
-from typing import Union, List, Optional
+from collections.abc import Set
+from functools import partial
+from sys import intern
+from typing import Union, List, Optional, Iterable, Dict, Any, Iterator, Callable, Tuple, FrozenSet
+from weakref import WeakKeyDictionary
 
+from hgijson.json_converters.caching import EncodedObjectCache
+from hgijson.json_converters._patches import Change, json_equal, diff_encodings, to_json_patch, to_merge_patch
 from hgijson.json_converters._serializers import JsonObjectSerializer, JsonObjectDeserializer
 from hgijson.json_converters.interfaces import ParsedJSONDecoder
-from hgijson.serialization import PropertyMapping
+from hgijson.json_converters.raw import RawJSONEmbeddingEncoder, RawJSONEncoder, RawJSONDecoder, _RawJSONPaths, \
+    _decode_with_raw_json
+from hgijson.serialization import PropertyMapping, SerializationLimits, SerializationLimitExceededError, \
+    _tracking_limits, _check_collection_length
 from hgijson.custom_types import PrimitiveJsonType, SerializableType
 
 
+_FieldMask = Dict[str, Optional["_FieldMask"]]
+
+# Denotes that a JSON property is missing
+_MISSING = object()
+
+# Serializer classes that encode sparse fieldsets, for each serializer class and set of fields
+_PROJECTED_SERIALIZER_CLASSES = WeakKeyDictionary()    # type: WeakKeyDictionary
+
+# Paths of the JSON properties that are decoded as raw JSON by each mapping decoder class
+_RAW_JSON_PATHS = WeakKeyDictionary()  # type: WeakKeyDictionary
+
+
+def _parse_field_mask(fields: Iterable[str]) -> _FieldMask:
+    """
+    Parses the given fields into a field mask tree.
+    :param fields: the JSON properties to include, where nested properties are denoted using `.` (e.g. "office.name")
+    :return: tree of the JSON properties to include, where `None` denotes that all of a property is to be included
+    """
+    field_mask = {}     # type: _FieldMask
+    for field in fields:
+        node = field_mask
+        keys = field.split(".")
+        for key in keys[:-1]:
+            if key in node and node[key] is None:
+                # All of the parent property is already included
+                break
+            node = node.setdefault(key, {})
+        else:
+            node[keys[-1]] = None
+    return field_mask
+
+
+def _field_mask_to_fields(field_mask: _FieldMask) -> List[str]:
+    """
+    Converts the given field mask tree back into the fields that it was parsed from.
+    :param field_mask: the field mask tree
+    :return: the fields, where nested properties are denoted using `.`
+    """
+    fields = []
+    for key, sub_field_mask in field_mask.items():
+        if sub_field_mask is None:
+            fields.append(key)
+        else:
+            fields.extend("%s.%s" % (key, field) for field in _field_mask_to_fields(sub_field_mask))
+    return fields
+
+
+def _project_json(encoded: PrimitiveJsonType, field_mask: Optional[_FieldMask]) -> PrimitiveJsonType:
+    """
+    Projects the given encoded JSON onto the JSON properties selected by the given field mask.
+    :param encoded: the encoded JSON (a field mask is applied to each item of a list)
+    :param field_mask: the field mask tree (all of the JSON is selected if `None`)
+    :return: the projected JSON
+    :raises ValueError: raised if the field mask selects properties of JSON that is not a JSON object
+    """
+    if field_mask is None:
+        return encoded
+    elif isinstance(encoded, list):
+        return [_project_json(item, field_mask) for item in encoded]
+    elif not isinstance(encoded, dict):
+        raise ValueError("Fields %s cannot be selected from JSON that is not a JSON object: %s"
+                         % (_field_mask_to_fields(field_mask), encoded))
+    return {key: _project_json(value, field_mask[key]) for key, value in encoded.items() if key in field_mask}
+
+
+def _merge_json(target: Dict[str, PrimitiveJsonType], source: Dict[str, PrimitiveJsonType]):
+    """
+    Merges the given JSON object into the given target JSON object, merging the JSON objects that both have.
+    :param target: the JSON object to merge into
+    :param source: the JSON object to merge
+    """
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge_json(target[key], value)
+        else:
+            target[key] = value
+
+
+def _create_projecting_json_property_setter(json_property_setter: Callable[[Dict, Any], None],
+                                            field_mask: _FieldMask) -> Callable[[Dict, Any], None]:
+    """
+    Creates a JSON property setter that only sets the JSON properties selected by the given field mask, of those set
+    by the given setter.
+    :param json_property_setter: the setter
+    :param field_mask: the field mask tree, relative to the JSON object given to the setter
+    :return: the projecting setter
+    """
+    def projecting_json_property_setter(obj_as_json: Dict, value: Any):
+        set_by_setter = {}
+        json_property_setter(set_by_setter, value)
+        _merge_json(obj_as_json, _project_json(set_by_setter, field_mask))
+    return projecting_json_property_setter
+
+
+def _create_value_projecting_json_property_setter(json_property_setter: Callable[[Dict, Any], None],
+                                                  field_mask: _FieldMask) -> Callable[[Dict, Any], None]:
+    """
+    Creates a JSON property setter that sets the projection of each value, onto the JSON properties selected by the
+    given field mask, using the given setter.
+    :param json_property_setter: the setter
+    :param field_mask: the field mask tree, relative to the value
+    :return: the projecting setter
+    """
+    return lambda obj_as_json, value: json_property_setter(obj_as_json, _project_json(value, field_mask))
+
+
+def _create_projected_serializer_cls(serializer_cls: type, field_mask: _FieldMask) -> type:
+    """
+    Creates the class of a serializer that encodes the JSON properties selected by the given field mask, by giving the
+    field mask to the serializer's mapping encoder.
+    :param serializer_cls: the class of the serializer, which uses a mapping encoder
+    :param field_mask: the field mask tree
+    :return: the serializer class (the same class is returned for the same serializer class and field mask)
+    """
+    fields = _field_mask_to_fields(field_mask)
+    projected_serializer_classes = _PROJECTED_SERIALIZER_CLASSES.setdefault(serializer_cls, {})
+    key = frozenset(fields)
+    if key not in projected_serializer_classes:
+        projected_serializer_classes[key] = type(
+            "%sProjected" % serializer_cls.__name__,
+            (serializer_cls, ),
+            {
+                "_MAPPING_JSON_ENCODER_KWARGS": {"fields": fields}
+            }
+        )
+    return projected_serializer_classes[key]
+
+
+def _project_property_mappings(property_mappings: Iterable[PropertyMapping], field_mask: _FieldMask) \
+        -> List[PropertyMapping]:
+    """
+    Projects the given property mappings onto those that produce the JSON properties selected by the given field mask.
+    Mappings that are not named (i.e. those that only use custom JSON property setters) are selected if their parent
+    JSON properties are, in which case only the JSON properties that they set that are selected are kept.
+    :param property_mappings: the property mappings to project
+    :param field_mask: the field mask tree
+    :return: the selected property mappings, where the nested encoders of partially selected properties are given the
+    relevant part of the field mask (or the encoded values are projected, if not encoded by a mapping encoder)
+    """
+    projected = []
+    for mapping in property_mappings:
+        if mapping.serialized_property_setter is None:
+            continue
+        json_property_name = getattr(mapping, "json_property_name", None)
+        path = list(mapping.serialized_property_parents or ())
+        if json_property_name is not None:
+            path.append(json_property_name)
+
+        sub_field_mask = field_mask
+        selected = True
+        for key in path:
+            if sub_field_mask is None:
+                # An ancestor of the property has been selected in its entirety
+                break
+            if key not in sub_field_mask:
+                selected = False
+                break
+            sub_field_mask = sub_field_mask[key]
+        if not selected:
+            continue
+
+        if sub_field_mask is not None:
+            mapping = copy.copy(mapping)
+            if json_property_name is None:
+                # JSON properties set by the mapping are only known once they are set
+                relative_setter = _create_projecting_json_property_setter(
+                    mapping.relative_serialized_property_setter, sub_field_mask)
+                setter = _create_projecting_json_property_setter(mapping.serialized_property_setter, field_mask)
+            else:
+                encoder_cls = getattr(mapping.serializer_cls, "_ENCODER_CLS", None)
+                if encoder_cls is not None and not isinstance(encoder_cls, type):
+                    encoder_cls = encoder_cls()
+                if isinstance(encoder_cls, type) and issubclass(encoder_cls, MappingJSONEncoder):
+                    mapping.serializer_cls = _create_projected_serializer_cls(mapping.serializer_cls, sub_field_mask)
+                    projected.append(mapping)
+                    continue
+                relative_setter = _create_value_projecting_json_property_setter(
+                    mapping.relative_serialized_property_setter, sub_field_mask)
+                setter = _create_value_projecting_json_property_setter(mapping.serialized_property_setter,
+                                                                       sub_field_mask)
+            mapping.relative_serialized_property_setter = relative_setter
+            mapping.serialized_property_setter = setter
+        projected.append(mapping)
+    return projected
+
+
+# Keys of the JSON object that envelopes the columnar representation of a list of objects, which distinguish it from the
+# encoding of a single object
+_COLUMNS_KEY = "$columns"
+_COLUMNS_LENGTH_KEY = "$length"
+
+
+def _rows_to_columns(rows: List[PrimitiveJsonType]) -> Dict[str, Any]:
+    """
+    Converts the given JSON objects into a columnar representation, where the values of each property are listed under
+    the property. Properties missing from an object are given a value of `None` in the column.
+    :param rows: the JSON objects
+    :return: the columnar representation of the objects, enveloped in a JSON object with the columns under
+    `_COLUMNS_KEY` and the number of objects under `_COLUMNS_LENGTH_KEY`
+    :raises ValueError: raised if any of the given rows is not a JSON object
+    """
+    columns = {}    # type: Dict[str, List[PrimitiveJsonType]]
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise ValueError("Only JSON objects can be represented in columns: %s" % row)
+        for key, value in row.items():
+            if key not in columns:
+                columns[key] = [None] * len(rows)
+            columns[key][i] = value
+    return {_COLUMNS_KEY: columns, _COLUMNS_LENGTH_KEY: len(rows)}
+
+
+def _is_columnar(parsed_json: PrimitiveJsonType) -> bool:
+    """
+    Gets whether the given parsed JSON is the columnar representation of a list of objects, produced by
+    `_rows_to_columns`, opposed to (for example) the encoding of a single object.
+    :param parsed_json: the parsed JSON
+    :return: whether the JSON is a columnar representation
+    """
+    return isinstance(parsed_json, dict) and len(parsed_json) == 2 and _COLUMNS_KEY in parsed_json \
+        and _COLUMNS_LENGTH_KEY in parsed_json
+
+
+def _columns_to_rows(columnar: Dict[str, Any]) -> List[Dict[str, PrimitiveJsonType]]:
+    """
+    Converts the given columnar representation, produced by `_rows_to_columns`, back into JSON objects.
+    :param columnar: the columnar representation
+    :return: the JSON objects
+    :raises ValueError: raised if the columns are not all lists of the stated length
+    """
+    columns, length = columnar[_COLUMNS_KEY], columnar[_COLUMNS_LENGTH_KEY]
+    if not isinstance(columns, dict) or not isinstance(length, int) \
+            or any(not isinstance(column, list) or len(column) != length for column in columns.values()):
+        raise ValueError("Columns must be lists of the same length as the number of objects: %s" % columnar)
+    keys = list(columns.keys())
+    if len(keys) == 0:
+        return [{} for _ in range(length)]
+    return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+
+def _canonical_json(encoded: PrimitiveJsonType) -> str:
+    """
+    Gets the canonical JSON of the given encoded value (with sorted keys), by which encoded values can be ordered.
+    :param encoded: the encoded value
+    :return: the canonical JSON
+    """
+    return json.dumps(encoded, sort_keys=True, cls=RawJSONEncoder)
+
+
+def _check_json_size(json_as_string: str, limits: Optional[SerializationLimits]):
+    """
+    Checks that the size of the UTF-8 encoding of the given JSON is within the given limits.
+    :param json_as_string: the JSON
+    :param limits: the limits (nothing is checked if `None`)
+    :raises SerializationLimitExceededError: raised if the JSON exceeds its maximum size
+    """
+    if limits is None or limits.max_bytes is None:
+        return
+    # Each character is encoded in 1-4 bytes, so the JSON is only encoded if its size cannot otherwise be bounded
+    length = len(json_as_string)
+    if length > limits.max_bytes or (length * 4 > limits.max_bytes
+                                     and len(json_as_string.encode("utf-8")) > limits.max_bytes):
+        raise SerializationLimitExceededError("max_bytes", limits.max_bytes)
+
+
+def _create_interning_object_pairs_hook(
+        object_pairs_hook: Optional[Callable[[List[Tuple[str, Any]]], Any]]=None,
+        object_hook: Optional[Callable[[Dict], Any]]=None) -> Callable[[List[Tuple[str, Any]]], Any]:
+    """
+    Creates a `json.JSONDecoder` object pairs hook that interns the keys of JSON objects, before creating the decoded
+    object using the given hook.
+    :param object_pairs_hook: creates the decoded object from the pairs of keys and values (takes precedence)
+    :param object_hook: creates the decoded object from a dictionary
+    :return: the object pairs hook
+    """
+    if object_pairs_hook is not None:
+        return lambda pairs: object_pairs_hook([(intern(key), value) for key, value in pairs])
+    elif object_hook is not None:
+        return lambda pairs: object_hook({intern(key): value for key, value in pairs})
+    return lambda pairs: {intern(key): value for key, value in pairs}
+
+
+def _find_raw_json_paths(decoder_cls: type, visiting: FrozenSet[type]=frozenset()) -> _RawJSONPaths:
+    """
+    Finds the paths of the JSON properties that the given mapping decoder (or the mapping decoders of its properties)
+    decodes as raw JSON. Only properties that are got by name are included, and not those that are in (or contain) a
+    JSON property got by another mapping, which would otherwise get the `RawJSON` in place of the parsed value.
+    :param decoder_cls: the class of the mapping decoder
+    :param visiting: the classes of the mapping decoders that the given decoder is nested in
+    :return: the paths of the properties that hold raw JSON
+    """
+    visiting = visiting | {decoder_cls}
+    found = []  # type: List[Tuple[Tuple[str, ...], Optional[_RawJSONPaths]]]
+    paths = []  # type: List[Tuple[str, ...]]
+    for mapping in decoder_cls()._get_property_mappings():
+        if mapping.serialized_property_getter is None:
+            continue
+        elif mapping.relative_serialized_property_getter \
+                is not getattr(mapping, "_generated_json_property_getter", None):
+            # The JSON properties that a custom getter gets are unknown
+            return {}
+        path = (mapping.serialized_property_parents or ()) + (mapping.json_property_name, )
+        paths.append(path)
+
+        property_decoder_cls = getattr(mapping.deserializer_cls, "_DECODER_CLS", None)
+        if property_decoder_cls is not None and not isinstance(property_decoder_cls, type):
+            property_decoder_cls = property_decoder_cls()
+        if not isinstance(property_decoder_cls, type):
+            continue
+        elif issubclass(property_decoder_cls, RawJSONDecoder):
+            found.append((path, None))
+        elif issubclass(property_decoder_cls, MappingJSONDecoder) and property_decoder_cls not in visiting:
+            value_paths = _find_raw_json_paths(property_decoder_cls, visiting)
+            if len(value_paths) > 0:
+                found.append((path, value_paths))
+
+    raw_json_paths = {}     # type: _RawJSONPaths
+    for path, value_paths in found:
+        if sum(1 for other in paths if other[:len(path)] == path or path[:len(other)] == other) > 1:
+            continue
+        container = raw_json_paths
+        for name in path[:-1]:
+            container = container.setdefault(name, {})
+        container[path[-1]] = value_paths
+    return raw_json_paths
+
+
 class PropertyMapper(metaclass=ABCMeta):
     """
     Model of a mapping from a property of a JSON model to a property of a native Python object.
@@ -20,13 +357,20 @@ class PropertyMapper(metaclass=ABCMeta):
         return []
 
 
-class MappingJSONEncoder(JSONEncoder, PropertyMapper, metaclass=ABCMeta):
+class MappingJSONEncoder(RawJSONEmbeddingEncoder, PropertyMapper, metaclass=ABCMeta):
     """
     JSON encoder that serialises an object based on a mapping of its properties to JSON properties.
 
     As `json.dumps` requires a type rather than an instance and there is no control given over the instatiation, the
     encoded class and the mappings between the object properties and the json properties cannot be passed through the
     constructor. Instead this class must be subclassed and the subclass must define the relevant constants.
+
+    A sparse fieldset can be encoded by giving the `fields` keyword argument (e.g.
+    `json.dumps(obj, cls=Encoder, fields=["name", "office.name"])`). Mappings of properties that are not selected are
+    not used, hence the object properties that they would get are never evaluated.
+
+    Lists of objects can be encoded in columns, e.g. `{"$columns": {"id": [1, 2], "name": ["a", "b"]}, "$length": 2}`,
+    by giving `columnar=True`.
     """
     @abstractmethod
     def _get_serializable_cls(self) -> type:
@@ -35,37 +379,278 @@ class MappingJSONEncoder(JSONEncoder, PropertyMapper, metaclass=ABCMeta):
         :return: the class the encoder will serialize
         """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, fields: Iterable[str]=None, columnar: bool=False, limits: SerializationLimits=None,
+                 **kwargs):
+        """
+        Constructor.
+        :param fields: JSON properties to include in the encoding (all are included if `None`), where nested properties
+        are denoted using `.` (e.g. "office.name")
+        :param columnar: whether a list of objects should be encoded as a JSON object of lists, where each list holds
+        the values of a property (a column), opposed to as a list of JSON objects. The columns are enveloped, so that
+        they are not mistaken for a single object
+        :param limits: limits on the encoding of an object (or list of objects), where `max_bytes` limits the size of
+        the UTF-8 encoding of the JSON produced by `encode` and `iterencode`
+        """
         super().__init__(*args, **kwargs)
         self._args = args
         self._kwargs = kwargs
+        self._field_mask = _parse_field_mask(fields) if fields is not None else None
+        self._columnar = columnar
+        self._limits = limits
         self._serializer_cache = None
 
     def default(self, serializable: Optional[Union[SerializableType, List[SerializableType]]]) \
             -> PrimitiveJsonType:
         serializer = self._create_serializer()
-        if serializable is not None \
-                and not isinstance(serializable, List) \
-                and not isinstance(serializable, self._get_serializable_cls()):
+        if serializable is None:
+            return None
+        elif isinstance(serializable, list):
+            return self._encode_list(serializable)
+        elif not isinstance(serializable, self._get_serializable_cls()):
             return super().default(serializable)
 
         return serializer.serialize(serializable)
 
+    def default_many(self, serializables: Iterable[Optional[Union[SerializableType, List[SerializableType]]]]) \
+            -> List[PrimitiveJsonType]:
+        """
+        Encodes each of the given objects (or collections of objects), a property at a time.
+        :param serializables: the objects to encode
+        :return: the encoded objects, in the same order as those given
+        """
+        serializer = self._create_serializer()
+        return serializer.serialize_many(serializables)
+
+    def default_json_patch(self, serializable: Optional[SerializableType], previous: PrimitiveJsonType) \
+            -> Tuple[List[Dict[str, Any]], PrimitiveJsonType]:
+        """
+        Encodes the given object as a JSON Patch (RFC 6902) of the given previous encoding of the object.
+
+        Properties mapped by name are compared with the previous encoding one at a time, where nested objects are
+        compared a property at a time (opposed to being encoded in their entirety), with unchanged values reused.
+        :param serializable: the object to encode
+        :param previous: the previous encoding of the object (e.g. the encoding returned by a previous call)
+        :return: tuple where the first element is the operations of the patch and the second is the encoding of the
+        object, to be given as the previous encoding next time
+        """
+        changes = []    # type: List[Change]
+        encoded = self._encode_changes(serializable, previous, (), changes)
+        return to_json_patch(changes), encoded
+
+    def default_merge_patch(self, serializable: Optional[SerializableType], previous: PrimitiveJsonType) \
+            -> Tuple[PrimitiveJsonType, PrimitiveJsonType]:
+        """
+        Encodes the given object as a JSON Merge Patch (RFC 7396) of the given previous encoding of the object, in the
+        same way as `default_json_patch`.
+        :param serializable: the object to encode
+        :param previous: the previous encoding of the object (e.g. the encoding returned by a previous call)
+        :return: tuple where the first element is the patch and the second is the encoding of the object, to be given
+        as the previous encoding next time
+        :raises ValueError: raised if a changed value is `null`, which cannot be represented in a JSON Merge Patch
+        """
+        changes = []    # type: List[Change]
+        encoded = self._encode_changes(serializable, previous, (), changes)
+        return to_merge_patch(changes), encoded
+
+    def _encode_changes(self, serializable: Optional[SerializableType], previous: PrimitiveJsonType,
+                        path: Tuple[str, ...], changes: List[Change]) -> PrimitiveJsonType:
+        """
+        Encodes the given object, adding the changes from the given previous encoding of the object to the given list of
+        changes.
+        :param serializable: the object to encode
+        :param previous: the previous encoding of the object
+        :param path: the path of the encoding from the root of the encoding
+        :param changes: the list to which changes are added
+        :return: the encoding of the object, which shares unchanged values with the previous encoding
+        """
+        if not isinstance(previous, dict) or not isinstance(serializable, self._get_serializable_cls()):
+            encoded = self.default(serializable)
+            diff_encodings(previous, encoded, path, changes)
+            return encoded
+
+        serializer = self._create_serializer()
+        mappings = [mapping for mapping in serializer._property_mappings
+                    if mapping.object_property_getter is not None and mapping.serialized_property_setter is not None]
+        if not getattr(type(self), "_MAPPING_ONLY_DEFAULT", type(self).default is MappingJSONEncoder.default) \
+                or any(mapping.relative_serialized_property_setter
+                       is not getattr(mapping, "_generated_json_property_setter", None) for mapping in mappings):
+            # Where each property is encoded is not known
+            encoded = self.default(serializable)
+            diff_encodings(previous, encoded, path, changes)
+            return encoded
+
+        encoded = {}
+        parent_paths = set()
+        for mapping in mappings:
+            value = mapping.object_property_getter(serializable)
+            if mapping.optional and value is None:
+                continue
+
+            container, previous_container, added = encoded, previous, False
+            parents = mapping.serialized_property_parents or ()
+            for i, parent in enumerate(parents):
+                parent_paths.add(parents[:i + 1])
+                previous_container = previous_container.get(parent, None) if not added else None
+                if parent not in container:
+                    container[parent] = {}
+                    if not added and not isinstance(previous_container, dict):
+                        changes.append(Change(path + parents[:i + 1], "replace" if previous_container is not None
+                                              else "add", container[parent], previous_container))
+                container = container[parent]
+                added = added or not isinstance(previous_container, dict)
+
+            name = mapping.json_property_name
+            if added or name not in previous_container:
+                container[name] = self._encode_property_value(serializer, mapping, value)
+                if not added:
+                    changes.append(Change(path + parents + (name, ), "add", container[name], None))
+                continue
+
+            previous_value = previous_container[name]
+            property_serializer = serializer._create_serializer_of_type_with_cache(mapping.serializer_cls)
+            property_encoder = getattr(property_serializer, "_encoder", None)
+            if isinstance(property_encoder, MappingJSONEncoder) and isinstance(previous_value, dict) \
+                    and not isinstance(value, list):
+                # Compare the nested object a property at a time
+                container[name] = property_encoder._encode_changes(
+                    value, previous_value, path + parents + (name, ), changes)
+            else:
+                encoded_value = self._encode_property_value(serializer, mapping, value)
+                if json_equal(previous_value, encoded_value):
+                    container[name] = previous_value
+                else:
+                    container[name] = encoded_value
+                    changes.append(Change(path + parents + (name, ), "replace", encoded_value, previous_value))
+
+        self._add_removals(previous, encoded, (), parent_paths, path, changes)
+        return encoded
+
+    def _add_removals(self, previous: Dict, encoded: Dict, parents: Tuple[str, ...],
+                      parent_paths: Iterable[Tuple[str, ...]], path: Tuple[str, ...], changes: List[Change]):
+        """
+        Adds the removal of the properties of the given previous encoding that are not in the given encoding to the
+        given list of changes, including those of the parents of properties that are in both encodings.
+        :param previous: the previous encoding, or a parent of properties in it
+        :param encoded: the encoding, or the corresponding parent of properties in it
+        :param parents: the names of the parents, from the root of the encoding of the object
+        :param parent_paths: the names of all the parents of properties, from the root of the encoding of the object
+        :param path: the path of the encoding of the object from the root of the encoding
+        :param changes: the list to which changes are added
+        """
+        for key, previous_value in previous.items():
+            if key not in encoded:
+                changes.append(Change(path + parents + (key, ), "remove", None, previous_value))
+            elif parents + (key, ) in parent_paths and isinstance(previous_value, dict):
+                self._add_removals(previous_value, encoded[key], parents + (key, ), parent_paths, path, changes)
+
+    def _encode_property_value(self, serializer: JsonObjectSerializer, mapping: PropertyMapping, value: Any) \
+            -> PrimitiveJsonType:
+        """
+        Encodes the given value of the property of the given mapping, in the same way as the given serializer.
+        :param serializer: the serializer
+        :param mapping: the mapping of the property
+        :param value: the value to encode
+        :return: the encoded value
+        """
+        collection_type = type(mapping.collection_factory([]))
+        is_collection = isinstance(value, collection_type)
+        if is_collection:
+            value = list(mapping.collection_iter(value))
+        property_serializer = serializer._create_serializer_of_type_with_cache(mapping.serializer_cls)
+        encoded = property_serializer.serialize_many([value])[0]
+        sort_key = serializer._get_unordered_collection_sort_key()
+        if is_collection and sort_key is not None and issubclass(collection_type, Set):
+            encoded = sorted(encoded, key=sort_key)
+        return encoded
+
+    def encode(self, obj: Any) -> str:
+        return super().encode(self._encode_collection(obj))
+
+    def iterencode(self, obj: Any, _one_shot: bool=False) -> Iterator[str]:
+        if self._limits is None:
+            return super().iterencode(self._encode_collection(obj), _one_shot)
+        return self._iterencode_with_limits(obj)
+
+    def _iterencode_with_limits(self, obj: Any) -> Iterator[str]:
+        """
+        Encodes the given object as chunks of JSON, tracking all of the objects encoded (including by `default`) against
+        this encoder's limits. Each chunk is yielded once it has been counted towards the size of the JSON, so that
+        encoding is aborted as soon as the JSON exceeds its maximum size.
+        :param obj: the object to encode
+        :return: the chunks of JSON
+        :raises SerializationLimitExceededError: raised if a limit is exceeded
+        """
+        with _tracking_limits(self._limits):
+            encoded = self._encode_collection(obj)
+            size = 0
+            for chunk in super().iterencode(encoded):
+                size += len(chunk.encode("utf-8"))
+                if self._limits.max_bytes is not None and size > self._limits.max_bytes:
+                    raise SerializationLimitExceededError("max_bytes", self._limits.max_bytes)
+                yield chunk
+
+    def _encode_collection(self, obj: Any) -> Any:
+        """
+        Encodes the given object in one go if it is a list of objects that this encoder serializes, opposed to the
+        in-built JSON library calling `default` for each item. Objects that this encoder serializes that are tuples
+        (e.g. `NamedTuple`s) are also encoded, as the in-built JSON library would otherwise encode them as arrays.
+        :param obj: the object being encoded
+        :return: the encoded object or list if it could be encoded in one go, else the given object
+        """
+        if isinstance(obj, tuple) and isinstance(obj, self._get_serializable_cls()):
+            return self.default(obj)
+        elif isinstance(obj, list):
+            _check_collection_length(obj, self._limits)
+            # Not done if `default` has been overridden in a way that may not be equivalent to `default_many`
+            batchable = getattr(type(self), "_MAPPING_ONLY_DEFAULT", type(self).default is MappingJSONEncoder.default)
+            if batchable and len(obj) > 0:
+                serializable_cls = self._get_serializable_cls()
+                if all(isinstance(item, serializable_cls) for item in obj):
+                    return self._encode_list(obj)
+            if self._columnar:
+                return _rows_to_columns([self.default(item) for item in obj])
+        return obj
+
+    def _encode_list(self, serializables: List[SerializableType]) -> PrimitiveJsonType:
+        """
+        Encodes the given list of objects.
+        :param serializables: the objects to encode
+        :return: the encoded list of objects, or the columnar representation of the objects if columnar encoding is on
+        """
+        _check_collection_length(serializables, self._limits)
+        encoded = self.default_many(serializables)
+        return _rows_to_columns(encoded) if self._columnar else encoded
+
+    def _get_encoded_object_cache(self) -> Optional[EncodedObjectCache]:
+        """
+        Gets the cache of the encodings of objects that this encoder uses. Not used when encoding sparse fieldsets.
+        :return: the cache else `None` if encodings are not cached
+        """
+        return None
+
     def _create_serializer(self) -> JsonObjectSerializer:
         """
         Create serializer that is to be used by this encoder
         :return: the serializer
         """
         if self._serializer_cache is None:
-            serializer_cls = type(
-                "%sInternalSerializer" % type(self),
-                (JsonObjectSerializer,),
-                {
-                    "_JSON_ENCODER_ARGS": self._args,
-                    "_JSON_ENCODER_KWARGS": self._kwargs
-                }
-            )
-            self._serializer_cache = serializer_cls(self._get_property_mappings())
+            attributes = {
+                "_JSON_ENCODER_ARGS": self._args,
+                "_JSON_ENCODER_KWARGS": self._kwargs
+            }
+            if self._field_mask is None:
+                # Encodings of sparse fieldsets differ so are not cached
+                attributes["_ENCODED_OBJECT_CACHE"] = self._get_encoded_object_cache()
+            if self.sort_keys:
+                # Encoded deterministically
+                attributes["_UNORDERED_COLLECTION_SORT_KEY"] = staticmethod(_canonical_json)
+            if self._limits is not None:
+                attributes["_LIMITS"] = self._limits
+            serializer_cls = type("%sInternalSerializer" % type(self), (JsonObjectSerializer,), attributes)
+            property_mappings = self._get_property_mappings()
+            if self._field_mask is not None:
+                property_mappings = _project_property_mappings(property_mappings, self._field_mask)
+            self._serializer_cache = serializer_cls(property_mappings)
         return self._serializer_cache
 
 
@@ -79,6 +664,8 @@ class MappingJSONDecoder(ParsedJSONDecoder, PropertyMapper, metaclass=ABCMeta):
     As `json.dumps` requires a type rather than an instance and there is no control given over the instatiation, the
     decoded class and the mappings between the object properties and the json properties cannot be passed through the
     constructor. Instead this class must be subclassed and the subclass must define the relevant constants.
+
+    Lists of objects encoded in columns (see `MappingJSONEncoder`) can be decoded by giving `columnar=True`.
     """
     @abstractmethod
     def _get_deserializable_cls(self) -> type:
@@ -87,33 +674,204 @@ class MappingJSONDecoder(ParsedJSONDecoder, PropertyMapper, metaclass=ABCMeta):
         :return: the class the decoder will deserialize
         """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, columnar: bool=False, intern_keys: bool=False, limits: SerializationLimits=None,
+                 **kwargs):
+        """
+        Constructor.
+        :param columnar: whether the columnar representation of a list of objects (see `MappingJSONEncoder`) should be
+        decoded as a list of objects. Other JSON (e.g. a single object) is decoded as it would be otherwise
+        :param intern_keys: whether the keys of the JSON objects parsed by this decoder are interned (see `sys.intern`),
+        so that the keys of all decoded JSON objects (e.g. in properties decoded as dictionaries) share one instance of
+        each string
+        :param limits: limits on the decoding of JSON, where `max_bytes` limits the size of the UTF-8 encoding of the
+        JSON given to `decode` (checked before it is parsed)
+        """
+        if intern_keys:
+            # Given to the decoders of properties, which may parse JSON
+            kwargs = dict(kwargs, object_pairs_hook=_create_interning_object_pairs_hook(
+                kwargs.get("object_pairs_hook"), kwargs.get("object_hook")))
         super().__init__(*args, **kwargs)
         self._args = args
         self._kwargs = kwargs
+        self._columnar = columnar
+        self._limits = limits
         self._deserializer_cache = None
 
     def decode(self, json_as_string: str, **kwargs) -> SerializableType:
-        json_as_dict = super().decode(json_as_string)
-        return self.decode_parsed(json_as_dict)
+        return self.decode_parsed(self._parse(json_as_string))
 
     def decode_parsed(self, parsed_json: PrimitiveJsonType) -> SerializableType:
         deserializer = self._create_deserializer()
+        if self._columnar and _is_columnar(parsed_json):
+            parsed_json = _columns_to_rows(parsed_json)
         return deserializer.deserialize(parsed_json)
 
+    def decode_parsed_many(self, parsed_jsons: Iterable[PrimitiveJsonType]) -> List[SerializableType]:
+        if type(self).decode_parsed is not MappingJSONDecoder.decode_parsed:
+            # Using the deserializer may not be equivalent to the overridden `decode_parsed`
+            return [self.decode_parsed(parsed_json) for parsed_json in parsed_jsons]
+        deserializer = self._create_deserializer()
+        return deserializer.deserialize_many(parsed_jsons)
+
+    def decode_into(self, deserializable: SerializableType, json_as_string: str) -> SerializableType:
+        """
+        Decodes the given JSON into the given existing object (see `decode_parsed_into`).
+        :param deserializable: the object to update
+        :param json_as_string: the JSON
+        :return: the updated object
+        """
+        return self.decode_parsed_into(deserializable, self._parse(json_as_string))
+
+    def decode_parsed_into(self, deserializable: SerializableType, parsed_json: Dict[str, PrimitiveJsonType]) \
+            -> SerializableType:
+        """
+        Decodes the given JSON object into the given existing object, with the semantics of a JSON Merge Patch (RFC
+        7396), rather than creating a new object.
+
+        Only the properties that are in the JSON object are set, where `null` sets a property to `None` (including the
+        properties nested in a parent JSON property that is `null`). A JSON object is decoded into the existing nested
+        object of a property, if there is one and it is decoded by a `MappingJSONDecoder`. Properties with a custom JSON
+        property getter are set unless the getter raises a `KeyError`, or returns `None` for an optional property.
+
+        All values are decoded before any property is set, so the object is left unchanged if decoding fails.
+        :param deserializable: the object to update
+        :param parsed_json: the JSON object
+        :return: the updated object
+        :raises TypeError: raised if the object is not of the type that this decoder decodes, or if the JSON is not a
+        JSON object
+        :raises ValueError: raised if the JSON object contains a property that can only be set via the constructor
+        """
+        for update in self._decode_updates(deserializable, parsed_json):
+            update()
+        return deserializable
+
+    def _decode_updates(self, deserializable: SerializableType, parsed_json: Dict[str, PrimitiveJsonType]) \
+            -> List[Callable[[], None]]:
+        """
+        Decodes the given JSON object into the updates that `decode_parsed_into` makes to the given existing object,
+        without making them.
+        :param deserializable: the object to update
+        :param parsed_json: the JSON object
+        :return: the updates to make, in order
+        :raises TypeError: raised if the object is not of the type that this decoder decodes, or if the JSON is not a
+        JSON object
+        :raises ValueError: raised if the JSON object contains a property that can only be set via the constructor
+        """
+        if not isinstance(deserializable, self._get_deserializable_cls()):
+            raise TypeError("Object of type \"%s\" cannot be updated by this decoder: %s"
+                            % (type(deserializable).__name__, deserializable))
+        if not isinstance(parsed_json, dict):
+            raise TypeError("Only a JSON object can be decoded into an existing object: %s" % (parsed_json, ))
+        deserializer = self._create_deserializer()
+        updates = []    # type: List[Callable[[], None]]
+        for mapping in self._get_property_mappings():
+            if mapping.serialized_property_getter is None:
+                continue
+            setter = mapping.object_property_setter
+            modifier = None
+            if setter is None:
+                object_property_name = getattr(mapping, "object_property_name", None)
+                if mapping.object_constructor_parameter_name is None:
+                    continue
+                elif object_property_name is not None:
+                    modifier = mapping.object_constructor_argument_modifier
+                    setter = lambda obj, value, name=object_property_name: setattr(obj, name, value)
+
+            if mapping.relative_serialized_property_getter is getattr(mapping, "_generated_json_property_getter", None):
+                container = parsed_json
+                for name in (mapping.serialized_property_parents or ()) + (mapping.json_property_name, ):
+                    if container is None:
+                        # Parent removed so its properties are removed
+                        break
+                    elif name not in container:
+                        container = _MISSING
+                        break
+                    container = container[name]
+                if container is _MISSING:
+                    continue
+                value = container
+            else:
+                try:
+                    value = mapping.serialized_property_getter(parsed_json)
+                except KeyError:
+                    continue
+                if value is None and mapping.optional:
+                    continue
+
+            if setter is None:
+                raise ValueError("Property can only be set by the constructor so cannot be updated: %s" % mapping)
+            property_decoder = getattr(
+                deserializer._create_deserializer_of_type_with_cache(mapping.deserializer_cls), "_decoder", None)
+            if isinstance(value, dict) and isinstance(property_decoder, MappingJSONDecoder) \
+                    and mapping.object_property_getter is not None:
+                existing_value = mapping.object_property_getter(deserializable)
+                if isinstance(existing_value, property_decoder._get_deserializable_cls()):
+                    # Update the existing nested object in place
+                    updates.extend(property_decoder._decode_updates(existing_value, value))
+                    continue
+            value = deserializer._deserialize_property_value(mapping, value)
+            if modifier is not None:
+                value = modifier(value)
+            updates.append(partial(setter, deserializable, value))
+        return updates
+
+    def _parse(self, json_as_string: str) -> PrimitiveJsonType:
+        """
+        Parses the given JSON, keeping the text of the JSON properties that are decoded as raw JSON (unless the JSON is
+        decoded with limits, which raw JSON would otherwise escape).
+        :param json_as_string: the JSON
+        :return: the parsed JSON
+        """
+        _check_json_size(json_as_string, self._limits)
+        raw_json_paths = _RAW_JSON_PATHS.get(type(self))
+        if raw_json_paths is None:
+            raw_json_paths = _RAW_JSON_PATHS[type(self)] = _find_raw_json_paths(type(self))
+        if len(raw_json_paths) == 0 or self._limits is not None:
+            return super().decode(json_as_string)
+        return _decode_with_raw_json(self, json_as_string, raw_json_paths)
+
+    def _get_deserializable_factory(self) -> Optional[Callable[[List[Dict[str, Any]]], List[SerializableType]]]:
+        """
+        Gets the function that creates deserialized objects, given the constructor arguments of each object, to be used
+        in place of the deserializable class's constructor.
+        :return: the function else `None` if the constructor is to be used
+        """
+        return None
+
+    def _is_trusted(self) -> bool:
+        """
+        Gets whether the JSON decoded by this decoder is trusted to be valid, in which case the deserializer skips
+        defensive checks.
+        :return: whether the JSON is trusted
+        """
+        return False
+
+    def _get_deserialization_property_mappings(self) -> List[PropertyMapping]:
+        """
+        Gets the property mappings that are to be used to deserialize objects, if different to those got by
+        `_get_property_mappings` (e.g. if the objects' constructor is bypassed).
+        :return: the property mappings to use in the order in which they should be applied
+        """
+        return self._get_property_mappings()
+
     def _create_deserializer(self) -> JsonObjectDeserializer:
         """
         Creates a deserializer that is to be used by this decoder.
         :return: the deserializer
         """
         if self._deserializer_cache is None:
-            deserializer_cls = type(
-                "%sInternalDeserializer" % type(self),
-                (JsonObjectDeserializer,),
-                {
-                    "_JSON_ENCODER_ARGS": self._args,
-                    "_JSON_ENCODER_KWARGS": self._kwargs
-                }
-            )
-            self._deserializer_cache = deserializer_cls(self._get_property_mappings(), self._get_deserializable_cls())
+            attributes = {
+                "_JSON_ENCODER_ARGS": self._args,
+                "_JSON_ENCODER_KWARGS": self._kwargs
+            }
+            deserializable_factory = self._get_deserializable_factory()
+            if deserializable_factory is not None:
+                attributes["_DESERIALIZABLE_FACTORY"] = staticmethod(deserializable_factory)
+            if self._limits is not None:
+                attributes["_LIMITS"] = self._limits
+            if self._is_trusted():
+                attributes["_TRUSTED"] = True
+            deserializer_cls = type("%sInternalDeserializer" % type(self), (JsonObjectDeserializer,), attributes)
+            self._deserializer_cache = deserializer_cls(
+                self._get_deserialization_property_mappings(), self._get_deserializable_cls())
         return self._deserializer_cache
@@ -1,6 +1,11 @@
-from typing import Dict
+from typing import Dict, List, Any, Callable, Optional, Generator
 
-from hgijson.serialization import Serializer, Deserializer
+from hgijson.custom_types import SerializableType, PrimitiveJsonType
+from hgijson.json_converters.caching import MISSING, EncodedObjectCache
+from hgijson.serialization import Serializer, Deserializer, SerializationLimits
+
+# Marks the cache keys of encodings in which unordered collections are sorted
+_SORTED = object()
 
 
 class JsonObjectSerializer(Serializer):
@@ -9,10 +14,41 @@ class JsonObjectSerializer(Serializer):
     """
     _JSON_ENCODER_ARGS = []
     _JSON_ENCODER_KWARGS = {}
+    # Cache of the serializations of objects, if set
+    _ENCODED_OBJECT_CACHE = None     # type: Optional[EncodedObjectCache]
+    # Key by which the serialized items of unordered collections are sorted, if set
+    _UNORDERED_COLLECTION_SORT_KEY = None     # type: Optional[Callable[[PrimitiveJsonType], Any]]
+    # Limits on the work done by the serializer, if set
+    _LIMITS = None     # type: Optional[SerializationLimits]
 
     def _create_serializer_of_type(self, serializer_type: type) -> Serializer:
         return serializer_type(*self._JSON_ENCODER_ARGS, **self._JSON_ENCODER_KWARGS)
 
+    def _serialize_objects(self, serializables: List[SerializableType]) -> Generator:
+        cache = self._ENCODED_OBJECT_CACHE
+        if cache is None:
+            serialized = yield from super()._serialize_objects(serializables)
+            return serialized
+
+        keys = [cache.key(serializable) for serializable in serializables]
+        if self._UNORDERED_COLLECTION_SORT_KEY is not None:
+            # Encodings with sorted collections are stored separately to those without, under the same cache
+            keys = [(_SORTED, key) for key in keys]
+        serialized = [cache.get(key) for key in keys]
+        missing = [i for i, value in enumerate(serialized) if value is MISSING]
+        if len(missing) > 0:
+            serialized_missing = yield from super()._serialize_objects([serializables[i] for i in missing])
+            for i, value in zip(missing, serialized_missing):
+                serialized[i] = value
+                cache.put(keys[i], value)
+        return serialized
+
+    def _get_unordered_collection_sort_key(self) -> Optional[Callable[[PrimitiveJsonType], Any]]:
+        return self._UNORDERED_COLLECTION_SORT_KEY
+
+    def _get_limits(self) -> Optional[SerializationLimits]:
+        return self._LIMITS
+
     def _create_serialized_container(self) -> Dict:
         return {}
 
@@ -23,6 +59,23 @@ class JsonObjectDeserializer(Deserializer):
     """
     _JSON_ENCODER_ARGS = []
     _JSON_ENCODER_KWARGS = {}
+    # Creates the deserialized objects in place of the constructor, if set
+    _DESERIALIZABLE_FACTORY = None     # type: Optional[Callable[[List[Dict[str, Any]]], List[SerializableType]]]
+    # Limits on the work done by the deserializer, if set
+    _LIMITS = None     # type: Optional[SerializationLimits]
+    # Whether the input is trusted to be valid
+    _TRUSTED = False
 
     def _create_deserializer_of_type(self, deserializer_type: type) -> Deserializer:
         return deserializer_type(*self._JSON_ENCODER_ARGS, **self._JSON_ENCODER_KWARGS)
+
+    def _get_limits(self) -> Optional[SerializationLimits]:
+        return self._LIMITS
+
+    def _is_trusted(self) -> bool:
+        return self._TRUSTED
+
+    def _create_deserializables(self, init_kwargs: List[Dict[str, Any]]) -> List[SerializableType]:
+        if self._DESERIALIZABLE_FACTORY is not None:
+            return self._DESERIALIZABLE_FACTORY(init_kwargs)
+        return super()._create_deserializables(init_kwargs)
@@ -1,12 +1,20 @@
 import copy
 from abc import ABCMeta, abstractstaticmethod
+from functools import lru_cache
 from json import JSONEncoder
-from typing import Dict, Optional, Iterable, Any, TypeVar
+from types import MappingProxyType
+from typing import Dict, Optional, Iterable, Any, TypeVar, Mapping, Callable, Hashable, List, Union
 
-from hgijson.custom_types import PrimitiveJsonType
+from hgijson.custom_types import PrimitiveJsonType, SerializableType
+from hgijson.json_converters.interfaces import ParsedJSONDecoder
+from hgijson.json_converters.raw import RawJSONEmbeddingEncoder
 
+# Maximum number of types for which the resolved JSON encoder is cached, beyond which the least recently used are
+# evicted
+_MAX_RESOLVED_JSON_ENCODERS = 256
 
-class _RegisteredTypeJSONEncoder(JSONEncoder, metaclass=ABCMeta):
+
+class _RegisteredTypeJSONEncoder(RawJSONEmbeddingEncoder, metaclass=ABCMeta):
     """
     JSON encoder that will encode objects using the registered encoders. Works with in-built JSON library:
     ```
@@ -28,6 +36,7 @@ class _RegisteredTypeJSONEncoder(JSONEncoder, metaclass=ABCMeta):
         super().__init__(*args, **kwargs)
         self._args = args
         self._kwargs = kwargs
+        # Not shared between instances, as encoders have state (e.g. the raw JSON that they have embedded)
         self._encoder_cache = dict()    # type: Dict[type, JSONEncoder]
 
     def default(self, to_encode: Any) -> PrimitiveJsonType:
@@ -35,20 +44,65 @@ class _RegisteredTypeJSONEncoder(JSONEncoder, metaclass=ABCMeta):
 
         encoder_type = self._get_json_encoders_for_type(type_to_encode)
         if encoder_type is None:
-            # Unknown type: let standard JSON parser deal with it (will almost certainly raise an exception)
-            encoder_type = JSONEncoder
+            # Unknown type: embedded if raw JSON, else let standard JSON parser deal with it (will almost certainly
+            # raise an exception)
+            return super().default(to_encode)
         assert isinstance(encoder_type, type)
 
-        if encoder_type not in self._encoder_cache:
+        encoder = self._encoder_cache.get(encoder_type)
+        if encoder is None:
             encoder = encoder_type(*self._args, **self._kwargs)
             self._encoder_cache[encoder_type] = encoder
-
-        encoder = self._encoder_cache[encoder_type]
         assert isinstance(encoder, JSONEncoder)
 
         return encoder.default(to_encode)
 
 
+def _resolve_json_encoder(json_encoders: Mapping[type, type], type_to_encode: type) -> Optional[type]:
+    """
+    Resolves the JSON encoder for the given type from the given registered encoders. If there is not an encoder
+    registered for the type itself, the encoder registered for the closest type in the type's method resolution order
+    is used, else that registered for the closest abstract base class that the type is a (virtual) subclass of.
+
+    An abstract base class is closer the earlier in the type's method resolution order that the type stops being a
+    subclass of it, where the most derived of equally close abstract base classes is closest (then the first
+    registered).
+    :param json_encoders: registered encoders, indexed by the type of object they encode
+    :param type_to_encode: the type of object that is to be encoded
+    :return: the encoder for the given object else `None` if unknown
+    """
+    mro = getattr(type_to_encode, "__mro__", (type_to_encode, ))
+    for superclass in mro:
+        if superclass in json_encoders:
+            return json_encoders[superclass]
+
+    closest_type, closest_distance = None, None
+    for registered_type in json_encoders:
+        if not isinstance(registered_type, ABCMeta) or not issubclass(type_to_encode, registered_type):
+            continue
+        # Index of the last class in the method resolution order that is a subclass (i.e. where it was introduced)
+        distance = max(i for i, superclass in enumerate(mro) if issubclass(superclass, registered_type))
+        if closest_type is None or distance < closest_distance \
+                or (distance == closest_distance and issubclass(registered_type, closest_type)):
+            closest_type, closest_distance = registered_type, distance
+
+    return json_encoders[closest_type] if closest_type is not None else None
+
+
+def _create_json_encoder_dispatcher(json_encoders: Mapping[type, type]) -> Callable[[type], Optional[type]]:
+    """
+    Creates a function that gets the JSON encoder for a given type from the given registered encoders, caching the
+    encoder resolved for the most recently used types (see `_MAX_RESOLVED_JSON_ENCODERS`).
+    :param json_encoders: registered encoders, indexed by the type of object they encode (not to be changed)
+    :return: the dispatch function
+    """
+    @lru_cache(maxsize=_MAX_RESOLVED_JSON_ENCODERS)
+    def get_json_encoders_for_type(type_to_encode: type) -> Optional[type]:
+        return _resolve_json_encoder(json_encoders, type_to_encode)
+
+    return get_json_encoders_for_type
+
+
 RegisteredTypeJSONEncoderType = TypeVar("RegisteredTypeJSONEncoder", bound=_RegisteredTypeJSONEncoder)
 
 
@@ -78,26 +132,31 @@ class AutomaticJSONEncoderClassBuilder:
         Constructor.
         """
         self._json_encoders = dict()    # type: Dict[type, type]
+        # Gets the encoder for a type, caching those resolved for the types most recently seen (replaced on change)
+        self._get_json_encoders_for_type = None     # type: Callable[[type], Optional[type]]
         self.reset_registered_json_encoders()
 
     def get_json_encoders_for_type(self, type_to_encode: type) -> Optional[Iterable[JSONEncoder]]:
         """
-        Gets the registered JSON encoder for the given type.
+        Gets the registered JSON encoder for the given type, or for the closest superclass of the type (see
+        `_resolve_json_encoder`).
+
+        The encoder resolved for a type is cached until the next registration or reset; therefore abstract base class
+        registrations made after a type has been seen are not taken into account until then.
         :param type_to_encode: the type of object that is to be encoded
         :return: the encoder for the given object else `None` if unknown
         """
-        if type_to_encode not in self._json_encoders:
-            return None
-        return self._json_encoders[type_to_encode]
+        return self._get_json_encoders_for_type(type_to_encode)
 
     def register_json_encoder(self, encoder_type: type, encoder: JSONEncoder):
         """
-        Register the given JSON encoder for use with the given object type.
+        Register the given JSON encoder for use with the given object type (and its subclasses).
         :param encoder_type: the type of object to encode
         :param encoder: the JSON encoder
         :return: this builder
         """
         self._json_encoders[encoder_type] = encoder
+        self._get_json_encoders_for_type = _create_json_encoder_dispatcher(self._json_encoders)
         return self
 
     def reset_registered_json_encoders(self):
@@ -105,6 +164,7 @@ class AutomaticJSONEncoderClassBuilder:
         Resets registered JSON encoders so that only ones supported by the in-built library are supported.
         """
         self._json_encoders = copy.copy(AutomaticJSONEncoderClassBuilder._DEFAULT_JSON_ENCODERS)
+        self._get_json_encoders_for_type = _create_json_encoder_dispatcher(self._json_encoders)
 
     def build(self) -> RegisteredTypeJSONEncoderType:
         """
@@ -113,11 +173,169 @@ class AutomaticJSONEncoderClassBuilder:
         """
         class_name = "%s_%s" % (_RegisteredTypeJSONEncoder.__class__.__name__, id(self))
         # Use encoders set at the point in time at which the encoder was built
-        builder_snapshot = copy.deepcopy(self)
+        json_encoders = MappingProxyType(dict(self._json_encoders))
         return type(
                 class_name,
                 (_RegisteredTypeJSONEncoder, ),
                 {
-                    "_get_json_encoders_for_type": builder_snapshot.get_json_encoders_for_type
+                    "_get_json_encoders_for_type": staticmethod(_create_json_encoder_dispatcher(json_encoders))
+                }
+        )
+
+
+class _RegisteredTypeJSONDecoder(ParsedJSONDecoder, metaclass=ABCMeta):
+    """
+    JSON decoder that will decode JSON objects using the decoder registered for the object's discriminator (e.g. the
+    value of its "type" property). Works with in-built JSON library:
+    ```
+    import json
+
+    json.loads(json_as_string, cls=_RegisteredTypeJSONDecoder)
+    ```
+    """
+    @abstractstaticmethod
+    def _get_discriminator(parsed_json: Dict[str, PrimitiveJsonType]) -> Hashable:
+        """
+        Gets the discriminator of the given JSON object.
+        :param parsed_json: the JSON object
+        :return: the discriminator of the object
+        """
+
+    @abstractstaticmethod
+    def _get_json_decoder_for_discriminator(discriminator: Hashable) -> Optional[type]:
+        """
+        Gets the JSON decoder registered for the given discriminator.
+        :param discriminator: the discriminator
+        :return: the decoder for the discriminator else `None` if unknown
+        """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._args = args
+        self._kwargs = kwargs
+        self._decoder_cache = dict()    # type: Dict[type, ParsedJSONDecoder]
+
+    def decode(self, json_as_string: str, **kwargs) -> SerializableType:
+        return self.decode_parsed(super().decode(json_as_string))
+
+    def decode_parsed(self, parsed_json: PrimitiveJsonType) -> SerializableType:
+        if isinstance(parsed_json, list):
+            return self.decode_parsed_many(parsed_json)
+        elif not isinstance(parsed_json, dict):
+            return parsed_json
+        return self._get_json_decoder(parsed_json).decode_parsed(parsed_json)
+
+    def decode_parsed_many(self, parsed_jsons: Iterable[PrimitiveJsonType]) -> List[SerializableType]:
+        parsed_jsons = list(parsed_jsons)
+        decoded = [None] * len(parsed_jsons)    # type: List[SerializableType]
+
+        # JSON objects with the same decoder are decoded together
+        groups = dict()     # type: Dict[ParsedJSONDecoder, List[int]]
+        for i, parsed_json in enumerate(parsed_jsons):
+            if isinstance(parsed_json, dict):
+                groups.setdefault(self._get_json_decoder(parsed_json), []).append(i)
+            else:
+                decoded[i] = self.decode_parsed(parsed_json)
+
+        for decoder, indices in groups.items():
+            for i, decoded_object in zip(indices, decoder.decode_parsed_many([parsed_jsons[i] for i in indices])):
+                decoded[i] = decoded_object
+        return decoded
+
+    def _get_json_decoder(self, parsed_json: Dict[str, PrimitiveJsonType]) -> ParsedJSONDecoder:
+        """
+        Gets the JSON decoder for the given JSON object.
+        :param parsed_json: the JSON object
+        :return: the decoder
+        :raises ValueError: raised if there is not a decoder registered for the object's discriminator
+        """
+        discriminator = self._get_discriminator(parsed_json)
+        decoder_type = self._get_json_decoder_for_discriminator(discriminator)
+        if decoder_type is None:
+            raise ValueError("No JSON decoder registered for discriminator %r of JSON object: %s"
+                             % (discriminator, parsed_json))
+
+        decoder = self._decoder_cache.get(decoder_type)
+        if decoder is None:
+            decoder = decoder_type(*self._args, **self._kwargs)
+            self._decoder_cache[decoder_type] = decoder
+        return decoder
+
+
+RegisteredTypeJSONDecoderType = TypeVar("RegisteredTypeJSONDecoder", bound=_RegisteredTypeJSONDecoder)
+
+
+def _get_property_names(parsed_json: Dict[str, PrimitiveJsonType]) -> Hashable:
+    """
+    Gets the names of the properties of the given JSON object, for use as its discriminator.
+    :param parsed_json: the JSON object
+    :return: the names of the object's properties
+    """
+    return frozenset(parsed_json.keys())
+
+
+class AutomaticJSONDecoderClassBuilder:
+    """
+    Builder for `JSONDecoder` class that is able to use a number of given `ParsedJSONDecoder`s (e.g.
+    `MappingJSONDecoder` subclasses) to automatically deserialize JSON that may contain JSON objects of many different
+    types, where the decoder for each JSON object is chosen using a discriminator of the object.
+    """
+    def __init__(self, discriminator: Union[str, Callable[[Dict[str, PrimitiveJsonType]], Hashable]]=None):
+        """
+        Constructor.
+        :param discriminator: the name of the JSON property that discriminates between types of JSON object (e.g.
+        "type"), or a function that gets the discriminator of a given JSON object. If `None`, JSON objects are
+        discriminated by the `frozenset` of their property names
+        """
+        if discriminator is None:
+            self._get_discriminator = _get_property_names
+        elif isinstance(discriminator, str):
+            property_name = discriminator
+            self._get_discriminator = lambda parsed_json: parsed_json.get(property_name)
+        else:
+            self._get_discriminator = discriminator
+        self._json_decoders = dict()    # type: Dict[Hashable, type]
+
+    def get_json_decoder_for_discriminator(self, discriminator: Hashable) -> Optional[type]:
+        """
+        Gets the registered JSON decoder for the given discriminator.
+        :param discriminator: the discriminator of the JSON objects that are to be decoded
+        :return: the decoder for the discriminator else `None` if unknown
+        """
+        return self._json_decoders.get(discriminator)
+
+    def register_json_decoder(self, discriminator: Hashable, decoder: type):
+        """
+        Register the given JSON decoder for use with JSON objects with the given discriminator.
+        :param discriminator: the discriminator of the JSON objects to decode (e.g. the value of the objects' "type"
+        property, or the `frozenset` of the objects' property names if discriminating by property names)
+        :param decoder: the JSON decoder, which must be a `ParsedJSONDecoder`
+        :return: this builder
+        """
+        if not issubclass(decoder, ParsedJSONDecoder):
+            raise TypeError("JSON decoder must be a subclass of `%s`: %s" % (ParsedJSONDecoder.__name__, decoder))
+        self._json_decoders[discriminator] = decoder
+        return self
+
+    def reset_registered_json_decoders(self):
+        """
+        Resets registered JSON decoders.
+        """
+        self._json_decoders = dict()
+
+    def build(self) -> RegisteredTypeJSONDecoderType:
+        """
+        Builds JSON decoder that uses the decoders registered at the point in time when this method is called.
+        :return: the JSON decoder
+        """
+        class_name = "%s_%s" % (_RegisteredTypeJSONDecoder.__name__, id(self))
+        # Use decoders set at the point in time at which the decoder was built
+        json_decoders = MappingProxyType(dict(self._json_decoders))
+        return type(
+                class_name,
+                (_RegisteredTypeJSONDecoder, ),
+                {
+                    "_get_discriminator": staticmethod(self._get_discriminator),
+                    "_get_json_decoder_for_discriminator": staticmethod(json_decoders.get)
                 }
         )
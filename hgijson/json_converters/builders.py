@@ -1,8 +1,13 @@
+import copy
 from abc import ABCMeta
-from typing import Iterable, Tuple, List
+from json import JSONDecoder
+from operator import itemgetter
+from typing import Iterable, Tuple, List, Optional, Callable, Any, Dict
 
 from hgijson.json_converters._serialization import MappingJSONEncoder, MappingJSONDecoder, PropertyMapper
+from hgijson.json_converters.caching import EncodedObjectCache
 from hgijson.json_converters.models import JsonPropertyMapping
+from hgijson.serializers import PrimitiveDeserializer
 
 
 class _JSONSerializationClassBuilder(metaclass=ABCMeta):
@@ -48,13 +53,202 @@ def _get_all_property_mappings(encoder: MappingJSONEncoder, property_mappings: I
     return mappings
 
 
+def _create_object_property_setter(target_cls: type, object_property_name: str) -> Optional[Callable[[Any, Any], None]]:
+    """
+    Creates a setter of the given property of objects of the given class, which does not check that the objects have
+    the property before it is set.
+    :param target_cls: the class of the objects
+    :param object_property_name: the name of the property
+    :return: the setter else `None` if it cannot be known from the class that its objects have the property
+    :raises AttributeError: raised if objects of the class cannot have the property
+    """
+    if getattr(target_cls, "__setattr__", object.__setattr__) is not object.__setattr__:
+        # Setting of attributes has been customised
+        return None
+
+    for cls in getattr(target_cls, "__mro__", ()):
+        if object_property_name in cls.__dict__:
+            attribute = cls.__dict__[object_property_name]
+            if hasattr(type(attribute), "__set__"):
+                # Data descriptor (e.g. a slot or property) takes precedence over the object's `__dict__`
+                return attribute.__set__
+            elif getattr(target_cls, "__dictoffset__", 0) != 0:
+                # Class attribute so property always exists but will be set in the object's `__dict__`
+                return lambda obj, value: setattr(obj, object_property_name, value)
+            break
+
+    if getattr(target_cls, "__dictoffset__", 0) == 0:
+        raise AttributeError("Objects of type \"%s\" cannot have the attribute \"%s\" (`__slots__` does not include it)"
+                             % (target_cls.__name__, object_property_name))
+    return None
+
+
+def _create_trusted_json_property_getter(json_property_name: str, optional: bool) -> Callable[[Dict], Any]:
+    """
+    Creates a getter of the given JSON property that does not check that JSON objects have the property before it is
+    got, raising a plain `KeyError` if a non-optional property is missing.
+    :param json_property_name: the name of the JSON property
+    :param optional: whether the property is optional, in which case `None` is got if it is missing
+    :return: the getter
+    """
+    if optional:
+        return lambda obj_as_json: obj_as_json.get(json_property_name)
+    return itemgetter(json_property_name)
+
+
+def _create_trusted_object_property_setter(object_property_name: str) -> Callable[[Any, Any], None]:
+    """
+    Creates a setter of the given object property that does not check that objects have the property before it is set.
+    :param object_property_name: the name of the property
+    :return: the setter
+    """
+    return lambda obj, value: setattr(obj, object_property_name, value)
+
+
+def _compile_property_mappings(target_cls: type, property_mappings: Iterable[JsonPropertyMapping],
+                               trusted: bool=False) -> List[JsonPropertyMapping]:
+    """
+    Compiles the given property mappings for use with objects of the given class, replacing generated object property
+    setters with setters specific to the class where possible. Values decoded by the in-built JSON decoder are used as
+    parsed (rather than re-encoded and decoded).
+    :param target_cls: the class of object that the mappings are used with
+    :param property_mappings: the property mappings
+    :param trusted: whether the mappings are only used with valid input, in which case generated JSON property getters
+    and object property setters are also replaced with equivalents that do not check that the properties exist
+    :return: the compiled property mappings (copies of the given mappings are made, where changed)
+    :raises AttributeError: raised if the objects cannot have a property that a mapping sets
+    """
+    compiled = []
+    for mapping in property_mappings:
+        generated_setter = getattr(mapping, "_generated_object_property_setter", None)
+        if generated_setter is not None and mapping.object_property_setter is generated_setter:
+            setter = _create_object_property_setter(target_cls, mapping.object_property_name)
+            if setter is None and trusted:
+                setter = _create_trusted_object_property_setter(mapping.object_property_name)
+            if setter is not None:
+                mapping = copy.copy(mapping)
+                mapping.object_property_setter = setter
+                # Allows the setter to be compiled again for use with objects of a subclass
+                mapping._generated_object_property_setter = setter
+
+        generated_getter = getattr(mapping, "_generated_json_property_getter", None)
+        if trusted and generated_getter is not None and mapping.relative_serialized_property_getter is generated_getter:
+            getter = _create_trusted_json_property_getter(mapping.json_property_name, mapping.optional)
+            mapping = copy.copy(mapping)
+            if mapping.serialized_property_parents is None:
+                mapping.serialized_property_getter = getter
+            # Deserializers get nested properties relative to their (shared) parents
+            mapping.relative_serialized_property_getter = getter
+            mapping._generated_json_property_getter = getter
+
+        if getattr(mapping.deserializer_cls, "_DECODER_CLS", None) is JSONDecoder:
+            # Decoding parsed JSON with the in-built decoder gives an equal value
+            mapping = copy.copy(mapping)
+            mapping.deserializer_cls = PrimitiveDeserializer
+        compiled.append(mapping)
+    return compiled
+
+
+def _create_constructor_bypass(target_cls: type, property_mappings: Iterable[JsonPropertyMapping]) \
+        -> Tuple[List[JsonPropertyMapping], Callable[[List[Dict[str, Any]]], List[Any]]]:
+    """
+    Creates the means of deserializing objects of the given class without calling the class's constructor, where each
+    property is set directly on the object by name.
+    :param target_cls: the class of object that the mappings are used with
+    :param property_mappings: the property mappings
+    :return: tuple where the first element is the property mappings to deserialize with, where all properties are set
+    as if they were constructor parameters named after the property, and the second is the function that creates the
+    objects from such parameters
+    :raises ValueError: raised if the constructor cannot be bypassed for the given class and mappings
+    """
+    if target_cls.__new__ is not object.__new__:
+        raise ValueError("Cannot bypass the constructor of \"%s\" as it defines `__new__`" % target_cls.__name__)
+    # Imported here as only needed when bypassing constructors and slow to import
+    import inspect
+    constructor_parameters = inspect.signature(target_cls).parameters
+
+    bypass_mappings = []
+    defaults = {}   # type: Dict[str, Any]
+    for mapping in property_mappings:
+        object_property_name = getattr(mapping, "object_property_name", None)
+        if mapping.object_constructor_parameter_name is not None:
+            if object_property_name is None:
+                raise ValueError("Cannot bypass the constructor of \"%s\" as the object property set by constructor "
+                                 "parameter \"%s\" is not known"
+                                 % (target_cls.__name__, mapping.object_constructor_parameter_name))
+            parameter = constructor_parameters.get(mapping.object_constructor_parameter_name)
+            default = parameter.default if parameter is not None else inspect.Parameter.empty
+            defaults[object_property_name] = default if default is not inspect.Parameter.empty else None
+        elif mapping.object_property_setter is not None:
+            generated_setter = getattr(mapping, "_generated_object_property_setter", None)
+            if generated_setter is None or mapping.object_property_setter is not generated_setter:
+                raise ValueError("Cannot bypass the constructor of \"%s\" as a mapping sets an object property "
+                                 "using a custom setter" % target_cls.__name__)
+            defaults[object_property_name] = None
+        else:
+            bypass_mappings.append(mapping)
+            continue
+
+        mapping = copy.copy(mapping)
+        if mapping.object_property_setter is not None:
+            mapping.object_property_setter = None
+            mapping.object_constructor_argument_modifier = lambda argument: argument
+        mapping.object_constructor_parameter_name = object_property_name
+        bypass_mappings.append(mapping)
+
+    descriptor_setters = dict()     # type: Dict[str, Callable[[Any, Any], None]]
+    for object_property_name in defaults.keys():
+        for cls in target_cls.__mro__:
+            attribute = cls.__dict__.get(object_property_name)
+            if attribute is not None and hasattr(type(attribute), "__set__"):
+                descriptor_setters[object_property_name] = attribute.__set__
+                break
+    has_dict = getattr(target_cls, "__dictoffset__", 0) != 0
+    if not has_dict and len(descriptor_setters) != len(defaults):
+        raise ValueError("Objects of type \"%s\" cannot have all of the attributes: %s"
+                         % (target_cls.__name__, list(defaults.keys())))
+    new = target_cls.__new__
+
+    if len(descriptor_setters) == 0:
+        def create_objects(properties: List[Dict[str, Any]]) -> List[Any]:
+            created = []
+            for object_properties in properties:
+                obj = new(target_cls)
+                obj_dict = obj.__dict__
+                obj_dict.update(defaults)
+                obj_dict.update(object_properties)
+                created.append(obj)
+            return created
+    else:
+        def create_objects(properties: List[Dict[str, Any]]) -> List[Any]:
+            created = []
+            for object_properties in properties:
+                obj = new(target_cls)
+                for name, value in dict(defaults, **object_properties).items():
+                    setter = descriptor_setters.get(name)
+                    if setter is not None:
+                        setter(obj, value)
+                    else:
+                        obj.__dict__[name] = value
+                created.append(obj)
+            return created
+
+    return bypass_mappings, create_objects
+
+
 class MappingJSONEncoderClassBuilder(_JSONSerializationClassBuilder):
     """
     Builder for `MappingJSONEncoder` concrete subclasses.
     """
     def __init__(self, target_cls: type=type(None), mappings: Iterable[JsonPropertyMapping]=(),
-                 superclasses: Tuple=(MappingJSONEncoder, )):
+                 superclasses: Tuple=(MappingJSONEncoder, ), *, encoded_object_cache: EncodedObjectCache=None):
+        """
+        Constructor.
+        :param encoded_object_cache: cache of the encodings of objects (of the target class), shared by all instances
+        of the built encoder. Only suitable for immutable objects
+        """
         super().__init__(target_cls, mappings, superclasses)
+        self.encoded_object_cache = encoded_object_cache
 
     def build(self) -> type:
         """
@@ -67,18 +261,30 @@ class MappingJSONEncoderClassBuilder(_JSONSerializationClassBuilder):
         def get_serializable_cls(encoder: MappingJSONEncoder) -> type:
             return self.target_cls
 
+        encoded_object_cache = self.encoded_object_cache
+
+        def _get_encoded_object_cache(encoder: MappingJSONEncoder) -> Optional[EncodedObjectCache]:
+            return encoded_object_cache
+
+        # Sort subclasses so subclass' default method is called last
+        superclasses_as_list = list(self.superclasses)
+        superclasses_as_list.sort(key=lambda superclass: 1 if superclass == MappingJSONEncoder else -1)
+
+        # The default methods of superclasses that are `MappingJSONEncoder` or have been built by this builder produce
+        # the same encoding (using all of the property mappings), hence only need be called once
+        mapping_only = all(getattr(superclass, "_MAPPING_ONLY_DEFAULT", superclass == MappingJSONEncoder)
+                           for superclass in superclasses_as_list)
+
         def default(encoder: MappingJSONEncoder, serializable):
             if serializable is None:
                 # Fix for #18
                 return None
-            elif isinstance(serializable, List):
+            elif isinstance(serializable, list):
                 # Fix for #8
-                return [encoder.default(item) for item in serializable]
+                return encoder._encode_list(serializable)
+            elif mapping_only:
+                return MappingJSONEncoder.default(encoder, serializable)
             else:
-                # Sort subclasses so subclass' default method is called last
-                superclasses_as_list = list(self.superclasses)
-                superclasses_as_list.sort(key=lambda superclass: 1 if superclass == MappingJSONEncoder else -1)
-
                 encoded_combined = {}
                 for superclass in superclasses_as_list:
                     encoded = superclass.default(encoder, serializable)
@@ -86,13 +292,22 @@ class MappingJSONEncoderClassBuilder(_JSONSerializationClassBuilder):
 
                 return encoded_combined
 
+        def default_many(encoder: MappingJSONEncoder, serializables):
+            if mapping_only:
+                return MappingJSONEncoder.default_many(encoder, serializables)
+            else:
+                return [default(encoder, serializable) for serializable in serializables]
+
         return type(
             "%sDynamicMappingJSONEncoder" % self.target_cls.__name__,
             self.superclasses,
             {
                 "_get_property_mappings": _get_property_mappings,
                 "_get_serializable_cls": get_serializable_cls,
-                "default": default
+                "_get_encoded_object_cache": _get_encoded_object_cache,
+                "default": default,
+                "default_many": default_many,
+                "_MAPPING_ONLY_DEFAULT": mapping_only
             }
         )
 
@@ -102,25 +317,65 @@ class MappingJSONDecoderClassBuilder(_JSONSerializationClassBuilder):
     Builder for `MappingJSONDecoder` concrete subclasses.
     """
     def __init__(self, target_cls: type=type(None), mappings: Iterable[JsonPropertyMapping]=(),
-                 superclasses: Tuple=(MappingJSONDecoder, )):
+                 superclasses: Tuple=(MappingJSONDecoder, ), *, bypass_constructor: bool=False,
+                 trusted: bool=False):
+        """
+        Constructor.
+        :param bypass_constructor: whether objects should be created without calling the target class's constructor,
+        with all mapped properties set directly on the objects by name. Only suitable for classes whose constructor
+        only sets the mapped properties, as properties missing from the JSON are set to the default of the
+        corresponding constructor parameter, else to `None`
+        :param trusted: whether the decoded JSON is trusted to be valid, in which case the built decoder skips the
+        defensive checks made on each object (that mapped JSON properties are in the JSON, that the objects have the
+        properties set by name and that the deserialized objects are of the target class). Invalid JSON then raises
+        less descriptive errors, or none at all
+        """
         super().__init__(target_cls, mappings, superclasses)
+        self.bypass_constructor = bypass_constructor
+        self.trusted = trusted
 
     def build(self) -> type:
         """
         Build a subclass of `MappingJSONDecoder`.
+
+        Object properties set by name are checked against the target class (and their setters specialised to it) when
+        the subclass is built.
         :return: the built subclass
+        :raises AttributeError: raised if objects of the target class cannot have a property that a mapping sets
+        :raises ValueError: raised if the constructor is to be bypassed but cannot be for the target class and mappings
         """
+        trusted = self.trusted
+        property_mappings = _compile_property_mappings(
+            self.target_cls, _get_all_property_mappings(None, self.mappings, self.superclasses), trusted)
+        deserialization_property_mappings, deserializable_factory = property_mappings, None
+        if self.bypass_constructor:
+            deserialization_property_mappings, deserializable_factory = _create_constructor_bypass(
+                self.target_cls, property_mappings)
+
         def _get_property_mappings(encoder: MappingJSONEncoder) -> List[JsonPropertyMapping]:
-            return _get_all_property_mappings(encoder, self.mappings, self.superclasses)
+            return property_mappings
+
+        def _get_deserialization_property_mappings(decoder: MappingJSONDecoder) -> List[JsonPropertyMapping]:
+            return deserialization_property_mappings
+
+        def _get_deserializable_factory(decoder: MappingJSONDecoder) \
+                -> Optional[Callable[[List[Dict[str, Any]]], List[Any]]]:
+            return deserializable_factory
 
         def get_deserializable_cls(decoder: MappingJSONDecoder) -> type:
             return self.target_cls
 
+        def _is_trusted(decoder: MappingJSONDecoder) -> bool:
+            return trusted
+
         return type(
             "%sDynamicMappingJSONDecoder" % self.target_cls.__name__,
             self.superclasses,
             {
                 "_get_property_mappings": _get_property_mappings,
-                "_get_deserializable_cls": get_deserializable_cls
+                "_get_deserialization_property_mappings": _get_deserialization_property_mappings,
+                "_get_deserializable_factory": _get_deserializable_factory,
+                "_get_deserializable_cls": get_deserializable_cls,
+                "_is_trusted": _is_trusted
             }
         )
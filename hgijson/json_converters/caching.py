@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable
+
+from hgijson.custom_types import PrimitiveJsonType
+
+# Denotes that an object's encoding is not in a cache
+MISSING = object()
+
+
+class EncodedObjectCache:
+    """
+    Size-bounded cache of the encodings of objects, where the least recently used encodings are evicted first.
+
+    Only suitable for immutable objects, as an object's encoding is reused for all objects with an equal key. Encodings
+    got from the cache are shared, therefore must not be modified.
+    """
+    def __init__(self, max_size: int=1024, key: Callable[[Any], Hashable]=None):
+        """
+        Constructor.
+        :param max_size: the maximum number of encodings to store
+        :param key: gets the key of an object, under which its encoding is stored (e.g. a tuple of its identifier and
+        version). If `None`, the object is its own key (using its hash and equality)
+        :raises ValueError: raised if the maximum size is not positive
+        """
+        if max_size < 1:
+            raise ValueError("Maximum size of cache must be positive: %d" % max_size)
+        self.max_size = max_size
+        self.key = key if key is not None else lambda obj: obj
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._encodings = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._encodings)
+
+    def get(self, key: Hashable) -> PrimitiveJsonType:
+        """
+        Gets the encoding stored under the given key, marking it as the most recently used.
+        :param key: the key
+        :return: the encoding else `MISSING` if there is not one (or the key is not hashable)
+        """
+        with self._lock:
+            try:
+                encoded = self._encodings[key]
+            except (KeyError, TypeError):
+                self.misses += 1
+                return MISSING
+            self._encodings.move_to_end(key)
+            self.hits += 1
+            return encoded
+
+    def put(self, key: Hashable, encoded: PrimitiveJsonType):
+        """
+        Stores the given encoding under the given key, evicting the least recently used encoding if the cache is full.
+        Nothing is stored if the key is not hashable.
+        :param key: the key
+        :param encoded: the encoding
+        """
+        with self._lock:
+            try:
+                self._encodings[key] = encoded
+            except TypeError:
+                return
+            self._encodings.move_to_end(key)
+            if len(self._encodings) > self.max_size:
+                self._encodings.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Removes all of the stored encodings and resets the statistics.
+        """
+        with self._lock:
+            self._encodings.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
@@ -0,0 +1,443 @@
+import hashlib
+import os
+import re
+import tempfile
+from importlib.util import spec_from_file_location, module_from_spec
+from json import JSONEncoder, JSONDecoder
+from keyword import iskeyword
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, AbstractSet
+
+# Version of the generated code, which invalidates modules generated by other versions
+_CODE_GENERATION_VERSION = 2
+_HEADER = "# hgijson compiled codecs: version=%d fingerprint=%s\n"
+_HEADER_PATTERN = re.compile(r"# hgijson compiled codecs: version=(\d+) fingerprint=(.*)$")
+
+# Collection types, created by a mapping's collection factory, that can be compiled
+_COLLECTION_TYPES = (list, set, frozenset, tuple)
+
+
+def _is_attribute_name(name: str) -> bool:
+    """
+    Gets whether the given (possibly dotted) name can be used as an attribute name in code.
+    :param name: the name
+    :return: whether the name can be used in code
+    """
+    return all(part.isidentifier() and not iskeyword(part) for part in name.split("."))
+
+
+class _CodeGenerator:
+    """
+    Generator of the code of a module of compiled encoders and decoders.
+    """
+    def __init__(self):
+        self._global_lines = []     # type: List[str]
+        self._function_lines = []   # type: List[str]
+        self._global_names = dict()     # type: Dict[Tuple[str, Any], str]
+        self._encode_functions = dict()     # type: Dict[type, str]
+        self._decode_functions = dict()     # type: Dict[type, str]
+        self._to_generate = []  # type: List[Tuple[str, type]]
+
+    def get_code(self, codec_classes: Iterable[type]) -> str:
+        """
+        Gets the code of the module of the given encoders and decoders.
+        :param codec_classes: the encoder and decoder classes
+        :return: the code of the module (without a header)
+        """
+        from hgijson.json_converters._serialization import MappingJSONEncoder, MappingJSONDecoder
+
+        encoders, decoders = [], []     # type: List[Tuple[str, str]], List[Tuple[str, str]]
+        encoded_classes, decoded_classes = set(), set()
+        for codec_cls in codec_classes:
+            if isinstance(codec_cls, type) and issubclass(codec_cls, MappingJSONEncoder):
+                target_cls = codec_cls()._get_serializable_cls()
+                if target_cls in encoded_classes:
+                    raise ValueError("Multiple encoders given for class: %s" % target_cls)
+                encoded_classes.add(target_cls)
+                encoders.append((self._import(target_cls), self._get_encode_function(codec_cls)))
+            elif isinstance(codec_cls, type) and issubclass(codec_cls, MappingJSONDecoder):
+                target_cls = codec_cls()._get_deserializable_cls()
+                if target_cls in decoded_classes:
+                    raise ValueError("Multiple decoders given for class: %s" % target_cls)
+                decoded_classes.add(target_cls)
+                decoders.append((self._import(target_cls), self._get_decode_function(codec_cls)))
+            else:
+                raise ValueError("Only `MappingJSONEncoder` and `MappingJSONDecoder` classes can be compiled: %s"
+                                 % codec_cls)
+
+        while len(self._to_generate) > 0:
+            function_name, codec_cls = self._to_generate.pop(0)
+            if function_name.startswith("_encode"):
+                self._generate_encode_function(function_name, codec_cls)
+            else:
+                self._generate_decode_function(function_name, codec_cls)
+
+        lines = [
+            "from operator import attrgetter",
+            "",
+            "from hgijson.json_converters._compiled import CompiledJSONEncoder, CompiledJSONDecoder, resolve, \\",
+            "    encode_with, decode_with, encode_nested, decode_nested, get_parent, missing_key, missing_parent, \\",
+            "    set_existing_attribute",
+            ""
+        ]
+        lines.extend(self._global_lines)
+        lines.extend(self._function_lines)
+        for i, (target_name, function_name) in enumerate(encoders):
+            lines.extend(["", "", "class _Encoder%d(CompiledJSONEncoder):" % i,
+                          "    _SERIALIZABLE_CLS = %s" % target_name,
+                          "    _ENCODE = staticmethod(%s)" % function_name])
+        for i, (target_name, function_name) in enumerate(decoders):
+            lines.extend(["", "", "class _Decoder%d(CompiledJSONDecoder):" % i,
+                          "    _DECODE = staticmethod(%s)" % function_name])
+        lines.extend(["", ""])
+        lines.append("ENCODERS = {%s}" % ", ".join("%s: _Encoder%d" % (target_name, i)
+                                                   for i, (target_name, _) in enumerate(encoders)))
+        lines.append("DECODERS = {%s}" % ", ".join("%s: _Decoder%d" % (target_name, i)
+                                                   for i, (target_name, _) in enumerate(decoders)))
+        return "\n".join(lines) + "\n"
+
+    def _import(self, obj: Any) -> str:
+        """
+        Gets the name of a global of the generated module that is the given class or function.
+        :param obj: the class or function
+        :return: the name of the global
+        :raises ValueError: raised if the object cannot be imported by its qualified name
+        """
+        key = ("import", obj)
+        if key not in self._global_names:
+            from hgijson.json_converters._compiled import resolve
+
+            module_name = getattr(obj, "__module__", None)
+            qualified_name = getattr(obj, "__qualname__", "<locals>")
+            try:
+                importable = "<locals>" not in qualified_name and resolve(module_name, qualified_name) is obj
+            except (ImportError, AttributeError, TypeError):
+                importable = False
+            if not importable:
+                raise ValueError("Cannot compile a reference to \"%s\" as it cannot be imported by its qualified name"
+                                 % obj)
+            name = self._global_names[key] = "_imported_%d" % len(self._global_names)
+            self._global_lines.append("%s = resolve(%r, %r)" % (name, module_name, qualified_name))
+        return self._global_names[key]
+
+    def _instantiate(self, codec_cls: type) -> str:
+        """
+        Gets the name of a global of the generated module that is an instance of the given encoder or decoder class.
+        :param codec_cls: the encoder or decoder class
+        :return: the name of the global
+        """
+        key = ("instance", codec_cls)
+        if key not in self._global_names:
+            cls_name = self._import(codec_cls)
+            name = self._global_names[key] = "_instance_%d" % len(self._global_names)
+            self._global_lines.append("%s = %s()" % (name, cls_name))
+        return self._global_names[key]
+
+    def _get_encode_function(self, encoder_cls: type) -> str:
+        """
+        Gets the name of the generated function that encodes an object in the same way as the given encoder.
+        :param encoder_cls: the encoder class
+        :return: the name of the function
+        """
+        if encoder_cls not in self._encode_functions:
+            name = self._encode_functions[encoder_cls] = "_encode_%d" % len(self._encode_functions)
+            self._to_generate.append((name, encoder_cls))
+        return self._encode_functions[encoder_cls]
+
+    def _get_decode_function(self, decoder_cls: type) -> str:
+        """
+        Gets the name of the generated function that decodes an object in the same way as the given decoder.
+        :param decoder_cls: the decoder class
+        :return: the name of the function
+        """
+        if decoder_cls not in self._decode_functions:
+            name = self._decode_functions[decoder_cls] = "_decode_%d" % len(self._decode_functions)
+            self._to_generate.append((name, decoder_cls))
+        return self._decode_functions[decoder_cls]
+
+    def _get_collection_type(self, mapping) -> type:
+        """
+        Gets the type of collection created by the given mapping's collection factory.
+        :param mapping: the mapping
+        :return: the type of collection
+        :raises ValueError: raised if the mapping's collection factory or iterator cannot be compiled
+        """
+        from hgijson.json_converters.models import JsonPropertyMapping
+
+        defaults = JsonPropertyMapping.__init__.__kwdefaults__
+        if mapping.collection_iter is not defaults["collection_iter"]:
+            raise ValueError("Cannot compile a mapping with a custom `collection_iter`: %s" % mapping)
+        if mapping.collection_factory is defaults["collection_factory"]:
+            return list
+        elif mapping.collection_factory in _COLLECTION_TYPES:
+            return mapping.collection_factory
+        raise ValueError("Cannot compile a mapping with a custom `collection_factory`: %s" % mapping)
+
+    def _get_encode_expression(self, mapping) -> Optional[str]:
+        """
+        Gets the expression that encodes `value` using the encoder of the given mapping.
+        :param mapping: the mapping
+        :return: the expression else `None` if the value does not need encoding
+        :raises ValueError: raised if the mapping's encoder cannot be compiled
+        """
+        from hgijson.json_converters._serialization import MappingJSONEncoder
+        from hgijson.serializers import PrimitiveSerializer
+
+        if issubclass(mapping.serializer_cls, PrimitiveSerializer):
+            return None
+        encoder_type = getattr(mapping.serializer_cls, "encoder_type", None)
+        if not isinstance(encoder_type, property):
+            raise ValueError("Cannot compile a mapping with a custom serializer: %s" % mapping)
+        encoder_cls = encoder_type.fget(None)
+        if encoder_cls is JSONEncoder:
+            return None
+        elif issubclass(encoder_cls, MappingJSONEncoder):
+            return "encode_nested(%s, value, sort_key)" % self._get_encode_function(encoder_cls)
+        return "encode_with(%s, value)" % self._instantiate(encoder_cls)
+
+    def _get_decode_expression(self, mapping) -> Optional[str]:
+        """
+        Gets the expression that decodes `value` using the decoder of the given mapping.
+        :param mapping: the mapping
+        :return: the expression else `None` if the value does not need decoding
+        :raises ValueError: raised if the mapping's decoder cannot be compiled
+        """
+        from hgijson.json_converters._serialization import MappingJSONDecoder
+        from hgijson.serializers import PrimitiveDeserializer
+
+        if issubclass(mapping.deserializer_cls, PrimitiveDeserializer):
+            return None
+        decoder_type = getattr(mapping.deserializer_cls, "decoder_type", None)
+        if not isinstance(decoder_type, property):
+            raise ValueError("Cannot compile a mapping with a custom deserializer: %s" % mapping)
+        decoder_cls = decoder_type.fget(None)
+        if decoder_cls is JSONDecoder:
+            return None
+        elif issubclass(decoder_cls, MappingJSONDecoder):
+            return "decode_nested(%s, value)" % self._get_decode_function(decoder_cls)
+        return "decode_with(%s, value)" % self._instantiate(decoder_cls)
+
+    def _generate_encode_function(self, function_name: str, encoder_cls: type):
+        """
+        Generates the function that encodes an object in the same way as the given encoder.
+        :param function_name: the name of the function
+        :param encoder_cls: the encoder class
+        :raises ValueError: raised if the encoder cannot be compiled
+        """
+        from hgijson.json_converters._serialization import MappingJSONEncoder
+
+        if not getattr(encoder_cls, "_MAPPING_ONLY_DEFAULT", encoder_cls.default is MappingJSONEncoder.default):
+            raise ValueError("Cannot compile encoder with a custom `default`: %s" % encoder_cls)
+        encoder = encoder_cls()
+        if encoder._get_encoded_object_cache() is not None:
+            raise ValueError("Cannot compile encoder with an `encoded_object_cache`: %s" % encoder_cls)
+
+        lines = ["", "", "def %s(obj, sort_key):" % function_name, "    encoded = {}"]
+        for mapping in encoder._get_property_mappings():
+            if mapping.object_property_getter is None or mapping.serialized_property_setter is None:
+                continue
+            if mapping.object_property_getter is not getattr(mapping, "_generated_object_property_getter", None) \
+                    or mapping.relative_serialized_property_setter \
+                    is not getattr(mapping, "_generated_json_property_setter", None):
+                raise ValueError("Only mappings of properties by name can be compiled: %s" % mapping)
+
+            if _is_attribute_name(mapping.object_property_name):
+                lines.append("    value = obj.%s" % mapping.object_property_name)
+            else:
+                lines.append("    value = attrgetter(%r)(obj)" % mapping.object_property_name)
+            indent = "    "
+            if mapping.optional:
+                lines.append("    if value is not None:")
+                indent = "        "
+
+            collection_type = self._get_collection_type(mapping)
+            if collection_type is not list:
+                lines.append("%sunordered = isinstance(value, %s)" % (indent, collection_type.__name__))
+                lines.append("%sif unordered:" % indent)
+                lines.append("%s    value = list(value)" % indent)
+            encode_expression = self._get_encode_expression(mapping)
+            if encode_expression is not None:
+                lines.append("%svalue = %s" % (indent, encode_expression))
+            if issubclass(collection_type, AbstractSet):
+                # Items of sets are sorted by their JSON if encoding deterministically (i.e. with `sort_keys`)
+                lines.append("%sif unordered and sort_key is not None:" % indent)
+                lines.append("%s    value = sorted(value, key=sort_key)" % indent)
+
+            container = "encoded"
+            for parent in mapping.serialized_property_parents or ():
+                container = "%s.setdefault(%r, {})" % (container, parent)
+            lines.append("%s%s[%r] = value" % (indent, container, mapping.json_property_name))
+        lines.append("    return encoded")
+        self._function_lines.extend(lines)
+
+    def _generate_decode_function(self, function_name: str, decoder_cls: type):
+        """
+        Generates the function that decodes an object in the same way as the given decoder.
+        :param function_name: the name of the function
+        :param decoder_cls: the decoder class
+        :raises ValueError: raised if the decoder cannot be compiled
+        """
+        from hgijson.json_converters._serialization import MappingJSONDecoder
+        from hgijson.json_converters.builders import _create_object_property_setter
+
+        if decoder_cls.decode_parsed is not MappingJSONDecoder.decode_parsed \
+                or decoder_cls.decode_parsed_many is not MappingJSONDecoder.decode_parsed_many:
+            raise ValueError("Cannot compile decoder with a custom `decode_parsed`: %s" % decoder_cls)
+        decoder = decoder_cls()
+        if decoder._get_deserializable_factory() is not None:
+            raise ValueError("Cannot compile decoder that bypasses the constructor: %s" % decoder_cls)
+        target_cls = decoder._get_deserializable_cls()
+
+        constructor_lines, setter_lines = [], []
+        parents = dict()    # type: Dict[Tuple[str, ...], str]
+        for mapping in decoder._get_deserialization_property_mappings():
+            if mapping.object_constructor_parameter_name is not None:
+                if mapping.object_constructor_argument_modifier \
+                        is not getattr(mapping, "_generated_object_constructor_argument_modifier", None):
+                    raise ValueError("Cannot compile a mapping with an `object_constructor_argument_modifier`: %s"
+                                     % mapping)
+                lines = constructor_lines
+            elif mapping.serialized_property_getter is not None and mapping.object_property_setter is not None:
+                if mapping.object_property_setter is not getattr(mapping, "_generated_object_property_setter", None):
+                    raise ValueError("Only mappings of properties by name can be compiled: %s" % mapping)
+                lines = setter_lines
+            else:
+                continue
+            if mapping.intern_strings or mapping.canonicalize:
+                raise ValueError("Cannot compile a mapping that interns strings or canonicalizes values: %s" % mapping)
+            if mapping.relative_serialized_property_getter \
+                    is not getattr(mapping, "_generated_json_property_getter", None):
+                raise ValueError("Only mappings of properties by name can be compiled: %s" % mapping)
+
+            container = "parsed"
+            if mapping.serialized_property_parents is not None:
+                if mapping.serialized_property_parents not in parents:
+                    parents[mapping.serialized_property_parents] = "parent_%d" % len(parents)
+                container = parents[mapping.serialized_property_parents]
+            name = mapping.json_property_name
+            if mapping.optional:
+                if container == "parsed":
+                    lines.append("    value = parsed.get(%r)" % (name, ))
+                else:
+                    lines.append("    value = %s.get(%r) if %s is not None else None" % (container, name, container))
+                lines.append("    if value is not None:")
+                indent = "        "
+            else:
+                if container != "parsed":
+                    lines.append("    if %s is None:" % container)
+                    lines.append("        missing_parent(parsed, %r)" % (mapping.serialized_property_parents, ))
+                lines.append("    value = %s[%r] if %r in %s else missing_key(%s, %r)"
+                             % (container, name, name, container, container, name))
+                indent = "    "
+
+            decode_expression = self._get_decode_expression(mapping)
+            if decode_expression is not None:
+                lines.append("%svalue = %s" % (indent, decode_expression))
+            collection_type = self._get_collection_type(mapping)
+            if collection_type is not list:
+                lines.append("%sif isinstance(value, list):" % indent)
+                lines.append("%s    value = %s(value)" % (indent, collection_type.__name__))
+
+            if mapping.object_constructor_parameter_name is not None:
+                lines.append("%skwargs[%r] = value" % (indent, mapping.object_constructor_parameter_name))
+            elif _create_object_property_setter(target_cls, mapping.object_property_name) is None:
+                lines.append("%sset_existing_attribute(obj, %r, value)" % (indent, mapping.object_property_name))
+            elif _is_attribute_name(mapping.object_property_name) and "." not in mapping.object_property_name:
+                lines.append("%sobj.%s = value" % (indent, mapping.object_property_name))
+            else:
+                lines.append("%ssetattr(obj, %r, value)" % (indent, mapping.object_property_name))
+
+        lines = ["", "", "def %s(parsed):" % function_name]
+        for parent_names, parent in parents.items():
+            lines.append("    %s = get_parent(parsed, %r)" % (parent, parent_names))
+        lines.append("    kwargs = {}")
+        lines.extend(constructor_lines)
+        lines.append("    obj = %s(**kwargs)" % self._import(target_cls))
+        lines.extend(setter_lines)
+        lines.append("    return obj")
+        self._function_lines.extend(lines)
+
+
+def fingerprint_codecs(codec_classes: Iterable[type]) -> str:
+    """
+    Gets the fingerprint that `compile_codecs` gives the module of the given encoders and decoders if no fingerprint is
+    given, which is a hash of the module's code, so changes if their mappings change.
+    :param codec_classes: the encoder and decoder classes (see `compile_codecs`)
+    :return: the fingerprint
+    :raises ValueError: raised if an encoder or decoder cannot be compiled
+    """
+    return _hash_code(_CodeGenerator().get_code(codec_classes))
+
+
+def _hash_code(code: str) -> str:
+    """
+    Gets the hash of the given generated code.
+    :param code: the code (without a header)
+    :return: the hash
+    """
+    return hashlib.sha256(("%d\n%s" % (_CODE_GENERATION_VERSION, code)).encode("utf-8")).hexdigest()
+
+
+def compile_codecs(codec_classes: Iterable[type], path: str, fingerprint: str=None) -> str:
+    """
+    Compiles the given encoders and decoders into a Python module, written to the given path, which can be loaded by
+    another process (using `load_compiled_codecs`) without building the encoders and decoders.
+
+    Encoders and decoders of nested objects are also compiled, therefore need not be given. Only mappings of properties
+    by name (`json_property_name` and `object_property_name`), optionally with parents, using the default, `set`,
+    `frozenset` or `tuple` collection factory can be compiled, and not encoders with an `encoded_object_cache`.
+    Encoders and decoders of properties that are not built by a builder are instantiated once, without arguments.
+    :param codec_classes: the encoder and decoder classes (built by `MappingJSONEncoderClassBuilder` and
+    `MappingJSONDecoderClassBuilder`), of which there can be at most one of each for a class
+    :param path: the path of the module to write (replaced atomically if it exists)
+    :param fingerprint: fingerprint of the schema of the encoders and decoders (e.g. a version), which must not span
+    multiple lines. If `None`, a hash of the generated code is used (see `fingerprint_codecs`)
+    :return: the fingerprint of the compiled module
+    :raises ValueError: raised if an encoder or decoder cannot be compiled
+    """
+    code = _CodeGenerator().get_code(codec_classes)
+    if fingerprint is None:
+        fingerprint = _hash_code(code)
+    elif "\n" in fingerprint or "\r" in fingerprint:
+        raise ValueError("Fingerprint must not span multiple lines: %r" % fingerprint)
+    code = "%sSCHEMA_FINGERPRINT = %r\n%s" % (_HEADER % (_CODE_GENERATION_VERSION, fingerprint), fingerprint, code)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temp_path = tempfile.mkstemp(suffix=".py", dir=directory)
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            file.write(code)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return fingerprint
+
+
+def load_compiled_codecs(path: str, fingerprint: str) -> Optional[ModuleType]:
+    """
+    Loads the module of encoders and decoders compiled using `compile_codecs`, if it has the given fingerprint.
+
+    The module's `ENCODERS` and `DECODERS` are the compiled encoders and decoders (subclasses of `JSONEncoder` and
+    `ParsedJSONDecoder`), indexed by the class that they encode or decode, and `SCHEMA_FINGERPRINT` is its fingerprint.
+    Compiled encoders and decoders cannot be given `fields`, `columnar`, `limits` or `intern_keys`.
+    :param path: the path of the module
+    :param fingerprint: the fingerprint that the module must have, which ties the module to the current schema (e.g.
+    the fingerprint given to `compile_codecs`, else that got by `fingerprint_codecs`)
+    :return: the module else `None` if it does not exist, has a different fingerprint or was compiled by a different
+    version of this library
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            header = file.readline().rstrip("\r\n")
+    except FileNotFoundError:
+        return None
+
+    match = _HEADER_PATTERN.match(header)
+    if match is None or int(match.group(1)) != _CODE_GENERATION_VERSION or match.group(2) != fingerprint:
+        return None
+
+    spec = spec_from_file_location(os.path.splitext(os.path.basename(path))[0], path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,285 @@
+import collections.abc
+import inspect
+import typing
+from datetime import datetime
+from typing import Any, Dict, List, Tuple, Callable, Iterable, Type
+
+from hgijson.json_converters._serialization import MappingJSONEncoder, MappingJSONDecoder
+from hgijson.json_converters.builders import MappingJSONEncoderClassBuilder, MappingJSONDecoderClassBuilder
+from hgijson.json_converters.models import JsonPropertyMapping
+from hgijson.json_converters.primitive import DatetimeISOFormatJSONEncoder, DatetimeISOFormatJSONDecoder
+from hgijson.serializers import PrimitiveSerializer, PrimitiveDeserializer
+
+try:
+    import dataclasses
+except ImportError:
+    dataclasses = None
+
+# Types whose values are the same in JSON, so need no conversion
+_PRIMITIVE_TYPES = {str, int, float, bool, type(None), dict, Any}
+
+# Factories of collections that are represented as JSON lists, indexed by the origin of the collection annotation
+_COLLECTION_FACTORIES = {
+    list: list, List: list, collections.abc.Sequence: list, collections.abc.MutableSequence: list,
+    typing.Sequence: list, typing.MutableSequence: list,
+    set: set, typing.Set: set, collections.abc.Set: set, collections.abc.MutableSet: set, typing.AbstractSet: set,
+    typing.MutableSet: set,
+    frozenset: frozenset, typing.FrozenSet: frozenset,
+    tuple: tuple, Tuple: tuple
+}   # type: Dict[Any, Callable[[Iterable], Any]]
+
+# Names of the attributes of classes that hold the encoder and decoder derived for them. These are stored on the classes
+# (rather than in a module level cache) as derived encoders and decoders reference their class, so would otherwise keep
+# it (e.g. a class defined in a function) alive
+_DERIVED_JSON_ENCODER_ATTRIBUTE = "_hgijson_derived_json_encoder_cls"
+_DERIVED_JSON_DECODER_ATTRIBUTE = "_hgijson_derived_json_decoder_cls"
+
+
+class _DerivedDatetimeJSONEncoder(DatetimeISOFormatJSONEncoder):
+    """
+    JSON encoder for datetime to ISO 8601 format, which also encodes `None` and lists of datetimes (the values of
+    `Optional` and collection properties).
+    """
+    def default(self, to_encode: Any) -> Any:
+        return self.default_many([to_encode])[0]
+
+    def default_many(self, to_encode: Iterable[Any]) -> List[Any]:
+        return [value if value is None else self.default_many(value) if isinstance(value, list) else value.isoformat()
+                for value in to_encode]
+
+
+class _DerivedDatetimeJSONDecoder(DatetimeISOFormatJSONDecoder):
+    """
+    JSON decoder for datetime as ISO 8601 formatted string, which also decodes `null` and lists of datetimes (the
+    values of `Optional` and collection properties).
+    """
+    def decode_parsed(self, parsed_json: Any) -> Any:
+        return self.decode_parsed_many([parsed_json])[0]
+
+    def decode_parsed_many(self, parsed_jsons: Iterable[Any]) -> List[Any]:
+        parse = DatetimeISOFormatJSONDecoder._get_date_parser().parse
+        return [value if value is None else self.decode_parsed_many(value) if isinstance(value, list) else parse(value)
+                for value in parsed_jsons]
+
+
+class _DerivedProperty:
+    """
+    Property of a class, from which a mapping can be derived.
+    """
+    def __init__(self, name: str, annotation: Any, constructor_parameter: bool, has_default: bool):
+        """
+        Constructor.
+        :param name: the name of the property
+        :param annotation: the type annotation of the property
+        :param constructor_parameter: whether the property is set by a constructor parameter of the same name
+        :param has_default: whether the property has a default value, and hence need not be in the JSON
+        """
+        self.name = name
+        self.annotation = annotation
+        self.constructor_parameter = constructor_parameter
+        self.has_default = has_default
+
+
+def _get_origin(annotation: Any) -> Any:
+    """
+    Gets the unsubscripted version of the given annotation (e.g. `list` for `List[int]`).
+    :param annotation: the annotation
+    :return: the unsubscripted annotation else `None` if the annotation is not subscripted
+    """
+    if hasattr(typing, "get_origin"):
+        return typing.get_origin(annotation)
+    return getattr(annotation, "__origin__", None)
+
+
+def _get_args(annotation: Any) -> Tuple:
+    """
+    Gets the arguments of the given subscripted annotation (e.g. `(int, )` for `List[int]`).
+    :param annotation: the annotation
+    :return: the arguments of the annotation
+    """
+    if hasattr(typing, "get_args"):
+        return typing.get_args(annotation)
+    return getattr(annotation, "__args__", None) or ()
+
+
+def _unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    """
+    Unwraps the given annotation if it is `Optional`.
+    :param annotation: the annotation
+    :return: tuple where the first element is the annotation of the non-`None` value and the second is whether the
+    annotation was `Optional`
+    :raises ValueError: raised if the annotation is a `Union` of multiple non-`None` types
+    """
+    if _get_origin(annotation) is not typing.Union and type(annotation).__name__ != "UnionType":
+        return annotation, False
+    arguments = [argument for argument in _get_args(annotation) if argument is not type(None)]
+    if len(arguments) != 1:
+        raise ValueError("Cannot derive a mapping for a union of types: %s" % annotation)
+    return arguments[0], True
+
+
+def _is_derivable(target_cls: type) -> bool:
+    """
+    Gets whether mappings can be derived for the given class.
+    :param target_cls: the class
+    :return: whether mappings can be derived
+    """
+    return isinstance(target_cls, type) \
+        and (_is_dataclass(target_cls) or _is_named_tuple(target_cls) or len(_get_type_hints(target_cls)) > 0
+             or len(_get_type_hints(target_cls.__init__)) > 0)
+
+
+def _is_dataclass(target_cls: type) -> bool:
+    return dataclasses is not None and dataclasses.is_dataclass(target_cls)
+
+
+def _is_named_tuple(target_cls: type) -> bool:
+    return issubclass(target_cls, tuple) and hasattr(target_cls, "_fields")
+
+
+def _get_type_hints(obj: Any) -> Dict[str, Any]:
+    """
+    Gets the type hints of the given class or function, excluding class variables and return types.
+    :param obj: the class or function
+    :return: the type hints, indexed by name
+    """
+    try:
+        type_hints = typing.get_type_hints(obj)
+    except TypeError:
+        # e.g. `object.__init__`
+        return {}
+    return {name: annotation for name, annotation in type_hints.items()
+            if name != "return" and _get_origin(annotation) is not typing.ClassVar
+            and annotation is not typing.ClassVar}
+
+
+def _get_properties(target_cls: type) -> List[_DerivedProperty]:
+    """
+    Gets the properties of the given dataclass, `NamedTuple` or type annotated class.
+    :param target_cls: the class
+    :return: the properties of the class
+    :raises TypeError: raised if a constructor parameter of a type annotated class has no type annotation
+    """
+    if _is_dataclass(target_cls):
+        type_hints = _get_type_hints(target_cls)
+        return [_DerivedProperty(field.name, type_hints.get(field.name, Any), field.init,
+                                 field.default is not dataclasses.MISSING
+                                 or field.default_factory is not dataclasses.MISSING)
+                for field in dataclasses.fields(target_cls)]
+
+    if _is_named_tuple(target_cls):
+        type_hints = _get_type_hints(target_cls)
+        # Defaults of `NamedTuple`s defined functionally are only on the constructor
+        parameters = inspect.signature(target_cls).parameters
+        return [_DerivedProperty(name, type_hints.get(name, Any), True,
+                                 name in parameters and parameters[name].default is not inspect.Parameter.empty)
+                for name in target_cls._fields]
+
+    # Skipping `self`
+    parameters = {parameter.name: parameter
+                  for parameter in list(inspect.signature(target_cls.__init__).parameters.values())[1:]
+                  if parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)}
+    type_hints = _get_type_hints(target_cls.__init__)
+    type_hints.update(_get_type_hints(target_cls))
+    for name in parameters:
+        if name not in type_hints:
+            raise TypeError("Cannot derive a mapping for constructor parameter \"%s\" of \"%s\" as it has no type "
+                            "annotation" % (name, target_cls.__name__))
+    return [_DerivedProperty(name, annotation, name in parameters,
+                             name in parameters and parameters[name].default is not inspect.Parameter.empty)
+            for name, annotation in type_hints.items()]
+
+
+def _create_mapping(derived_property: _DerivedProperty) -> JsonPropertyMapping:
+    """
+    Creates a mapping for the given property, where the JSON property has the same name as the object property.
+    :param derived_property: the property
+    :return: the mapping
+    :raises ValueError: raised if the property's type annotation is not supported
+    """
+    annotation, _ = _unwrap_optional(derived_property.annotation)
+
+    collection_factory = list
+    if _get_origin(annotation) in _COLLECTION_FACTORIES or annotation in _COLLECTION_FACTORIES:
+        collection_factory = _COLLECTION_FACTORIES[_get_origin(annotation) or annotation]
+        arguments = [argument for argument in _get_args(annotation) if argument is not Ellipsis]
+        if len(set(arguments)) > 1:
+            raise ValueError("Cannot derive a mapping for a collection of different types: %s" % annotation)
+        annotation = arguments[0] if len(arguments) > 0 else Any
+        if not isinstance(annotation, type) and annotation is not Any and _get_origin(annotation) is not dict:
+            raise ValueError("Cannot derive a mapping for a collection of: %s" % annotation)
+
+    # `None` values of `Optional` properties without defaults are in the JSON, so that they are given to the constructor
+    kwargs = dict(optional=derived_property.has_default, collection_factory=collection_factory)
+    object_property_name = derived_property.name
+    if derived_property.constructor_parameter:
+        kwargs["object_constructor_parameter_name"] = derived_property.name
+    else:
+        # Properties not set by the constructor may not have been set, so are optional in both the object and the JSON
+        name, object_property_name = derived_property.name, None
+        kwargs.update(optional=True, object_property_getter=lambda obj: getattr(obj, name, None),
+                      object_property_setter=lambda obj, value: setattr(obj, name, value))
+
+    if annotation is datetime:
+        return JsonPropertyMapping(derived_property.name, object_property_name,
+                                   encoder_cls=_DerivedDatetimeJSONEncoder, decoder_cls=_DerivedDatetimeJSONDecoder,
+                                   **kwargs)
+    elif annotation in _PRIMITIVE_TYPES or _get_origin(annotation) is dict:
+        mapping = JsonPropertyMapping(derived_property.name, object_property_name, **kwargs)
+        # Values do not need converting so bypass the JSON encoder and decoder
+        mapping.serializer_cls = PrimitiveSerializer
+        mapping.deserializer_cls = PrimitiveDeserializer
+        return mapping
+    elif _is_derivable(annotation):
+        # Encoder and decoder got when used to allow self-referential models
+        return JsonPropertyMapping(derived_property.name, object_property_name,
+                                   encoder_cls=lambda: derive_json_encoder_cls(annotation),
+                                   decoder_cls=lambda: derive_json_decoder_cls(annotation), **kwargs)
+    raise ValueError("Cannot derive a mapping for property \"%s\" of type: %s" % (derived_property.name, annotation))
+
+
+def derive_json_property_mappings(target_cls: type) -> List[JsonPropertyMapping]:
+    """
+    Derives mappings for the properties of the given dataclass, `NamedTuple` or type annotated class, where each JSON
+    property has the same name as the object property. Properties that are parameters of the class's constructor are
+    set via the constructor.
+
+    Supported property types are JSON primitives, `datetime` (as ISO format strings), `Optional`, lists, sets and
+    tuples of those types, and other classes that mappings can be derived for.
+    :param target_cls: the class
+    :return: the mappings
+    :raises ValueError: raised if a mapping cannot be derived for a property of the class
+    :raises TypeError: raised if a constructor parameter of a type annotated class has no type annotation
+    """
+    if not _is_derivable(target_cls):
+        raise ValueError("Cannot derive mappings for class without fields or type annotations: %s" % target_cls)
+    return [_create_mapping(derived_property) for derived_property in _get_properties(target_cls)]
+
+
+def derive_json_encoder_cls(target_cls: type) -> Type[MappingJSONEncoder]:
+    """
+    Gets an encoder for the given class, using derived mappings (see `derive_json_property_mappings`).
+    :param target_cls: the class
+    :return: the encoder (the same encoder is returned for the same class, which it is stored on)
+    """
+    # Not inherited, as mappings are derived for subclasses separately
+    encoder_cls = vars(target_cls).get(_DERIVED_JSON_ENCODER_ATTRIBUTE)
+    if encoder_cls is None:
+        mappings = derive_json_property_mappings(target_cls)
+        encoder_cls = MappingJSONEncoderClassBuilder(target_cls, mappings).build()
+        setattr(target_cls, _DERIVED_JSON_ENCODER_ATTRIBUTE, encoder_cls)
+    return encoder_cls
+
+
+def derive_json_decoder_cls(target_cls: type) -> Type[MappingJSONDecoder]:
+    """
+    Gets a decoder for the given class, using derived mappings (see `derive_json_property_mappings`).
+    :param target_cls: the class
+    :return: the decoder (the same decoder is returned for the same class, which it is stored on)
+    """
+    decoder_cls = vars(target_cls).get(_DERIVED_JSON_DECODER_ATTRIBUTE)
+    if decoder_cls is None:
+        mappings = derive_json_property_mappings(target_cls)
+        decoder_cls = MappingJSONDecoderClassBuilder(target_cls, mappings).build()
+        setattr(target_cls, _DERIVED_JSON_DECODER_ATTRIBUTE, decoder_cls)
+    return decoder_cls
@@ -0,0 +1,60 @@
+import hashlib
+from json import JSONEncoder
+from typing import Any, Iterator, TextIO, Tuple
+
+# Hashing algorithm used by default (see `hashlib.new`)
+DEFAULT_DIGEST_ALGORITHM = "sha256"
+
+
+def iterencode_with_digest(obj: Any, digest: Any, cls: type=JSONEncoder, **kwargs) -> Iterator[str]:
+    """
+    Encodes the given object as chunks of JSON, updating the given digest with the UTF-8 encoding of each chunk as it is
+    produced.
+
+    The keys of JSON objects are sorted (and the items of sets, by encoders built by this library), unless `sort_keys`
+    is given, so that the JSON, and therefore its digest, is deterministic.
+    :param obj: the object to encode
+    :param digest: the digest (e.g. `hashlib.sha256()`) to update
+    :param cls: the encoder class
+    :param kwargs: keyword arguments given to the encoder's constructor
+    :return: the chunks of JSON
+    """
+    kwargs.setdefault("sort_keys", True)
+    for chunk in cls(**kwargs).iterencode(obj):
+        digest.update(chunk.encode("utf-8"))
+        yield chunk
+
+
+def dump_with_digest(obj: Any, file: TextIO, cls: type=JSONEncoder, algorithm: str=DEFAULT_DIGEST_ALGORITHM,
+                     **kwargs) -> str:
+    """
+    Encodes the given object as JSON, written to the given file as it is produced, whilst computing the digest of the
+    JSON (e.g. to use as an HTTP ETag), without holding all of the JSON in memory (see `iterencode_with_digest`).
+    :param obj: the object to encode
+    :param file: the (text) file to write to
+    :param cls: the encoder class
+    :param algorithm: the name of the hashing algorithm (see `hashlib.new`)
+    :param kwargs: keyword arguments given to the encoder's constructor
+    :return: the digest of the UTF-8 encoding of the JSON, as a hexadecimal string
+    """
+    digest = hashlib.new(algorithm)
+    for chunk in iterencode_with_digest(obj, digest, cls, **kwargs):
+        file.write(chunk)
+    return digest.hexdigest()
+
+
+def dumps_with_digest(obj: Any, cls: type=JSONEncoder, algorithm: str=DEFAULT_DIGEST_ALGORITHM, **kwargs) \
+        -> Tuple[str, str]:
+    """
+    Encodes the given object as JSON and computes the digest of the JSON (see `iterencode_with_digest`).
+    :param obj: the object to encode
+    :param cls: the encoder class
+    :param algorithm: the name of the hashing algorithm (see `hashlib.new`)
+    :param kwargs: keyword arguments given to the encoder's constructor
+    :return: tuple where the first element is the JSON and the second is the digest of its UTF-8 encoding, as a
+    hexadecimal string
+    """
+    kwargs.setdefault("sort_keys", True)
+    # Encoded in one go, which is faster than in chunks when all of the JSON is to be held in memory
+    json_as_string = cls(**kwargs).encode(obj)
+    return json_as_string, hashlib.new(algorithm, json_as_string.encode("utf-8")).hexdigest()
@@ -0,0 +1,292 @@
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from json import JSONDecoder
+from typing import Any, BinaryIO, List, Optional, Tuple, Union
+
+from hgijson.json_converters.interfaces import ParsedJSONDecoder
+
+# Version of the format of persisted indexes, which are invalid if written in a different version
+_INDEX_FORMAT_VERSION = 1
+_MAGIC = b"HGIJSONIDX"
+# Format version, whether the records are in a JSON array, size and modification time (ns) of the indexed file and
+# number of records
+_HEADER = struct.Struct("<%dsBBQQQ" % len(_MAGIC))
+_INDEX_FILE_SUFFIX = ".idx"
+# Offsets are persisted in little-endian byte order
+_SWAP_BYTES = sys.byteorder != "little"
+
+_WHITESPACE = b" \t\r\n"
+# Strings (skipped in one go, so their contents are not mistaken for structure) and the structural characters that
+# delimit the elements of a JSON array
+_ARRAY_TOKEN_PATTERN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},]', re.DOTALL)
+
+# Source of the content of an indexed file
+RecordSource = Union[mmap.mmap, bytes, BinaryIO]
+
+
+def _get_modification_time(path: str) -> Tuple[int, int]:
+    """
+    Gets the size and modification time of the file with the given path, which identify a version of the file.
+    :param path: the path of the file
+    :return: tuple where the first element is the size of the file and the second its modification time (ns)
+    """
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _index_json_lines(content: mmap.mmap, size: int, starts: array, ends: array):
+    """
+    Indexes the records of the given NDJSON (JSON Lines) content, one per non-blank line.
+    :param content: the content
+    :param size: the size of the content
+    :param starts: array to which the offset of the start of each record is appended
+    :param ends: array to which the offset of the end of each record is appended
+    """
+    position = 0
+    while position < size:
+        end = content.find(b"\n", position)
+        if end == -1:
+            end = size
+        if end > position and (content[position] not in _WHITESPACE or len(content[position:end].strip()) > 0):
+            starts.append(position)
+            ends.append(end)
+        position = end + 1
+
+
+def _index_json_array(content: mmap.mmap, starts: array, ends: array):
+    """
+    Indexes the elements of the JSON array that is the given content.
+    :param content: the content
+    :param starts: array to which the offset of the start of each record is appended
+    :param ends: array to which the offset of the end of each record is appended
+    :raises ValueError: raised if the content is not a JSON array
+    """
+    depth = 0
+    start = None    # type: Optional[int]
+    tokens_in_record = 0
+    terminated = False
+    for match in _ARRAY_TOKEN_PATTERN.finditer(content):
+        token = match.group(0)[:1]
+        if depth == 0:
+            if token != b"[" or len(content[:match.start()].strip()) > 0:
+                raise ValueError("Content is not a JSON array")
+            depth = 1
+            start = match.end()
+        elif depth == 1 and token in b",]":
+            if tokens_in_record > 0 or len(content[start:match.start()].strip()) > 0:
+                starts.append(start)
+                ends.append(match.start())
+            elif token == b",":
+                raise ValueError("Empty element in JSON array at offset %d" % match.start())
+            if token == b"]":
+                terminated = True
+                break
+            start = match.end()
+            tokens_in_record = 0
+        else:
+            if token in b"[{":
+                depth += 1
+            elif token in b"]}":
+                depth -= 1
+            tokens_in_record += 1
+    if not terminated:
+        raise ValueError("JSON array is not terminated")
+
+
+class JSONRecordIndex:
+    """
+    Index of the byte offsets of the records in a (large) file of NDJSON (JSON Lines) or of a JSON array (where the
+    records are its elements), which allows records to be read and decoded without reading the file from its start.
+
+    Indexes can be persisted alongside the indexed file (see `save` and `load`) and are picklable, so that the records
+    of one file can be split between worker processes (see `split`).
+    """
+    def __init__(self, path: str, starts: array, ends: array, json_array: bool, size: int, modification_time: int):
+        """
+        Constructor.
+        :param path: the path of the indexed file
+        :param starts: the offset of the start of each record (array of type "Q")
+        :param ends: the offset of the end of each record (array of type "Q")
+        :param json_array: whether the records are the elements of a JSON array, else they are NDJSON
+        :param size: the size of the indexed file, when indexed
+        :param modification_time: the modification time (ns) of the indexed file, when indexed
+        """
+        if len(starts) != len(ends):
+            raise ValueError("Number of record starts (%d) and ends (%d) differ" % (len(starts), len(ends)))
+        self.path = path
+        self.starts = starts
+        self.ends = ends
+        self.json_array = json_array
+        self.size = size
+        self.modification_time = modification_time
+
+    @staticmethod
+    def build(path: str, json_array: bool=False) -> "JSONRecordIndex":
+        """
+        Builds the index of the records in the file with the given path, reading the file once.
+        :param path: the path of the file
+        :param json_array: whether the file contains a JSON array, the elements of which are the records, opposed to
+        NDJSON (where each non-blank line is a record)
+        :return: the index
+        :raises ValueError: raised if the file is said to contain a JSON array but does not
+        """
+        starts, ends = array("Q"), array("Q")
+        size, modification_time = _get_modification_time(path)
+        if size > 0:
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                if json_array:
+                    _index_json_array(content, starts, ends)
+                else:
+                    _index_json_lines(content, size, starts, ends)
+        elif json_array:
+            raise ValueError("Empty file is not a JSON array: %s" % path)
+        return JSONRecordIndex(path, starts, ends, json_array, size, modification_time)
+
+    @staticmethod
+    def load(path: str, index_path: str=None) -> Optional["JSONRecordIndex"]:
+        """
+        Loads the persisted index of the records in the file with the given path (see `save`).
+        :param path: the path of the indexed file
+        :param index_path: the path of the index (defaults to the path of the indexed file with ".idx" appended)
+        :return: the index else `None` if it does not exist, was written by a different version of this library or the
+        indexed file has changed since it was indexed
+        """
+        if index_path is None:
+            index_path = path + _INDEX_FILE_SUFFIX
+        try:
+            size, modification_time = _get_modification_time(path)
+            with open(index_path, "rb") as file:
+                header = file.read(_HEADER.size)
+                if len(header) != _HEADER.size:
+                    return None
+                magic, version, json_array, indexed_size, indexed_modification_time, length = _HEADER.unpack(header)
+                if magic != _MAGIC or version != _INDEX_FORMAT_VERSION or indexed_size != size \
+                        or indexed_modification_time != modification_time:
+                    return None
+                starts, ends = array("Q"), array("Q")
+                starts.fromfile(file, length)
+                ends.fromfile(file, length)
+                if _SWAP_BYTES:
+                    starts.byteswap()
+                    ends.byteswap()
+        except (FileNotFoundError, EOFError):
+            return None
+        return JSONRecordIndex(path, starts, ends, bool(json_array), size, modification_time)
+
+    @staticmethod
+    def load_or_build(path: str, json_array: bool=False, index_path: str=None) -> "JSONRecordIndex":
+        """
+        Loads the persisted index of the records in the file with the given path, else builds and saves the index if
+        it is not persisted or is out of date.
+        :param path: the path of the file
+        :param json_array: whether the file contains a JSON array (see `build`)
+        :param index_path: the path of the index (see `load`)
+        :return: the index
+        """
+        index = JSONRecordIndex.load(path, index_path)
+        if index is None or index.json_array != json_array:
+            index = JSONRecordIndex.build(path, json_array)
+            index.save(index_path)
+        return index
+
+    def save(self, index_path: str=None):
+        """
+        Persists this index (replacing an existing index atomically).
+        :param index_path: the path of the index (defaults to the path of the indexed file with ".idx" appended)
+        """
+        if index_path is None:
+            index_path = self.path + _INDEX_FILE_SUFFIX
+        header = _HEADER.pack(_MAGIC, _INDEX_FORMAT_VERSION, self.json_array, self.size, self.modification_time,
+                              len(self))
+        starts, ends = self.starts, self.ends
+        if _SWAP_BYTES:
+            starts, ends = array("Q", starts), array("Q", ends)
+            starts.byteswap()
+            ends.byteswap()
+
+        file_descriptor, temp_path = tempfile.mkstemp(suffix=_INDEX_FILE_SUFFIX,
+                                                      dir=os.path.dirname(os.path.abspath(index_path)))
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(header)
+                starts.tofile(file)
+                ends.tofile(file)
+            os.replace(temp_path, index_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def read(self, source: RecordSource, start: int=0, stop: int=None) -> List[bytes]:
+        """
+        Reads the JSON of the records with the given indices.
+        :param source: the content of the indexed file, as a memory map (see `open`) or bytes, else a binary file that
+        is read by seeking to each record
+        :param start: the index of the first record
+        :param stop: the index after the last record (defaults to the number of records)
+        :return: the JSON of each record, encoded as UTF-8
+        """
+        starts, ends = self.starts[start:stop], self.ends[start:stop]
+        if isinstance(source, (mmap.mmap, bytes)):
+            return [source[record_start:record_end] for record_start, record_end in zip(starts, ends)]
+        records = []
+        for record_start, record_end in zip(starts, ends):
+            source.seek(record_start)
+            records.append(source.read(record_end - record_start))
+        return records
+
+    def decode(self, decoder: JSONDecoder, source: RecordSource, start: int=0, stop: int=None) -> List[Any]:
+        """
+        Decodes the records with the given indices.
+        :param decoder: the decoder of the records. A `ParsedJSONDecoder` (e.g. a built decoder) decodes the parsed
+        records in one call (see `decode_parsed_many`)
+        :param source: the content of the indexed file (see `read`)
+        :param start: the index of the first record
+        :param stop: the index after the last record (defaults to the number of records)
+        :return: the decoded records
+        """
+        records = [record.decode("utf-8") for record in self.read(source, start, stop)]
+        if isinstance(decoder, ParsedJSONDecoder):
+            # Parsed using the decoder's settings (e.g. hooks)
+            parsed_records = [JSONDecoder.decode(decoder, record) for record in records]
+            return decoder.decode_parsed_many(parsed_records)
+        return [decoder.decode(record) for record in records]
+
+    def split(self, parts: int) -> List[Tuple[int, int]]:
+        """
+        Splits the records into the given number of contiguous ranges of roughly the same number of bytes (e.g. to be
+        decoded by different worker processes).
+        :param parts: the number of ranges (fewer are returned if there are fewer records)
+        :return: the ranges of records, as tuples of the index of the first record and the index after the last record
+        :raises ValueError: raised if the number of ranges is not positive
+        """
+        if parts < 1:
+            raise ValueError("Number of parts must be positive: %d" % parts)
+        length = len(self)
+        if length == 0:
+            return []
+        first_offset, last_offset = self.starts[0], self.ends[-1]
+        boundaries = [0]
+        for part in range(1, parts):
+            boundary = bisect_left(self.starts, first_offset + (last_offset - first_offset) * part // parts)
+            if boundaries[-1] < boundary < length:
+                boundaries.append(boundary)
+        boundaries.append(length)
+        return list(zip(boundaries[:-1], boundaries[1:]))
+
+    def open(self) -> mmap.mmap:
+        """
+        Opens the indexed file as a read-only memory map, to be given as the source of records (and closed after use).
+        :return: the memory map
+        :raises ValueError: raised if the indexed file is empty
+        """
+        with open(self.path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
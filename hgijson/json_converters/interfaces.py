@@ -1,5 +1,6 @@
 from abc import abstractmethod, ABCMeta
 from json import JSONDecoder
+from typing import Iterable, List
 
 from hgijson.custom_types import SerializableType, PrimitiveJsonType
 
@@ -15,3 +16,12 @@ class ParsedJSONDecoder(JSONDecoder, metaclass=ABCMeta):
         :param parsed_json: the JSON
         :return: the decoded object
         """
+
+    def decode_parsed_many(self, parsed_jsons: Iterable[PrimitiveJsonType]) -> List[SerializableType]:
+        """
+        Decodes each of the given JSON values, represented as primitive Python objects. Can be overridden to decode the
+        values in a single (e.g. vectorised) operation.
+        :param parsed_jsons: the JSON values
+        :return: the decoded objects, in the same order as the given values
+        """
+        return [self.decode_parsed(parsed_json) for parsed_json in parsed_jsons]
@@ -1,4 +1,5 @@
 from json import JSONDecoder, JSONEncoder
+from operator import attrgetter
 from typing import Callable, Any, Dict, Union, Iterable
 
 from hgijson.json_converters._converters import json_decoder_to_deserializer, json_encoder_to_serializer
@@ -35,7 +36,9 @@ class JsonPropertyMapping(PropertyMapping):
             optional: bool=False,
             collection_factory: Callable[[Iterable], Any]=lambda items: list(items),
             collection_iter: Callable[[Any], Iterable]=lambda collection: iter(collection),
-            parent_json_properties: Iterable[str]=None):
+            parent_json_properties: Iterable[str]=None,
+            intern_strings: bool=False,
+            canonicalize: bool=False):
         """
         Constructor.
         :param json_property_name:
@@ -49,7 +52,15 @@ class JsonPropertyMapping(PropertyMapping):
         :param encoder_cls:
         :param decoder_cls:
         :param optional:
+        :param collection_factory:
+        :param collection_iter:
+        :param parent_json_properties: names of the JSON properties, from the root of the JSON object, in which the JSON
+        property is nested
+        :param intern_strings: whether decoded strings (or the strings in a decoded collection) are interned
+        :param canonicalize: whether equal JSON values of the property, decoded together (e.g. in a list of objects),
+        are decoded to one shared instance
         """
+        generated_json_property_getter, generated_json_property_setter = None, None
         if json_property_name is not None:
             if json_property_getter is not None and json_property_setter is not None:
                 raise ValueError("Redundant `json_property_name` argument given. It has been specified that a "
@@ -66,39 +77,14 @@ class JsonPropertyMapping(PropertyMapping):
                             raise KeyError("No value for the non-optional key \"%s\" in the input JSON: %s"
                                            % (json_property_name, obj_as_json))
                     return obj_as_json[json_property_name]
+                generated_json_property_getter = json_property_getter
 
             if json_property_setter is None:
                 def json_property_setter(obj_as_json: Dict, value: Any):
                     obj_as_json[json_property_name] = value
+                generated_json_property_setter = json_property_setter
 
-        if parent_json_properties is not None:
-            parent_json_properties = list(parent_json_properties)
-
-            if json_property_getter is not None:
-                top_level_json_property_getter = json_property_getter
-
-                def json_property_getter(obj_as_json: Dict):
-                    top_level_obj_as_json = obj_as_json
-                    for ancestor in parent_json_properties:
-                        obj_as_json = obj_as_json.get(ancestor, None)
-                        if obj_as_json is None:
-                            if optional:
-                                return None
-                            else:
-                                raise KeyError("Parent keys missing \"%s\" in the input JSON: %s"
-                                               % (".".join(parent_json_properties), top_level_obj_as_json))
-                    return top_level_json_property_getter(obj_as_json)
-
-            if json_property_setter is not None:
-                top_level_json_property_setter = json_property_setter
-
-                def json_property_setter(obj_as_json: Dict, value: Any):
-                    for ancestor in parent_json_properties:
-                        if ancestor not in obj_as_json:
-                            obj_as_json[ancestor] = {}
-                        obj_as_json = obj_as_json[ancestor]
-                    top_level_json_property_setter(obj_as_json, value)
-
+        generated_object_property_getter, generated_object_property_setter = None, None
         if object_property_name is not None:
             if object_property_getter is not None and object_property_setter is not None:
                 raise ValueError("Redundant `object_property_name` argument given. It has been specified that an "
@@ -107,8 +93,8 @@ class JsonPropertyMapping(PropertyMapping):
                                  "property cannot be specified in this case.")
 
             if object_property_getter is None:
-                def object_property_getter(obj: Any) -> Any:
-                    return getattr(obj, object_property_name)
+                object_property_getter = attrgetter(object_property_name)
+                generated_object_property_getter = object_property_getter
 
             if object_property_setter is None and object_constructor_parameter_name is None:
                 def object_property_setter(obj: Any, value: Any):
@@ -116,6 +102,8 @@ class JsonPropertyMapping(PropertyMapping):
                         raise AttributeError("Object \"%s\" does not have the attribute \"%s\""
                                              % (obj, object_property_name))
                     setattr(obj, object_property_name, value)
+                # Builders can replace the setter with one specific to the class of the object
+                generated_object_property_setter = object_property_setter
 
         encoder_as_serializer_cls = json_encoder_to_serializer(encoder_cls)
         decoder_as_serializer_cls = json_decoder_to_deserializer(decoder_cls)
@@ -128,4 +116,16 @@ class JsonPropertyMapping(PropertyMapping):
                          object_constructor_argument_modifier=object_constructor_argument_modifier,
                          serializer_cls=encoder_as_serializer_cls, deserializer_cls=decoder_as_serializer_cls,
                          optional=optional,
-                         collection_factory=collection_factory, collection_iter=collection_iter)
+                         collection_factory=collection_factory, collection_iter=collection_iter,
+                         serialized_property_parents=parent_json_properties,
+                         intern_strings=intern_strings, canonicalize=canonicalize)
+        self.json_property_name = json_property_name
+        self.parent_json_properties = list(parent_json_properties) if parent_json_properties is not None else None
+        self.object_property_name = object_property_name
+        # Accessors generated from the given property names, which can be replaced with equivalents (e.g. by builders)
+        self._generated_json_property_getter = generated_json_property_getter
+        self._generated_json_property_setter = generated_json_property_setter
+        self._generated_object_property_getter = generated_object_property_getter
+        self._generated_object_property_setter = generated_object_property_setter
+        self._generated_object_constructor_argument_modifier = \
+            self.object_constructor_argument_modifier if object_constructor_argument_modifier is None else None
@@ -0,0 +1,114 @@
+import base64
+import json
+from json import JSONEncoder
+from typing import Any, Iterable, List, Dict, Optional
+
+from hgijson.json_converters.interfaces import ParsedJSONDecoder
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_NUMPY_REQUIRED_MESSAGE = "numpy must be installed to use %s"
+
+
+def _check_numpy_installed(converter: Any):
+    """
+    Checks that numpy is installed.
+    :param converter: the converter that requires numpy
+    :raises ImportError: raised if numpy is not installed
+    """
+    if numpy is None:
+        raise ImportError(_NUMPY_REQUIRED_MESSAGE % type(converter).__name__)
+
+
+class NumpyArrayJSONEncoder(JSONEncoder):
+    """
+    JSON encoder for numpy arrays to (nested) JSON lists.
+    """
+    def __init__(self, *args, **kwargs):
+        _check_numpy_installed(self)
+        super().__init__(*args, **kwargs)
+
+    def default(self, to_encode: "numpy.ndarray") -> List:
+        return to_encode.tolist()
+
+    def default_many(self, to_encode: Iterable["numpy.ndarray"]) -> List[List]:
+        to_encode = list(to_encode)
+        if len(to_encode) > 1 and len({(array.shape, array.dtype) for array in to_encode}) == 1:
+            # Arrays of the same shape and type are converted together
+            return numpy.stack(to_encode).tolist()
+        return [array.tolist() for array in to_encode]
+
+
+class NumpyArrayJSONDecoder(ParsedJSONDecoder):
+    """
+    JSON decoder for numpy arrays from (nested) JSON lists. Subclass and set `DTYPE` to decode to a specific type of
+    array.
+    """
+    DTYPE = None
+
+    def __init__(self, *args, **kwargs):
+        _check_numpy_installed(self)
+        super().__init__(*args, **kwargs)
+
+    def decode(self, to_decode: str, **kwargs) -> Optional["numpy.ndarray"]:
+        return self.decode_parsed(json.loads(to_decode))
+
+    def decode_parsed(self, parsed_json: Optional[List]) -> Optional["numpy.ndarray"]:
+        if parsed_json is None:
+            return None
+        return numpy.asarray(parsed_json, dtype=self.DTYPE)
+
+    def decode_parsed_many(self, parsed_jsons: Iterable[Optional[List]]) -> List[Optional["numpy.ndarray"]]:
+        parsed_jsons = list(parsed_jsons)
+        if self.DTYPE is not None and len(parsed_jsons) > 1 \
+                and all(isinstance(parsed_json, list) for parsed_json in parsed_jsons) \
+                and len({len(parsed_json) for parsed_json in parsed_jsons}) == 1:
+            # Arrays of the same length are converted together when their type does not depend on the values of the
+            # other arrays, then copied so that each array does not keep the others in memory
+            try:
+                return [array.copy() for array in numpy.array(parsed_jsons, dtype=self.DTYPE)]
+            except ValueError:
+                # Arrays are of different shapes in a lower dimension
+                pass
+        return [self.decode_parsed(parsed_json) for parsed_json in parsed_jsons]
+
+
+class NumpyArrayBase64JSONEncoder(JSONEncoder):
+    """
+    JSON encoder for numpy arrays to base64 encoded binary data, alongside the type and shape of the array, e.g.
+    `{"dtype": "<f8", "shape": [2], "data": "AAAAAAAA8D8AAAAAAAAAQA=="}`.
+    """
+    def __init__(self, *args, **kwargs):
+        _check_numpy_installed(self)
+        super().__init__(*args, **kwargs)
+
+    def default(self, to_encode: "numpy.ndarray") -> Dict:
+        if to_encode.dtype.hasobject:
+            raise ValueError("Arrays of Python objects cannot be encoded as binary data: %s" % to_encode)
+        return {
+            "dtype": to_encode.dtype.str,
+            "shape": list(to_encode.shape),
+            "data": base64.b64encode(numpy.ascontiguousarray(to_encode).tobytes()).decode("ascii")
+        }
+
+
+class NumpyArrayBase64JSONDecoder(ParsedJSONDecoder):
+    """
+    JSON decoder for numpy arrays from base64 encoded binary data, as encoded by `NumpyArrayBase64JSONEncoder`.
+    """
+    def __init__(self, *args, **kwargs):
+        _check_numpy_installed(self)
+        super().__init__(*args, **kwargs)
+
+    def decode(self, to_decode: str, **kwargs) -> Optional["numpy.ndarray"]:
+        return self.decode_parsed(json.loads(to_decode))
+
+    def decode_parsed(self, parsed_json: Optional[Dict]) -> Optional["numpy.ndarray"]:
+        if parsed_json is None:
+            return None
+        # Using a (writable) `bytearray` buffer so the array is writable without being copied
+        data = bytearray(base64.b64decode(parsed_json["data"]))
+        return numpy.frombuffer(data, dtype=parsed_json["dtype"]).reshape(parsed_json["shape"])
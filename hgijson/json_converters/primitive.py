@@ -1,9 +1,7 @@
 import json
 from datetime import datetime, timezone
 from json import JSONDecoder, JSONEncoder
-from typing import Any, TypeVar
-
-from dateutil.parser import parser
+from typing import Any, TypeVar, Iterable, List
 
 from hgijson.json_converters.interfaces import ParsedJSONDecoder
 
@@ -65,18 +63,37 @@ class DatetimeISOFormatJSONEncoder(JSONEncoder):
     def default(self, to_encode: datetime) -> str:
         return to_encode.isoformat()
 
+    def default_many(self, to_encode: Iterable[datetime]) -> List[str]:
+        return [value.isoformat() for value in to_encode]
+
 
 class DatetimeISOFormatJSONDecoder(ParsedJSONDecoder):
     """
     JSON decoder for datetime as ISO 8601 formatted string.
     """
-    _DATE_PARSER = parser()
+    # Created when first used as importing `dateutil` is slow
+    _DATE_PARSER = None
 
     def decode(self, to_decode: str, **kwargs) -> str:
         return self.decode_parsed(json.loads(to_decode))
 
     def decode_parsed(self, parsed_json: str) -> str:
-        return DatetimeISOFormatJSONDecoder._DATE_PARSER.parse(parsed_json)
+        return DatetimeISOFormatJSONDecoder._get_date_parser().parse(parsed_json)
+
+    def decode_parsed_many(self, parsed_jsons: Iterable[str]) -> List[datetime]:
+        parse = DatetimeISOFormatJSONDecoder._get_date_parser().parse
+        return [parse(parsed_json) for parsed_json in parsed_jsons]
+
+    @staticmethod
+    def _get_date_parser() -> "parser":
+        """
+        Gets the parser of ISO 8601 formatted strings.
+        :return: the parser
+        """
+        if DatetimeISOFormatJSONDecoder._DATE_PARSER is None:
+            from dateutil.parser import parser
+            DatetimeISOFormatJSONDecoder._DATE_PARSER = parser()
+        return DatetimeISOFormatJSONDecoder._DATE_PARSER
 
 
 class DatetimeEpochJSONEncoder(JSONEncoder):
@@ -87,6 +104,9 @@ class DatetimeEpochJSONEncoder(JSONEncoder):
     def default(self, to_encode: datetime) -> int:
         return int(to_encode.timestamp())
 
+    def default_many(self, to_encode: Iterable[datetime]) -> List[int]:
+        return [int(value.timestamp()) for value in to_encode]
+
 
 class DatetimeEpochJSONDecoder(JSONDecoder):
     """
@@ -94,3 +114,14 @@ class DatetimeEpochJSONDecoder(JSONDecoder):
     """
     def decode(self, to_decode: str, **kwargs) -> datetime:
         return datetime.fromtimestamp(int(to_decode), timezone.utc)
+
+    def decode_parsed_many(self, parsed_jsons: Iterable[int]) -> List[datetime]:
+        fromtimestamp = datetime.fromtimestamp
+        utc = timezone.utc
+        decoded = []
+        for parsed_json in parsed_jsons:
+            if type(parsed_json) is not int:
+                # Only JSON integers are decoded by `decode`
+                raise ValueError("Seconds since the epoch must be an integer: %r" % (parsed_json, ))
+            decoded.append(fromtimestamp(parsed_json, utc))
+        return decoded
@@ -0,0 +1,292 @@
+import json
+import re
+from json import JSONDecoder, JSONDecodeError, JSONEncoder
+from json.decoder import JSONArray, WHITESPACE, scanstring
+from typing import Any, Iterator, List, Optional, Union, Match, Dict, Tuple
+from uuid import uuid4
+
+from hgijson.custom_types import PrimitiveJsonType
+from hgijson.json_converters.interfaces import ParsedJSONDecoder
+
+# Denotes that raw JSON has not been parsed
+_UNPARSED = object()
+
+# Paths of the JSON properties that hold raw JSON, where each property name maps to the paths in the value of the
+# property (applied to each item of an array value), or to `None` if the value is raw JSON
+_RawJSONPaths = Dict[str, Optional["_RawJSONPaths"]]
+
+# Encoded placeholder of raw JSON, with the nonce of the fragments of raw JSON that it is in and its index in them
+_PLACEHOLDER_PATTERN = re.compile("\"([0-9a-f]{32}):(\\d+)\"")
+
+
+class RawJSON:
+    """
+    JSON that is kept as text, rather than decoded, and is embedded verbatim in the JSON of encoders that support it
+    (all of the encoders in this library), rather than being encoded.
+    """
+    __slots__ = ("_text", "_parsed")
+
+    def __init__(self, text: str):
+        """
+        Constructor.
+        :param text: the JSON, which is not validated so must be valid
+        """
+        self._text = text   # type: Optional[str]
+        self._parsed = _UNPARSED
+
+    @classmethod
+    def from_parsed(cls, parsed_json: PrimitiveJsonType) -> "RawJSON":
+        """
+        Creates raw JSON from JSON that has been parsed, which is only rendered as text if its text is got.
+        :param parsed_json: the parsed JSON
+        :return: the raw JSON
+        """
+        raw_json = cls.__new__(cls)
+        raw_json._text = None
+        raw_json._parsed = parsed_json
+        return raw_json
+
+    @property
+    def text(self) -> str:
+        """
+        Gets the JSON as text.
+        :return: the JSON
+        """
+        if self._text is None:
+            self._text = json.dumps(self._parsed)
+        return self._text
+
+    def parse(self) -> PrimitiveJsonType:
+        """
+        Parses the JSON (once), returning the same parsed value each time, which therefore must not be modified.
+        :return: the parsed JSON
+        """
+        if self._parsed is _UNPARSED:
+            self._parsed = json.loads(self._text)
+        return self._parsed
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, RawJSON):
+            return False
+        return self.parse() == other.parse()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (type(self).__name__, self.text)
+
+
+class _RawJSONFragments:
+    """
+    Text of raw JSON, encoded as placeholder strings that are then replaced by the text.
+    """
+    def __init__(self):
+        # Random so that the placeholders cannot be confused with encoded strings
+        self._nonce = uuid4().hex
+        self._texts = []    # type: List[str]
+
+    def add(self, text: str) -> str:
+        """
+        Adds the given text of raw JSON.
+        :param text: the text
+        :return: the placeholder string to encode in place of the raw JSON
+        """
+        self._texts.append(text)
+        return "%s:%d" % (self._nonce, len(self._texts) - 1)
+
+    def splice(self, encoded: str) -> str:
+        """
+        Replaces the encoded placeholders in the given encoded JSON with the text of the raw JSON that they represent.
+        :param encoded: the encoded JSON
+        :return: the encoded JSON with the raw JSON spliced in
+        """
+        if self._nonce not in encoded:
+            return encoded
+        return _PLACEHOLDER_PATTERN.sub(self._replace_placeholder, encoded)
+
+    def _replace_placeholder(self, match: Match) -> str:
+        """
+        Gets the text of the raw JSON that the given matched placeholder represents.
+        :param match: the match of the encoded placeholder
+        :return: the text of the raw JSON, else the match if it is not a placeholder of these fragments
+        """
+        if match.group(1) != self._nonce:
+            return match.group(0)
+        return self._texts[int(match.group(2))]
+
+
+class RawJSONEmbeddingEncoder(JSONEncoder):
+    """
+    JSON encoder that embeds the text of `RawJSON` values verbatim in the JSON that it encodes, rather than encoding
+    them. `RawJSON` is kept in the output of `default` for an encoder of the JSON that contains it to embed.
+    """
+    # Whether the encoder is encoding JSON, in which raw JSON is embedded
+    _embedding_raw_json = False
+    # Text of the raw JSON embedded in the JSON being encoded, created when the first raw JSON is embedded
+    _raw_json_fragments = None     # type: Optional[_RawJSONFragments]
+
+    def default(self, to_encode: Any) -> Union[PrimitiveJsonType, RawJSON]:
+        if isinstance(to_encode, RawJSON):
+            if not self._embedding_raw_json:
+                return to_encode
+            elif to_encode._text is None:
+                # Never rendered as text so encoded as parsed
+                return to_encode._parsed
+            if self._raw_json_fragments is None:
+                self._raw_json_fragments = _RawJSONFragments()
+            return self._raw_json_fragments.add(to_encode._text)
+        return super().default(to_encode)
+
+    def iterencode(self, obj: Any, _one_shot: bool=False) -> Union[List[str], Iterator[str]]:
+        if _one_shot:
+            self._embedding_raw_json = True
+            try:
+                chunks = super().iterencode(obj, _one_shot)
+                if not isinstance(chunks, (list, tuple)):
+                    chunks = list(chunks)
+                fragments = self._raw_json_fragments
+            finally:
+                self._embedding_raw_json = False
+                self._raw_json_fragments = None
+            return chunks if fragments is None else [fragments.splice("".join(chunks))]
+        return self._iterencode_spliced(obj)
+
+    def _iterencode_spliced(self, obj: Any) -> Iterator[str]:
+        """
+        Encodes the given object as chunks of JSON, in which raw JSON is spliced.
+        :param obj: the object to encode
+        :return: the chunks of JSON
+        """
+        self._embedding_raw_json = True
+        try:
+            for chunk in super().iterencode(obj):
+                # Encoded strings (and therefore placeholders) are never split between chunks
+                if self._raw_json_fragments is not None:
+                    chunk = self._raw_json_fragments.splice(chunk)
+                yield chunk
+        finally:
+            self._embedding_raw_json = False
+            self._raw_json_fragments = None
+
+
+def _skip_whitespace(json_as_string: str, index: int) -> int:
+    """
+    Gets the index of the first character that is not whitespace, from the given index in the given JSON.
+    :param json_as_string: the JSON
+    :param index: the index to start from
+    :return: the index of the first character that is not whitespace
+    """
+    return WHITESPACE.match(json_as_string, index).end()
+
+
+def _scan_value(decoder: JSONDecoder, json_as_string: str, index: int) -> Tuple[PrimitiveJsonType, int]:
+    """
+    Parses the JSON value at the given index in the given JSON, in the same way as the given decoder.
+    :param decoder: the decoder
+    :param json_as_string: the JSON
+    :param index: the index of the value
+    :return: tuple where the first element is the parsed value and the second is the index of the end of the value
+    :raises JSONDecodeError: raised if there is not a valid value at the index
+    """
+    try:
+        return decoder.scan_once(json_as_string, index)
+    except StopIteration as e:
+        raise JSONDecodeError("Expecting value", json_as_string, e.value) from None
+
+
+def _scan_with_raw_json(decoder: JSONDecoder, json_as_string: str, index: int, raw_json_paths: _RawJSONPaths) \
+        -> Tuple[PrimitiveJsonType, int]:
+    """
+    Parses the JSON value at the given index in the given JSON, in the same way as the given decoder, except that the
+    values of the properties at the given paths are parsed as `RawJSON` that keeps their text.
+    :param decoder: the decoder
+    :param json_as_string: the JSON
+    :param index: the index of the value
+    :param raw_json_paths: the paths of the properties that hold raw JSON
+    :return: tuple where the first element is the parsed value and the second is the index of the end of the value
+    :raises JSONDecodeError: raised if there is not a valid value at the index
+    """
+    character = json_as_string[index:index + 1]
+    if character == "[":
+        return JSONArray((json_as_string, index + 1), lambda json_as_string, index: _scan_with_raw_json(
+            decoder, json_as_string, index, raw_json_paths))
+    elif character != "{":
+        return _scan_value(decoder, json_as_string, index)
+
+    pairs = []  # type: List[Tuple[str, PrimitiveJsonType]]
+    index = _skip_whitespace(json_as_string, index + 1)
+    while json_as_string[index:index + 1] != "}":
+        if json_as_string[index:index + 1] != "\"":
+            raise JSONDecodeError("Expecting property name enclosed in double quotes", json_as_string, index)
+        key, index = scanstring(json_as_string, index + 1, decoder.strict)
+        index = _skip_whitespace(json_as_string, index)
+        if json_as_string[index:index + 1] != ":":
+            raise JSONDecodeError("Expecting ':' delimiter", json_as_string, index)
+        index = _skip_whitespace(json_as_string, index + 1)
+        if key not in raw_json_paths:
+            value, index = _scan_value(decoder, json_as_string, index)
+        elif raw_json_paths[key] is None:
+            start = index
+            value, index = _scan_value(decoder, json_as_string, index)
+            if value is not None:
+                # Parsed as the value had to be scanned to find its end
+                text = json_as_string[start:index]
+                value, parsed = RawJSON(text), value
+                value._parsed = parsed
+        else:
+            value, index = _scan_with_raw_json(decoder, json_as_string, index, raw_json_paths[key])
+        pairs.append((key, value))
+
+        index = _skip_whitespace(json_as_string, index)
+        if json_as_string[index:index + 1] == ",":
+            index = _skip_whitespace(json_as_string, index + 1)
+            if json_as_string[index:index + 1] == "}":
+                raise JSONDecodeError("Expecting property name enclosed in double quotes", json_as_string, index)
+        elif json_as_string[index:index + 1] != "}":
+            raise JSONDecodeError("Expecting ',' delimiter", json_as_string, index)
+
+    if decoder.object_pairs_hook is not None:
+        return decoder.object_pairs_hook(pairs), index + 1
+    parsed_object = dict(pairs)
+    if decoder.object_hook is not None:
+        parsed_object = decoder.object_hook(parsed_object)
+    return parsed_object, index + 1
+
+
+def _decode_with_raw_json(decoder: JSONDecoder, json_as_string: str, raw_json_paths: _RawJSONPaths) \
+        -> PrimitiveJsonType:
+    """
+    Parses the given JSON in the same way as the given decoder's `decode`, except that the values of the properties at
+    the given paths are parsed as `RawJSON` that keeps their text (and their parsed value).
+    :param decoder: the decoder
+    :param json_as_string: the JSON
+    :param raw_json_paths: the paths of the properties that hold raw JSON
+    :return: the parsed JSON
+    :raises JSONDecodeError: raised if the JSON is invalid
+    """
+    parsed, index = _scan_with_raw_json(decoder, json_as_string, _skip_whitespace(json_as_string, 0), raw_json_paths)
+    index = _skip_whitespace(json_as_string, index)
+    if index != len(json_as_string):
+        raise JSONDecodeError("Extra data", json_as_string, index)
+    return parsed
+
+
+class RawJSONEncoder(RawJSONEmbeddingEncoder):
+    """
+    JSON encoder of `RawJSON`, which is embedded verbatim.
+    """
+
+
+class RawJSONDecoder(ParsedJSONDecoder):
+    """
+    JSON decoder to `RawJSON`. JSON given as text is kept verbatim, without being parsed, whilst parsed JSON is only
+    rendered as text if its text is got. Mapping decoders keep the text of the properties that they decode with this
+    decoder, which is given as parsed `RawJSON`.
+    """
+    def decode(self, json_as_string: str, **kwargs) -> RawJSON:
+        return RawJSON(json_as_string)
+
+    def decode_parsed(self, parsed_json: Union[PrimitiveJsonType, RawJSON]) -> Optional[RawJSON]:
+        if isinstance(parsed_json, RawJSON):
+            return parsed_json
+        return RawJSON.from_parsed(parsed_json) if parsed_json is not None else None
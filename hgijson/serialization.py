@@ -1,9 +1,229 @@
+import threading
 from abc import ABCMeta, abstractmethod
-from typing import Any, Generic, Union, Dict, List, Optional, Iterable, Type, Callable
+from collections.abc import Set
+from contextlib import contextmanager
+from sys import intern
+from typing import Any, Generic, Union, Dict, List, Optional, Iterable, Type, Callable, Tuple, Generator, Sized
 
 from hgijson.custom_types import SerializableType, PrimitiveUnionType, PrimitiveJsonType
 
 
+class SerializationLimitExceededError(ValueError):
+    """
+    Raised when a limit on serialization or deserialization (see `SerializationLimits`) is exceeded.
+    """
+    def __init__(self, limit: str, maximum: int):
+        """
+        Constructor.
+        :param limit: the name of the limit that was exceeded (e.g. "max_depth")
+        :param maximum: the value of the limit
+        """
+        super().__init__("Limit exceeded: %s=%d" % (limit, maximum))
+        self.limit = limit
+        self.maximum = maximum
+
+
+class SerializationLimits:
+    """
+    Limits on the work done to serialize or deserialize an object (or collection of objects), which are checked as the
+    work is done, so that a `SerializationLimitExceededError` is raised as soon as a limit is exceeded.
+    """
+    def __init__(self, *, max_bytes: int=None, max_depth: int=None, max_collection_length: int=None,
+                 max_objects: int=None):
+        """
+        Constructor.
+        :param max_bytes: maximum size of the serialized representation (e.g. the UTF-8 encoding of JSON), enforced by
+        serializers and deserializers of representations that have a size
+        :param max_depth: maximum depth to which objects are nested (top level objects are at depth 1)
+        :param max_collection_length: maximum number of items in a collection (e.g. a list of objects or the value of a
+        property, including the collections nested in it) or of properties of a JSON object
+        :param max_objects: maximum number of objects serialized or deserialized (including nested objects)
+        :raises ValueError: raised if a limit is not positive
+        """
+        for name, value in (("max_bytes", max_bytes), ("max_depth", max_depth),
+                            ("max_collection_length", max_collection_length), ("max_objects", max_objects)):
+            if value is not None and value < 1:
+                raise ValueError("Limit \"%s\" must be positive: %d" % (name, value))
+        self.max_bytes = max_bytes
+        self.max_depth = max_depth
+        self.max_collection_length = max_collection_length
+        self.max_objects = max_objects
+
+    def __repr__(self) -> str:
+        return "%s(max_bytes=%r, max_depth=%r, max_collection_length=%r, max_objects=%r)" \
+               % (type(self).__name__, self.max_bytes, self.max_depth, self.max_collection_length, self.max_objects)
+
+
+class _SerializationLimitTracker:
+    """
+    Tracks the work done by a serialization or deserialization against limits.
+    """
+    def __init__(self, limits: SerializationLimits):
+        """
+        Constructor.
+        :param limits: the limits
+        """
+        self.limits = limits
+        self.objects = 0
+        self.depth = 0
+
+    def enter(self, objects: int):
+        """
+        Tracks the start of the (de)serialization of the given number of objects, nested one level deeper than those
+        currently being (de)serialized.
+        :param objects: the number of objects
+        :raises SerializationLimitExceededError: raised if the depth or the number of objects exceeds its limit
+        """
+        self.depth += 1
+        self.objects += objects
+        if self.limits.max_depth is not None and self.depth > self.limits.max_depth:
+            raise SerializationLimitExceededError("max_depth", self.limits.max_depth)
+        if self.limits.max_objects is not None and self.objects > self.limits.max_objects:
+            raise SerializationLimitExceededError("max_objects", self.limits.max_objects)
+
+    def exit(self):
+        """
+        Tracks the end of the (de)serialization of the objects at the deepest level.
+        """
+        self.depth -= 1
+
+    def check_collection(self, collection: Sized):
+        """
+        Checks the length of the given collection.
+        :param collection: the collection
+        :raises SerializationLimitExceededError: raised if the collection's length exceeds its limit
+        """
+        if self.limits.max_collection_length is not None and len(collection) > self.limits.max_collection_length:
+            raise SerializationLimitExceededError("max_collection_length", self.limits.max_collection_length)
+
+    def check_value(self, value: Any):
+        """
+        Checks the lengths of the collections in the given value (e.g. a primitive JSON value), including the
+        collections nested in other collections.
+        :param value: the value
+        :raises SerializationLimitExceededError: raised if the length of a collection exceeds its limit
+        """
+        if self.limits.max_collection_length is None:
+            return
+        # Explicit stack so that deeply nested values are not limited by Python's recursion limit
+        to_check = [value]
+        while len(to_check) > 0:
+            value = to_check.pop()
+            if isinstance(value, dict):
+                self.check_collection(value)
+                to_check.extend(value.values())
+            elif isinstance(value, (list, tuple, Set)):
+                self.check_collection(value)
+                to_check.extend(value)
+
+
+# Tracker of the limits of the serialization or deserialization being done by each thread
+_limit_tracking = threading.local()
+
+
+def _get_limit_tracker() -> Optional[_SerializationLimitTracker]:
+    """
+    Gets the tracker of the limits of the serialization or deserialization being done by the current thread.
+    :return: the tracker else `None` if there are no limits
+    """
+    return getattr(_limit_tracking, "tracker", None)
+
+
+@contextmanager
+def _tracking_limits(limits: Optional[SerializationLimits]):
+    """
+    Context in which the current thread tracks the work done by serializations and deserializations against the given
+    limits, unless the thread is already tracking limits (in which case the work is tracked against those limits).
+    :param limits: the limits (no limits are tracked if `None`)
+    """
+    if limits is None or _get_limit_tracker() is not None:
+        yield
+    else:
+        _limit_tracking.tracker = _SerializationLimitTracker(limits)
+        try:
+            yield
+        finally:
+            _limit_tracking.tracker = None
+
+
+def _check_collection_length(collection: Sized, limits: Optional[SerializationLimits]):
+    """
+    Checks the length of the given collection against the limits that the current thread is tracking, else the given
+    limits.
+    :param collection: the collection
+    :param limits: the limits (nothing is checked if `None` and the thread is not tracking limits)
+    :raises SerializationLimitExceededError: raised if the collection's length exceeds its limit
+    """
+    with _tracking_limits(limits):
+        limit_tracker = _get_limit_tracker()
+        if limit_tracker is not None:
+            limit_tracker.check_collection(collection)
+
+
+def _flatten_objects(items: Iterable[Any], objects: List[Any],
+                     limit_tracker: Optional[_SerializationLimitTracker]=None) -> List[Any]:
+    """
+    Flattens the objects in the given items, which may contain `None` and (nested) collections of objects, into the
+    given list of objects.
+    :param items: the items to flatten
+    :param objects: list to which the objects are appended
+    :param limit_tracker: tracker against which the lengths of the collections are checked
+    :return: the layout of the items, to be used with `_unflatten_objects`, where each object is represented by its
+    index in the list of objects
+    """
+    layout = []
+    for item in items:
+        if item is None:
+            layout.append(None)
+        elif isinstance(item, list):
+            if limit_tracker is not None:
+                limit_tracker.check_collection(item)
+            layout.append(_flatten_objects(item, objects, limit_tracker))
+        else:
+            layout.append(len(objects))
+            objects.append(item)
+    return layout
+
+
+def _unflatten_objects(layout: List[Any], objects: List[Any]) -> List[Any]:
+    """
+    Reverses `_flatten_objects`, replacing the objects in the layout with the given objects.
+    :param layout: the layout, produced by `_flatten_objects`
+    :param objects: the objects, in the order in which they were flattened
+    :return: the unflattened items
+    """
+    return [objects[item] if type(item) is int else (_unflatten_objects(item, objects) if item is not None else None)
+            for item in layout]
+
+
+def _run_iteratively(generator: Generator, limits: SerializationLimits=None) -> Any:
+    """
+    Runs the given generator, where the generator (and those that it yields) yield generators whose return values are
+    required to continue. The yielded generators are run using an explicit stack, rather than recursively, so the depth
+    to which generators are nested is not limited by Python's recursion limit.
+    :param generator: the generator to run
+    :param limits: limits on the work done by the generator (see `_tracking_limits`)
+    :return: the value returned by the generator
+    """
+    if limits is not None:
+        with _tracking_limits(limits):
+            return _run_iteratively(generator)
+
+    stack = [generator]
+    value = None
+    while True:
+        try:
+            child = stack[-1].send(value)
+        except StopIteration as e:
+            stack.pop()
+            if len(stack) == 0:
+                return e.value
+            value = e.value
+        else:
+            stack.append(child)
+            value = None
+
+
 class PropertyMapping:
     """
     Model of a mapping between a json property and a property of an object.
@@ -19,7 +239,10 @@ class PropertyMapping:
             deserializer_cls: Type["Deserializer"]=None,
             optional: bool=False,
             collection_factory: Callable[[Iterable], Any]=lambda items: list(items),
-            collection_iter: Callable[[Any], Iterable]=lambda collection: iter(collection)):
+            collection_iter: Callable[[Any], Iterable]=lambda collection: iter(collection),
+            serialized_property_parents: Iterable[str]=None,
+            intern_strings: bool=False,
+            canonicalize: bool=False):
         """
         Constructor.
         :param object_property_name: defines the object property to assign the value returned by
@@ -40,6 +263,15 @@ class PropertyMapping:
         PrimitiveDeserializer)
         :param optional: whether the property is optional - will ignore if `None` in serialized representation and will
         not serialize if `None` in object
+        :param collection_factory: creates a collection of the property's type from deserialized items
+        :param collection_iter: iterates over the items in a collection of the property's type
+        :param serialized_property_parents: names of the properties, from the root of the serialized object, in which
+        the serialized property is nested. If given, `serialized_property_getter` and `serialized_property_setter` get
+        and set the property in its innermost parent
+        :param intern_strings: whether deserialized strings (or the strings in a deserialized collection) are interned
+        (see `sys.intern`), so that equal strings share one instance
+        :param canonicalize: whether equal serialized values of the property, deserialized together (e.g. in a list of
+        objects), are deserialized to one shared instance
         """
         if object_constructor_parameter_name is not None:
             if serialized_property_getter is None:
@@ -61,6 +293,41 @@ class PropertyMapping:
                 raise ValueError("`object_constructor_argument_modifier` cannot be used without "
                                  "`object_constructor_parameter_name` being set.")
 
+        # Getter and setter relative to the innermost parent of the serialized property, used by serializers and
+        # deserializers to resolve the parents shared by mappings once per object
+        self.relative_serialized_property_getter = serialized_property_getter
+        self.relative_serialized_property_setter = serialized_property_setter
+        self.serialized_property_parents = None     # type: Optional[Tuple[str, ...]]
+
+        if serialized_property_parents is not None:
+            serialized_property_parents = tuple(serialized_property_parents)
+            self.serialized_property_parents = serialized_property_parents
+
+            if serialized_property_getter is not None:
+                relative_serialized_property_getter = serialized_property_getter
+
+                def serialized_property_getter(serialized: Dict):
+                    top_level_serialized = serialized
+                    for ancestor in serialized_property_parents:
+                        serialized = serialized.get(ancestor, None)
+                        if serialized is None:
+                            if optional:
+                                return None
+                            else:
+                                raise KeyError("Parent keys missing \"%s\" in the input: %s"
+                                               % (".".join(serialized_property_parents), top_level_serialized))
+                    return relative_serialized_property_getter(serialized)
+
+            if serialized_property_setter is not None:
+                relative_serialized_property_setter = serialized_property_setter
+
+                def serialized_property_setter(serialized: Dict, value: Any):
+                    for ancestor in serialized_property_parents:
+                        if ancestor not in serialized:
+                            serialized[ancestor] = {}
+                        serialized = serialized[ancestor]
+                    relative_serialized_property_setter(serialized, value)
+
         from hgijson.serializers import PrimitiveSerializer, PrimitiveDeserializer
 
         self.serialized_property_getter = serialized_property_getter
@@ -74,6 +341,8 @@ class PropertyMapping:
         self.optional = optional
         self.collection_factory = collection_factory
         self.collection_iter = collection_iter
+        self.intern_strings = intern_strings
+        self.canonicalize = canonicalize
 
     def __str__(self) -> str:
         string_builder = []
@@ -124,32 +393,148 @@ class Serializer(Generic[SerializableType, PrimitiveUnionType], metaclass=ABCMet
         if serializable is None:
             # Implements #17
             return None
-        elif isinstance(serializable, List):
-            return [self.serialize(item) for item in serializable]
+        elif isinstance(serializable, list):
+            _check_collection_length(serializable, self._get_limits())
+            return self.serialize_many(serializable)
         else:
-            serialized = self._create_serialized_container()
+            return _run_iteratively(self._serialize_objects([serializable]), self._get_limits())[0]
+
+    def serialize_many(self, serializables: Iterable[Optional[Union[SerializableType, List[SerializableType]]]]) \
+            -> List[PrimitiveJsonType]:
+        """
+        Serializes each of the given serializable objects (or collections of serializable objects).
+
+        The objects are serialized together, a property at a time, so that the serializer of each property is only
+        called once for all of the objects.
+        :param serializables: the objects to serialize
+        :return: the serializations of the objects, in the same order as those given
+        """
+        return _run_iteratively(self._serialize_many(serializables), self._get_limits())
+
+    def _serialize_many(self, serializables: Iterable[Optional[Union[SerializableType, List[SerializableType]]]]) \
+            -> Generator:
+        """
+        Generator that serializes the given objects in the same way as `serialize_many` (see `_run_iteratively`).
+        :param serializables: the objects to serialize
+        :return: the serializations of the objects, in the same order as those given
+        """
+        objects = []    # type: List[SerializableType]
+        layout = _flatten_objects(serializables, objects, _get_limit_tracker())
+        objects_serialized = (yield self._serialize_objects(objects)) if len(objects) > 0 else []
+        return _unflatten_objects(layout, objects_serialized)
+
+    def _get_iterative_serializer(self) -> Optional["Serializer"]:
+        """
+        Gets the serializer whose `_serialize_many` generator serializes values in the same way as this serializer's
+        `serialize_many`, allowing nested objects to be serialized without recursion.
+        :return: the serializer else `None` if values cannot be serialized this way
+        """
+        if type(self).serialize_many is Serializer.serialize_many:
+            return self
+        return None
+
+    def _serialize_objects(self, serializables: List[SerializableType]) -> Generator:
+        """
+        Generator that serializes the given objects, a property at a time (see `_run_iteratively`).
+        :param serializables: the objects to serialize (not including `None` or collections)
+        :return: the serializations of the objects
+        """
+        limit_tracker = _get_limit_tracker()
+        if limit_tracker is not None:
+            limit_tracker.enter(len(serializables))
+        serialized = [self._create_serialized_container() for _ in serializables]
+        # Parents of serialized properties, created once per object when first needed
+        parents_cache = dict()   # type: Dict[Tuple[str, ...], List[Any]]
+
+        for mapping in self._property_mappings:
+            if mapping.object_property_getter is not None and mapping.serialized_property_setter is not None:
+                values = [mapping.object_property_getter(serializable) for serializable in serializables]
+                if mapping.optional:
+                    indices = [i for i, value in enumerate(values) if value is not None]
+                    values = [values[i] for i in indices]
+                else:
+                    indices = range(len(values))
 
-            for mapping in self._property_mappings:
-                if mapping.object_property_getter is not None and mapping.serialized_property_setter is not None:
-                    value = mapping.object_property_getter(serializable)
-                    if not (mapping.optional and value is None):
-                        if isinstance(value, type(mapping.collection_factory([]))):
-                            value = list(mapping.collection_iter(value))
-                        encoded_value = self._serialize_property_value(value, mapping.serializer_cls)
-                        mapping.serialized_property_setter(serialized, encoded_value)
+                collection_type = type(mapping.collection_factory([]))
+                collection_iter = mapping.collection_iter
+                sort_key = self._get_unordered_collection_sort_key() if issubclass(collection_type, Set) else None
+                if sort_key is not None:
+                    unordered = [isinstance(value, collection_type) for value in values]
+                values = [list(collection_iter(value)) if isinstance(value, collection_type) else value
+                          for value in values]
 
-            return serialized
+                serializer = self._create_serializer_of_type_with_cache(mapping.serializer_cls)
+                assert serializer is not None
+                iterative_serializer = serializer._get_iterative_serializer()
+                if iterative_serializer is not None:
+                    encoded_values = yield iterative_serializer._serialize_many(values)
+                else:
+                    if limit_tracker is not None:
+                        for value in values:
+                            limit_tracker.check_value(value)
+                    encoded_values = serializer.serialize_many(values)
+                if sort_key is not None:
+                    encoded_values = [sorted(encoded_value, key=sort_key) if is_unordered else encoded_value
+                                      for encoded_value, is_unordered in zip(encoded_values, unordered)]
+
+                if mapping.serialized_property_parents is None:
+                    serialized_property_setter = mapping.serialized_property_setter
+                    containers = [serialized[i] for i in indices]
+                else:
+                    serialized_property_setter = mapping.relative_serialized_property_setter
+                    containers = self._get_serialized_parents(
+                        mapping.serialized_property_parents, serialized, indices, parents_cache)
+                for container, encoded_value in zip(containers, encoded_values):
+                    serialized_property_setter(container, encoded_value)
 
-    def _serialize_property_value(self, to_serialize: Any, serializer_cls: Type) -> Any:
+        if limit_tracker is not None:
+            limit_tracker.exit()
+        return serialized
+
+    def _get_limits(self) -> Optional[SerializationLimits]:
         """
-        Serializes the given value using the given serializer.
-        :param to_serialize: the value to deserialize
-        :param serializer_cls: the type of serializer to use
-        :return: serialized value
+        Gets the limits on the work done by this serializer, when not used by another serializer.
+        :return: the limits else `None` if there are none
         """
-        serializer = self._create_serializer_of_type_with_cache(serializer_cls)
-        assert serializer is not None
-        return serializer.serialize(to_serialize)
+        return None
+
+    def _get_unordered_collection_sort_key(self) -> Optional[Callable[[Any], Any]]:
+        """
+        Gets the key by which the serialized items of unordered collections (e.g. sets) are sorted, so that their
+        serialization is deterministic.
+        :return: the key else `None` if the items are not sorted
+        """
+        return None
+
+    def _get_serialized_parents(self, parents: Tuple[str, ...], serialized: List[Any], indices: Iterable[int],
+                                parents_cache: Dict[Tuple[str, ...], List[Any]]) -> List[Any]:
+        """
+        Gets the innermost of the given parent properties of the serialized objects with the given indices, creating
+        any parents that do not exist.
+        :param parents: names of the parent properties, from the root of the serialized objects
+        :param serialized: the serialized objects
+        :param indices: indices of the serialized objects to get the parents of
+        :param parents_cache: cache of parents, indexed by their names from the root of the serialized objects, where
+        the parent of each serialized object is at the object's index (`None` if yet to be got)
+        :return: the innermost parents of the serialized objects with the given indices, in the same order
+        """
+        containers = parents_cache.get(parents)
+        if containers is None:
+            containers = parents_cache[parents] = [None] * len(serialized)
+
+        missing = [i for i in indices if containers[i] is None]
+        if len(missing) > 0:
+            if len(parents) == 1:
+                grandparents = [serialized[i] for i in missing]
+            else:
+                grandparents = self._get_serialized_parents(parents[:-1], serialized, missing, parents_cache)
+            name = parents[-1]
+            for i, grandparent in zip(missing, grandparents):
+                if name not in grandparent:
+                    grandparent[name] = self._create_serialized_container()
+                containers[i] = grandparent[name]
+
+        return [containers[i] for i in indices]
 
     def _create_serializer_of_type_with_cache(self, serializer_type: Type) -> "Serializer":
         """
@@ -195,57 +580,226 @@ class Deserializer(Generic[SerializableType, PrimitiveUnionType], metaclass=ABCM
         if to_deserialize is None:
             # Implements #17
             return None
-        elif isinstance(to_deserialize, List):
-            deserialized = []
-            for item in to_deserialize:
-                item_deserialized = self.deserialize(item)
-                deserialized.append(item_deserialized)
-            return deserialized
+        elif isinstance(to_deserialize, list):
+            _check_collection_length(to_deserialize, self._get_limits())
+            return self.deserialize_many(to_deserialize)
         else:
-            mappings_not_set_in_constructor = []    # type: List[PropertyMapping]
-
-            init_kwargs = dict()    # type: Dict[str, Any]
-            for mapping in self._property_mappings:
-                if mapping.object_constructor_parameter_name is not None:
-                    value = mapping.serialized_property_getter(to_deserialize)
-                    if not (mapping.optional and value is None):
-                        decoded_value = self._deserialize_property_value(value, mapping.deserializer_cls)
-                        if isinstance(decoded_value, list):
-                            collection = mapping.collection_factory(decoded_value)
-                            decoded_value = collection
-
-                        argument = mapping.object_constructor_argument_modifier(decoded_value)
-                        init_kwargs[mapping.object_constructor_parameter_name] = argument
-                else:
-                    mappings_not_set_in_constructor.append(mapping)
+            return _run_iteratively(self._deserialize_objects([to_deserialize]), self._get_limits())[0]
+
+    def deserialize_many(self, to_deserialize: Iterable[PrimitiveJsonType]) \
+            -> List[Optional[Union[SerializableType, List[SerializableType]]]]:
+        """
+        Deserializes each of the given representations of serialized objects (or collections of serialized objects).
+
+        The objects are deserialized together, a property at a time, so that the deserializer of each property is only
+        called once for all of the objects.
+        :param to_deserialize: the serialized objects
+        :return: the deserialized objects, in the same order as those given
+        """
+        return _run_iteratively(self._deserialize_many(to_deserialize), self._get_limits())
 
-            decoded = self._deserializable_cls(**init_kwargs)
-            assert type(decoded) == self._deserializable_cls
+    def _deserialize_many(self, to_deserialize: Iterable[PrimitiveJsonType]) -> Generator:
+        """
+        Generator that deserializes the given serialized objects in the same way as `deserialize_many` (see
+        `_run_iteratively`).
+        :param to_deserialize: the serialized objects
+        :return: the deserialized objects, in the same order as those given
+        """
+        objects = []    # type: List[PrimitiveJsonType]
+        layout = _flatten_objects(to_deserialize, objects, _get_limit_tracker())
+        objects_deserialized = (yield self._deserialize_objects(objects)) if len(objects) > 0 else []
+        return _unflatten_objects(layout, objects_deserialized)
+
+    def _get_iterative_deserializer(self) -> Optional["Deserializer"]:
+        """
+        Gets the deserializer whose `_deserialize_many` generator deserializes values in the same way as this
+        deserializer's `deserialize_many`, allowing nested objects to be deserialized without recursion.
+        :return: the deserializer else `None` if values cannot be deserialized this way
+        """
+        if type(self).deserialize_many is Deserializer.deserialize_many:
+            return self
+        return None
+
+    def _deserialize_objects(self, to_deserialize: List[PrimitiveJsonType]) -> Generator:
+        """
+        Generator that deserializes the given serialized objects, a property at a time (see `_run_iteratively`).
+        :param to_deserialize: the serialized objects (not including `None` or collections)
+        :return: the deserialized objects
+        """
+        limit_tracker = _get_limit_tracker()
+        if limit_tracker is not None:
+            limit_tracker.enter(len(to_deserialize))
+            if limit_tracker.limits.max_collection_length is not None:
+                for serialized in to_deserialize:
+                    if isinstance(serialized, dict):
+                        limit_tracker.check_collection(serialized)
+        mappings_not_set_in_constructor = []    # type: List[PropertyMapping]
+        # Parents of serialized properties, got once per object when first needed
+        parents_cache = dict()   # type: Dict[Tuple[str, ...], List[Any]]
+
+        init_kwargs = [dict() for _ in to_deserialize]    # type: List[Dict[str, Any]]
+        for mapping in self._property_mappings:
+            if mapping.object_constructor_parameter_name is not None:
+                indices, decoded_values = yield from self._deserialize_property_values(
+                    mapping, to_deserialize, parents_cache)
+                for i, decoded_value in zip(indices, decoded_values):
+                    argument = mapping.object_constructor_argument_modifier(decoded_value)
+                    init_kwargs[i][mapping.object_constructor_parameter_name] = argument
+            else:
+                mappings_not_set_in_constructor.append(mapping)
 
-            for mapping in mappings_not_set_in_constructor:
-                assert mapping.object_constructor_parameter_name is None
-                if mapping.serialized_property_getter is not None and mapping.object_property_setter is not None:
-                    value = mapping.serialized_property_getter(to_deserialize)
-                    if not (mapping.optional and value is None):
-                        decoded_value = self._deserialize_property_value(value, mapping.deserializer_cls)
-                        if isinstance(decoded_value, list):
-                            collection = mapping.collection_factory(decoded_value)
-                            decoded_value = collection
+        decoded = self._create_deserializables(init_kwargs)
+        if not self._is_trusted():
+            assert len(decoded) == 0 or type(decoded[0]) == self._deserializable_cls
+
+        for mapping in mappings_not_set_in_constructor:
+            assert mapping.object_constructor_parameter_name is None
+            if mapping.serialized_property_getter is not None and mapping.object_property_setter is not None:
+                indices, decoded_values = yield from self._deserialize_property_values(
+                    mapping, to_deserialize, parents_cache)
+                for i, decoded_value in zip(indices, decoded_values):
+                    mapping.object_property_setter(decoded[i], decoded_value)
+
+        if limit_tracker is not None:
+            limit_tracker.exit()
+        return decoded
+
+    def _get_serialized_parents(self, parents: Tuple[str, ...], to_deserialize: List[PrimitiveJsonType],
+                                parents_cache: Dict[Tuple[str, ...], List[Any]]) -> List[Any]:
+        """
+        Gets the innermost of the given parent properties of each of the given serialized objects.
+        :param parents: names of the parent properties, from the root of the serialized objects
+        :param to_deserialize: the serialized objects
+        :param parents_cache: cache of parents, indexed by their names from the root of the serialized objects
+        :return: the innermost parents of the serialized objects, in the same order, where `None` denotes that a
+        serialized object does not have the parents
+        """
+        containers = parents_cache.get(parents)
+        if containers is None:
+            if len(parents) == 1:
+                grandparents = to_deserialize
+            else:
+                grandparents = self._get_serialized_parents(parents[:-1], to_deserialize, parents_cache)
+            name = parents[-1]
+            containers = parents_cache[parents] = [grandparent.get(name, None) if grandparent is not None else None
+                                                   for grandparent in grandparents]
+        return containers
+
+    def _get_limits(self) -> Optional[SerializationLimits]:
+        """
+        Gets the limits on the work done by this deserializer, when not used by another deserializer.
+        :return: the limits else `None` if there are none
+        """
+        return None
 
-                        mapping.object_property_setter(decoded, decoded_value)
+    def _is_trusted(self) -> bool:
+        """
+        Gets whether the input of this deserializer is trusted to be valid, in which case defensive checks are skipped.
+        :return: whether the input is trusted
+        """
+        return False
 
-            return decoded
+    def _create_deserializables(self, init_kwargs: List[Dict[str, Any]]) -> List[SerializableType]:
+        """
+        Creates the deserialized objects, before any properties are set via setters.
+        :param init_kwargs: the constructor arguments of each of the objects
+        :return: the created objects
+        """
+        return [self._deserializable_cls(**kwargs) for kwargs in init_kwargs]
 
-    def _deserialize_property_value(self, to_deserialize: PrimitiveJsonType, deserializer_cls: Type) -> Any:
+    def _deserialize_property_values(self, mapping: PropertyMapping, to_deserialize: List[PrimitiveJsonType],
+                                     parents_cache: Dict[Tuple[str, ...], List[Any]]) -> Generator:
         """
-        Deserializes the given value using the given deserializer.
-        :param to_deserialize: the value to deserialize
-        :param deserializer_cls: the type of deserializer to use
-        :return: deserialized value
+        Generator that deserializes the values of the property, described by the given mapping, of each of the given
+        serialized objects using a single call to the property's deserializer (see `_run_iteratively`).
+        :param mapping: the mapping of the property
+        :param to_deserialize: the serialized objects
+        :param parents_cache: cache of the parents of serialized properties (see `_get_serialized_parents`)
+        :return: tuple where the first element is the indices of the objects that have the property set and the second
+        is the corresponding deserialized values
         """
-        deserializer = self._create_deserializer_of_type_with_cache(deserializer_cls)
+        if mapping.serialized_property_parents is None:
+            values = [mapping.serialized_property_getter(item) for item in to_deserialize]
+        else:
+            getter = mapping.relative_serialized_property_getter
+            parents = mapping.serialized_property_parents
+            containers = self._get_serialized_parents(parents, to_deserialize, parents_cache)
+            if None in containers:
+                if not mapping.optional:
+                    raise KeyError("Parent keys missing \"%s\" in the input: %s"
+                                   % (".".join(parents), to_deserialize[containers.index(None)]))
+                values = [getter(container) if container is not None else None for container in containers]
+            else:
+                values = [getter(container) for container in containers]
+        if mapping.optional:
+            indices = [i for i, value in enumerate(values) if value is not None]
+            values = [values[i] for i in indices]
+        else:
+            indices = list(range(len(values)))
+
+        canonical_indices = None    # type: Optional[List[int]]
+        if mapping.canonicalize:
+            # Equal values are deserialized once, to an instance shared by all of them
+            canonical_indices = []
+            unique_indices = dict()     # type: Dict[str, int]
+            unique_values = []
+            for value in values:
+                key = repr(value)
+                index = unique_indices.get(key)
+                if index is None:
+                    index = unique_indices[key] = len(unique_values)
+                    unique_values.append(value)
+                canonical_indices.append(index)
+            values = unique_values
+
+        deserializer = self._create_deserializer_of_type_with_cache(mapping.deserializer_cls)
         assert deserializer is not None
-        return deserializer.deserialize(to_deserialize)
+        iterative_deserializer = deserializer._get_iterative_deserializer()
+        if iterative_deserializer is not None:
+            decoded_values = yield iterative_deserializer._deserialize_many(values)
+        else:
+            limit_tracker = _get_limit_tracker()
+            if limit_tracker is not None:
+                for value in values:
+                    limit_tracker.check_value(value)
+            decoded_values = deserializer.deserialize_many(values)
+
+        if mapping.intern_strings:
+            decoded_values = [self._create_property_value(mapping, decoded_value) for decoded_value in decoded_values]
+        else:
+            collection_factory = mapping.collection_factory
+            decoded_values = [collection_factory(decoded_value) if isinstance(decoded_value, list) else decoded_value
+                              for decoded_value in decoded_values]
+        if canonical_indices is not None:
+            decoded_values = [decoded_values[i] for i in canonical_indices]
+        return indices, decoded_values
+
+    def _deserialize_property_value(self, mapping: PropertyMapping, value: PrimitiveJsonType) -> Any:
+        """
+        Deserializes the given value of the property described by the given mapping.
+        :param mapping: the mapping of the property
+        :param value: the serialized value
+        :return: the deserialized value
+        """
+        deserializer = self._create_deserializer_of_type_with_cache(mapping.deserializer_cls)
+        return self._create_property_value(mapping, deserializer.deserialize_many([value])[0])
+
+    @staticmethod
+    def _create_property_value(mapping: PropertyMapping, decoded_value: Any) -> Any:
+        """
+        Creates the value of the property described by the given mapping from the given deserialized value, creating a
+        collection of the property's type from a list and interning strings if required by the mapping.
+        :param mapping: the mapping of the property
+        :param decoded_value: the deserialized value
+        :return: the value of the property
+        """
+        if isinstance(decoded_value, list):
+            if mapping.intern_strings:
+                decoded_value = [intern(item) if type(item) is str else item for item in decoded_value]
+            return mapping.collection_factory(decoded_value)
+        elif mapping.intern_strings and type(decoded_value) is str:
+            return intern(decoded_value)
+        return decoded_value
 
     def _create_deserializer_of_type_with_cache(self, deserializer_type: Type) -> "Deserializer":
         """
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable, List
 
 from hgijson.serialization import Serializer, Deserializer
 from hgijson.custom_types import PrimitiveJsonType
@@ -14,6 +14,9 @@ class PrimitiveSerializer(Serializer):
     def serialize(self, serializable: Any) -> Any:
         return serializable
 
+    def serialize_many(self, serializables: Iterable[Any]) -> List[Any]:
+        return list(serializables)
+
     def _create_serializer_of_type(self, serializer_type: type) -> None:
         """
         Unused - implemented to satisfy the interface only.
@@ -35,6 +38,9 @@ class PrimitiveDeserializer(Deserializer):
     def deserialize(self, object_property_value_dict: PrimitiveJsonType) -> PrimitiveJsonType:
         return object_property_value_dict
 
+    def deserialize_many(self, object_property_value_dicts: Iterable[PrimitiveJsonType]) -> List[PrimitiveJsonType]:
+        return list(object_property_value_dicts)
+
     def _create_deserializer_of_type(self, deserializer_type: type) -> None:
         """
         Unused - implemented to satisfy the interface only.
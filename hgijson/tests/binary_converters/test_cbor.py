@@ -0,0 +1,46 @@
+import unittest
+
+from hgijson.binary_converters import cbor
+
+
+class TestCBOR(unittest.TestCase):
+    """
+    Tests for the `cbor` module.
+    """
+    def test_dumps(self):
+        self.assertEqual(bytes.fromhex("00"), cbor.dumps(0))
+        self.assertEqual(bytes.fromhex("1903e8"), cbor.dumps(1000))
+        self.assertEqual(bytes.fromhex("3903e7"), cbor.dumps(-1000))
+        self.assertEqual(bytes.fromhex("c249010000000000000000"), cbor.dumps(18446744073709551616))
+        self.assertEqual(bytes.fromhex("fb3ff8000000000000"), cbor.dumps(1.5))
+        self.assertEqual(bytes.fromhex("f5f4f6"), cbor.dumps(True) + cbor.dumps(False) + cbor.dumps(None))
+        self.assertEqual(bytes.fromhex("62c3bc"), cbor.dumps("ü"))
+        self.assertEqual(bytes.fromhex("a26161016162820203"), cbor.dumps({"a": 1, "b": [2, 3]}))
+
+    def test_dumps_with_default(self):
+        self.assertEqual(cbor.dumps([[1]]), cbor.dumps([{1}], default=list))
+
+    def test_dumps_unsupported_type(self):
+        self.assertRaises(TypeError, cbor.dumps, {1})
+
+    def test_loads(self):
+        self.assertEqual(-18446744073709551617, cbor.loads(bytes.fromhex("c349010000000000000000")))
+        self.assertEqual(1.5, cbor.loads(bytes.fromhex("f93e00")))
+        self.assertEqual(100000.0, cbor.loads(bytes.fromhex("fa47c35000")))
+        self.assertEqual(b"\x01\x02", cbor.loads(bytes.fromhex("420102")))
+        self.assertEqual([1, [2, 3], [4, 5]], cbor.loads(bytes.fromhex("9f018202039f0405ffff")))
+        self.assertEqual({"a": 1, "b": [2, 3]}, cbor.loads(bytes.fromhex("bf61610161629f0203ffff")))
+        self.assertEqual("streaming", cbor.loads(bytes.fromhex("7f657374726561646d696e67ff")))
+        self.assertEqual(1363896240, cbor.loads(bytes.fromhex("c11a514b67b0")))
+
+    def test_loads_invalid(self):
+        self.assertRaises(ValueError, cbor.loads, bytes.fromhex("1903"))
+        self.assertRaises(ValueError, cbor.loads, bytes.fromhex("0000"))
+
+    def test_dumps_and_loads(self):
+        value = {"a": [None, True, 2 ** 70, -2 ** 32, 0.1, "text", b"bytes"], "b": {"c": {}}}
+        self.assertEqual(value, cbor.loads(cbor.dumps(value)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import unittest
+from datetime import datetime, timezone
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder, MappingJSONDecoderClassBuilder, \
+    DatetimeEpochJSONEncoder, DatetimeEpochJSONDecoder, RawJSON, RawJSONEncoder, RawJSONDecoder
+from hgijson.binary_converters import binary_dumps, binary_loads, CBORBinaryFormat, MessagePackBinaryFormat
+from hgijson.tests._models import SimpleModel
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_MAPPINGS = [
+    JsonPropertyMapping("a", "a", encoder_cls=DatetimeEpochJSONEncoder, decoder_cls=DatetimeEpochJSONDecoder),
+    JsonPropertyMapping("b", "b")
+]
+_SimpleModelJSONEncoder = MappingJSONEncoderClassBuilder(SimpleModel, _MAPPINGS).build()
+_SimpleModelJSONDecoder = MappingJSONDecoderClassBuilder(SimpleModel, _MAPPINGS).build()
+_RAW_MAPPINGS = [
+    JsonPropertyMapping("b", "b", encoder_cls=RawJSONEncoder, decoder_cls=RawJSONDecoder)
+]
+_RawSimpleModelJSONEncoder = MappingJSONEncoderClassBuilder(SimpleModel, _RAW_MAPPINGS).build()
+_RawSimpleModelJSONDecoder = MappingJSONDecoderClassBuilder(SimpleModel, _RAW_MAPPINGS).build()
+
+
+class _TestBinaryFormat(unittest.TestCase):
+    """
+    Tests for encoding and decoding objects to and from a binary format.
+    """
+    def setUp(self):
+        self.binary_format = CBORBinaryFormat()
+        self.models = []
+        for i in range(3):
+            model = SimpleModel(["value", i])
+            model.a = datetime(2018, 1, 1 + i, tzinfo=timezone.utc)
+            self.models.append(model)
+
+    def test_dumps_and_loads(self):
+        encoded = binary_dumps(self.models[0], _SimpleModelJSONEncoder, self.binary_format)
+        self.assertEqual(self.models[0], binary_loads(encoded, _SimpleModelJSONDecoder, self.binary_format))
+
+    def test_dumps_and_loads_collection(self):
+        encoded = binary_dumps(self.models, _SimpleModelJSONEncoder, self.binary_format)
+        self.assertEqual(self.models, binary_loads(encoded, _SimpleModelJSONDecoder, self.binary_format))
+
+    def test_dumps_with_encoder_kwargs(self):
+        encoded = binary_dumps(self.models[0], _SimpleModelJSONEncoder, self.binary_format, fields=["b"])
+        self.assertEqual({"b": ["value", 0]}, self.binary_format.loads(encoded))
+
+    def test_dumps_and_loads_with_raw_json(self):
+        models = [SimpleModel(RawJSON("{\"c\": [1, null]}")), SimpleModel(RawJSON.from_parsed("d"))]
+        encoded = binary_dumps(models, _RawSimpleModelJSONEncoder, self.binary_format)
+        self.assertEqual([{"b": {"c": [1, None]}}, {"b": "d"}], self.binary_format.loads(encoded))
+        decoded = binary_loads(encoded, _RawSimpleModelJSONDecoder, self.binary_format)
+        self.assertEqual([{"c": [1, None]}, "d"], [model.b.parse() for model in decoded])
+
+    def test_dumps_and_loads_with_plain_json_converters(self):
+        encoded = binary_dumps({"a": [1, None]}, json.JSONEncoder, self.binary_format)
+        self.assertEqual({"a": [1, None]}, binary_loads(encoded, json.JSONDecoder, self.binary_format))
+
+
+class TestCBORBinaryFormat(_TestBinaryFormat):
+    """
+    Tests for `CBORBinaryFormat`.
+    """
+    def test_dumps_with_default_format(self):
+        self.assertEqual(binary_dumps(self.models, _SimpleModelJSONEncoder, self.binary_format),
+                         binary_dumps(self.models, _SimpleModelJSONEncoder))
+
+
+@unittest.skipIf(msgpack is None, "msgpack is not installed")
+class TestMessagePackBinaryFormat(_TestBinaryFormat):
+    """
+    Tests for `MessagePackBinaryFormat`.
+    """
+    def setUp(self):
+        super().setUp()
+        self.binary_format = MessagePackBinaryFormat()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, List, Dict
+
+
+@dataclass
+class Node:
+    name: str
+    created: datetime
+    parent: Optional["Node"] = None
+    children: List["Node"] = field(default_factory=list)
+    properties: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class Measurement:
+    value: Optional[int]
+    taken: Optional[datetime]
+    history: List[datetime]
@@ -0,0 +1,69 @@
+import json
+import unittest
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder, MappingJSONDecoderClassBuilder
+from hgijson.tests._models import SimpleModel
+
+_MAPPINGS = [
+    JsonPropertyMapping("serialized_a", "a"),
+    JsonPropertyMapping("serialized_b", "b", optional=True)
+]
+_SimpleModelJSONEncoder = MappingJSONEncoderClassBuilder(SimpleModel, _MAPPINGS).build()
+_SimpleModelJSONDecoder = MappingJSONDecoderClassBuilder(SimpleModel, _MAPPINGS).build()
+
+
+def _create_model(a: int, b: str) -> SimpleModel:
+    model = SimpleModel(b)
+    model.a = a
+    return model
+
+
+class TestColumnar(unittest.TestCase):
+    """
+    Tests for encoding and decoding lists of objects in columns using `columnar`.
+    """
+    def setUp(self):
+        self.models = [_create_model(1, "a"), _create_model(2, None), _create_model(3, "c")]
+
+    def test_encode(self):
+        encoded = _SimpleModelJSONEncoder(columnar=True).default(self.models)
+        self.assertEqual({"$columns": {"serialized_a": [1, 2, 3], "serialized_b": ["a", None, "c"]}, "$length": 3},
+                         encoded)
+
+    def test_encode_empty(self):
+        self.assertEqual({"$columns": {}, "$length": 0}, _SimpleModelJSONEncoder(columnar=True).default([]))
+
+    def test_encode_single_object(self):
+        encoded = _SimpleModelJSONEncoder(columnar=True).default(self.models[0])
+        self.assertEqual({"serialized_a": 1, "serialized_b": "a"}, encoded)
+
+    def test_encode_with_json_dumps(self):
+        encoded = json.dumps(self.models, cls=_SimpleModelJSONEncoder, columnar=True)
+        self.assertEqual({"serialized_a": [1, 2, 3], "serialized_b": ["a", None, "c"]}, json.loads(encoded)["$columns"])
+
+    def test_decode(self):
+        columns = {"$columns": {"serialized_a": [1, 2, 3], "serialized_b": ["a", None, "c"]}, "$length": 3}
+        self.assertEqual(self.models, _SimpleModelJSONDecoder(columnar=True).decode_parsed(columns))
+
+    def test_decode_empty(self):
+        self.assertEqual([], _SimpleModelJSONDecoder(columnar=True).decode_parsed({"$columns": {}, "$length": 0}))
+
+    def test_decode_with_unequal_columns(self):
+        columns = {"$columns": {"serialized_a": [1, 2, 3], "serialized_b": ["a"]}, "$length": 3}
+        self.assertRaises(ValueError, _SimpleModelJSONDecoder(columnar=True).decode_parsed, columns)
+
+    def test_encode_and_decode_with_json(self):
+        encoded = json.dumps(self.models, cls=_SimpleModelJSONEncoder, columnar=True)
+        self.assertEqual(self.models, json.loads(encoded, cls=_SimpleModelJSONDecoder, columnar=True))
+
+    def test_encode_and_decode_single_object(self):
+        encoded = json.dumps(self.models[0], cls=_SimpleModelJSONEncoder, columnar=True)
+        self.assertEqual(self.models[0], json.loads(encoded, cls=_SimpleModelJSONDecoder, columnar=True))
+
+    def test_decode_single_object_with_list_properties(self):
+        decoded = _SimpleModelJSONDecoder(columnar=True).decode_parsed({"serialized_a": [1, 2]})
+        self.assertEqual([1, 2], decoded.a)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import unittest
+
+from hgijson import JsonPropertyMapping, MappingJSONDecoderClassBuilder, DatetimeISOFormatJSONDecoder
+from hgijson.tests._models import BaseModel
+
+
+class _Address(BaseModel):
+    def __init__(self):
+        self.street = "High Street"
+        self.city = "London"
+
+
+class _Person(BaseModel):
+    def __init__(self, name, identifier=None):
+        self.name = name
+        self.identifier = identifier
+        self.age = 30
+        self.address = _Address()
+        self.tags = {"a"}
+        self.born = None
+
+
+_AddressJSONDecoder = MappingJSONDecoderClassBuilder(_Address, [
+    JsonPropertyMapping("street", "street"),
+    JsonPropertyMapping("city", "city", parent_json_properties=["region"])
+]).build()
+
+_PersonJSONDecoder = MappingJSONDecoderClassBuilder(_Person, [
+    JsonPropertyMapping("name", "name", "name"),
+    JsonPropertyMapping("identifier", object_constructor_parameter_name="identifier",
+                        json_property_getter=lambda obj_as_json: obj_as_json["id"]),
+    JsonPropertyMapping("age", "age", parent_json_properties=["details"]),
+    JsonPropertyMapping("address", "address", optional=True, decoder_cls=_AddressJSONDecoder),
+    JsonPropertyMapping("tags", "tags", collection_factory=set),
+    JsonPropertyMapping("born", "born", decoder_cls=DatetimeISOFormatJSONDecoder)
+]).build()
+
+
+class TestDecodeInto(unittest.TestCase):
+    """
+    Tests for decoding JSON into existing objects.
+    """
+    def setUp(self):
+        self.decoder = _PersonJSONDecoder()
+        self.person = _Person("Alice")
+        self.address = self.person.address
+
+    def test_only_properties_in_json_are_set(self):
+        updated = self.decoder.decode_parsed_into(self.person, {"details": {"age": 31}})
+        self.assertIs(self.person, updated)
+        self.assertEqual(31, self.person.age)
+        self.assertEqual("Alice", self.person.name)
+        self.assertEqual({"a"}, self.person.tags)
+
+    def test_constructor_property_with_name(self):
+        self.decoder.decode_parsed_into(self.person, {"name": "Alicia", "tags": ["b", "c"]})
+        self.assertEqual("Alicia", self.person.name)
+        self.assertEqual({"b", "c"}, self.person.tags)
+
+    def test_constructor_property_without_name(self):
+        self.assertRaises(ValueError, self.decoder.decode_parsed_into, self.person, {"id": 1})
+
+    def test_nested_object_updated_in_place(self):
+        self.decoder.decode_parsed_into(self.person, {"address": {"region": {"city": "Paris"}}})
+        self.assertIs(self.address, self.person.address)
+        self.assertEqual("Paris", self.person.address.city)
+        self.assertEqual("High Street", self.person.address.street)
+
+    def test_nested_object_created_when_none(self):
+        self.person.address = None
+        self.decoder.decode_parsed_into(self.person, {"address": {"street": "Low Street", "region": {"city": "Rome"}}})
+        self.assertEqual("Low Street", self.person.address.street)
+        self.assertEqual("Rome", self.person.address.city)
+
+    def test_null_removes_property(self):
+        self.decoder.decode_parsed_into(self.person, {"address": None, "details": None})
+        self.assertIsNone(self.person.address)
+        self.assertIsNone(self.person.age)
+
+    def test_decode_into(self):
+        self.decoder.decode_into(self.person, json.dumps({"address": {"street": "Low Street"}}))
+        self.assertEqual("Low Street", self.address.street)
+
+    def test_decode_into_object_of_other_type(self):
+        self.assertRaises(TypeError, self.decoder.decode_parsed_into, self.address, {})
+
+    def test_decode_into_from_non_object(self):
+        self.assertRaises(TypeError, self.decoder.decode_parsed_into, self.person, [])
+        self.assertRaises(TypeError, self.decoder.decode_into, self.person, "[]")
+
+    def test_decode_into_unchanged_when_decoding_fails(self):
+        self.assertRaises(ValueError, self.decoder.decode_parsed_into, self.person,
+                          {"name": "Alicia", "address": {"street": "Low Street"}, "tags": ["b"], "born": "invalid"})
+        self.assertEqual("Alice", self.person.name)
+        self.assertEqual("High Street", self.person.address.street)
+        self.assertEqual({"a"}, self.person.tags)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import sys
+import unittest
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder, MappingJSONDecoderClassBuilder
+from hgijson.tests._models import BaseModel
+
+_DEPTH = 2000
+
+
+class _Link(BaseModel):
+    def __init__(self, value, next_link=None):
+        self.value = value
+        self.next_link = next_link
+        self.children = []
+
+
+_link_mappings = [
+    JsonPropertyMapping("value", "value", "value"),
+    JsonPropertyMapping("next", "next_link", "next_link", optional=True, encoder_cls=lambda: _LinkJSONEncoder,
+                        decoder_cls=lambda: _LinkJSONDecoder),
+    JsonPropertyMapping("children", "children", encoder_cls=lambda: _LinkJSONEncoder,
+                        decoder_cls=lambda: _LinkJSONDecoder)
+]
+_LinkJSONEncoder = MappingJSONEncoderClassBuilder(_Link, _link_mappings).build()
+_LinkJSONDecoder = MappingJSONDecoderClassBuilder(_Link, _link_mappings).build()
+
+
+def _create_links(depth: int) -> _Link:
+    link = None
+    for value in reversed(range(depth)):
+        link = _Link(value, link)
+        link.children = [_Link(-value)] if value % 2 == 0 else []
+    return link
+
+
+def _create_links_as_json(depth: int) -> dict:
+    link_as_json = None
+    for value in reversed(range(depth)):
+        children = [{"value": -value, "children": []}] if value % 2 == 0 else []
+        link_as_json = dict({"value": value}, **({"next": link_as_json} if link_as_json is not None else {}))
+        link_as_json["children"] = children
+    return link_as_json
+
+
+def _unroll(link_as_json: dict) -> list:
+    """
+    Unrolls the given encoded links into a list of the encoded links without their next link (as comparing deeply nested
+    dictionaries is recursive).
+    """
+    unrolled = []
+    while link_as_json is not None:
+        unrolled.append(dict(link_as_json))
+        link_as_json = unrolled[-1].pop("next", None)
+    return unrolled
+
+
+class TestDeepNesting(unittest.TestCase):
+    """
+    Tests that models nested deeper than the recursion limit can be encoded and decoded.
+    """
+    def test_encode(self):
+        self.assertGreater(_DEPTH, sys.getrecursionlimit() // 2)
+        encoded = _LinkJSONEncoder().default(_create_links(_DEPTH))
+        self.assertEqual(_unroll(_create_links_as_json(_DEPTH)), _unroll(encoded))
+
+    def test_decode(self):
+        decoded = _LinkJSONDecoder().decode_parsed(_create_links_as_json(_DEPTH))
+        links = []
+        while decoded is not None:
+            links.append(decoded)
+            decoded = decoded.next_link
+        self.assertEqual(list(range(_DEPTH)), [link.value for link in links])
+        self.assertEqual([[-value] if value % 2 == 0 else [] for value in range(_DEPTH)],
+                         [[child.value for child in link.children] for link in links])
+
+    def test_encode_and_decode_small_depth(self):
+        links = _create_links(3)
+        self.assertEqual(links, json.loads(json.dumps(links, cls=_LinkJSONEncoder), cls=_LinkJSONDecoder))
+
+
+if __name__ == "__main__":
+    unittest.main()
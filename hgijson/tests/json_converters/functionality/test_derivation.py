@@ -0,0 +1,165 @@
+import gc
+import json
+import unittest
+import weakref
+from datetime import datetime, timezone
+from typing import List, Optional, NamedTuple, Set, Union
+
+from hgijson.json_converters.derivation import derive_json_property_mappings, derive_json_encoder_cls, \
+    derive_json_decoder_cls
+from hgijson.serializers import PrimitiveSerializer, PrimitiveDeserializer
+
+try:
+    # Dataclasses are defined using variable annotations, which are invalid syntax before Python 3.6
+    from hgijson.tests.json_converters.functionality._dataclass_models import Node, Measurement
+except (ImportError, SyntaxError):
+    Node, Measurement = None, None
+
+_Point = NamedTuple("_Point", [("x", int), ("y", int)])
+_Point.__new__.__defaults__ = (0, )
+
+
+class _Shape:
+    def __init__(self, name: str, points: List[_Point], tags: Set[str]=None):
+        self.name = name
+        self.points = points
+        self.tags = tags
+        self.scale = 1.0
+
+
+# Equivalent to the class variable annotation `scale: float`
+_Shape.__annotations__ = {"scale": float}
+
+
+class _Reading:
+    def __init__(self, value: Optional[int], taken: Optional[datetime], history: List[datetime]):
+        self.value = value
+        self.taken = taken
+        self.history = history
+
+
+class TestDerivation(unittest.TestCase):
+    """
+    Tests for deriving mappings from type annotations.
+    """
+    def test_derive_json_property_mappings_for_primitives(self):
+        mappings = derive_json_property_mappings(_Point)
+        self.assertEqual(["x", "y"], [mapping.json_property_name for mapping in mappings])
+        self.assertEqual(["x", "y"], [mapping.object_constructor_parameter_name for mapping in mappings])
+        self.assertEqual([False, True], [mapping.optional for mapping in mappings])
+        for mapping in mappings:
+            self.assertEqual(PrimitiveSerializer, mapping.serializer_cls)
+            self.assertEqual(PrimitiveDeserializer, mapping.deserializer_cls)
+
+    def test_derive_json_property_mappings_for_class(self):
+        mappings = {mapping.json_property_name: mapping for mapping in derive_json_property_mappings(_Shape)}
+        self.assertEqual({"name", "points", "tags", "scale"}, mappings.keys())
+        self.assertIsNone(mappings["scale"].object_constructor_parameter_name)
+        self.assertTrue(mappings["tags"].optional)
+
+    def test_derive_json_property_mappings_for_unsupported_types(self):
+        class Unsupported:
+            value = None
+
+        class UnsupportedUnion:
+            def __init__(self, value: Union[int, str]):
+                self.value = value
+
+        self.assertRaises(ValueError, derive_json_property_mappings, Unsupported)
+        self.assertRaises(ValueError, derive_json_property_mappings, UnsupportedUnion)
+
+    def test_derive_json_property_mappings_with_unannotated_constructor_parameter(self):
+        class Unannotated:
+            def __init__(self, name: str, value):
+                self.name = name
+                self.value = value
+
+        with self.assertRaisesRegex(TypeError, "\"value\""):
+            derive_json_property_mappings(Unannotated)
+
+    def test_encode_and_decode_unset_non_constructor_property(self):
+        class Unset:
+            label = None    # type: str
+
+            def __init__(self, value: int):
+                self.value = value
+
+        Unset.__annotations__ = {"label": str, "size": int}
+        self.assertTrue(all(mapping.optional for mapping in derive_json_property_mappings(Unset)
+                            if mapping.object_constructor_parameter_name is None))
+
+        encoded = json.dumps(Unset(1), cls=derive_json_encoder_cls(Unset))
+        self.assertEqual({"value": 1}, json.loads(encoded))
+        decoded = json.loads(encoded, cls=derive_json_decoder_cls(Unset))
+        self.assertEqual({"value": 1}, vars(decoded))
+
+        decoded = json.loads('{"value": 1, "size": 2}', cls=derive_json_decoder_cls(Unset))
+        self.assertEqual({"value": 1, "size": 2}, vars(decoded))
+
+    def test_derive_json_encoder_and_decoder_cls_are_cached(self):
+        self.assertIs(derive_json_encoder_cls(_Point), derive_json_encoder_cls(_Point))
+        self.assertIs(derive_json_decoder_cls(_Point), derive_json_decoder_cls(_Point))
+
+    def test_derive_json_encoder_and_decoder_cls_do_not_keep_class_alive(self):
+        class Temporary:
+            def __init__(self, value: int):
+                self.value = value
+
+        derive_json_encoder_cls(Temporary)
+        derive_json_decoder_cls(Temporary)
+        reference = weakref.ref(Temporary)
+        del Temporary
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_derive_json_encoder_cls_for_subclass(self):
+        class Subclass(_Point):
+            pass
+
+        self.assertIsNot(derive_json_encoder_cls(_Point), derive_json_encoder_cls(Subclass))
+
+    def test_encode_and_decode(self):
+        shape = _Shape("triangle", [_Point(0), _Point(1, 1), _Point(2)], {"a", "b"})
+        shape.scale = 2.0
+        encoded = json.dumps(shape, cls=derive_json_encoder_cls(_Shape))
+        self.assertEqual([{"x": 0, "y": 0}, {"x": 1, "y": 1}, {"x": 2, "y": 0}], json.loads(encoded)["points"])
+
+        decoded = json.loads(encoded, cls=derive_json_decoder_cls(_Shape))
+        self.assertEqual(vars(shape), vars(decoded))
+
+    def test_decode_with_defaults(self):
+        decoded = json.loads('[{"x": 1}]', cls=derive_json_decoder_cls(_Point))
+        self.assertEqual([_Point(1)], decoded)
+
+    def test_encode_and_decode_named_tuple(self):
+        encoded = json.dumps(_Point(1, 2), cls=derive_json_encoder_cls(_Point))
+        self.assertEqual({"x": 1, "y": 2}, json.loads(encoded))
+        self.assertEqual(_Point(1, 2), json.loads(encoded, cls=derive_json_decoder_cls(_Point)))
+
+    def test_encode_and_decode_optional_without_default(self):
+        history = [datetime(2018, 1, 1, tzinfo=timezone.utc), datetime(2018, 1, 2, tzinfo=timezone.utc)]
+        for reading in (_Reading(None, None, []), _Reading(1, history[0], history)):
+            encoded = json.dumps(reading, cls=derive_json_encoder_cls(_Reading))
+            self.assertEqual({"value", "taken", "history"}, json.loads(encoded).keys())
+            self.assertEqual(vars(reading), vars(json.loads(encoded, cls=derive_json_decoder_cls(_Reading))))
+
+    @unittest.skipIf(Node is None, "dataclasses are not supported")
+    def test_encode_and_decode_dataclasses(self):
+        created = datetime(2018, 1, 1, tzinfo=timezone.utc)
+        node = Node("a", created, Node("b", created),
+                    [Node("c", created), Node("d", created, properties={"e": 1})])
+
+        encoded = json.dumps(node, cls=derive_json_encoder_cls(Node))
+        self.assertEqual("2018-01-01T00:00:00+00:00", json.loads(encoded)["created"])
+        self.assertEqual(node, json.loads(encoded, cls=derive_json_decoder_cls(Node)))
+
+    @unittest.skipIf(Measurement is None, "dataclasses are not supported")
+    def test_encode_and_decode_dataclass_with_optional_without_default(self):
+        measurement = Measurement(None, None, [datetime(2018, 1, 1, tzinfo=timezone.utc)])
+        encoded = json.dumps(measurement, cls=derive_json_encoder_cls(Measurement))
+        self.assertEqual({"value": None, "taken": None, "history": ["2018-01-01T00:00:00+00:00"]}, json.loads(encoded))
+        self.assertEqual(measurement, json.loads(encoded, cls=derive_json_decoder_cls(Measurement)))
+
+
+if __name__ == "__main__":
+    unittest.main()
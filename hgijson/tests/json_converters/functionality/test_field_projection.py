@@ -0,0 +1,102 @@
+import json
+import unittest
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder
+from hgijson.tests._models import BaseModel
+
+
+class _Office(BaseModel):
+    def __init__(self, name: str=None, address: str=None):
+        self.name = name
+        self.address = address
+
+
+class _Employee(BaseModel):
+    def __init__(self, name: str=None, title: str=None, office: _Office=None, details: dict=None):
+        self.name = name
+        self.title = title
+        self.office = office
+        self.details = details
+
+    @property
+    def expensive(self):
+        raise AssertionError("Property should not have been evaluated")
+
+
+_OfficeJSONEncoder = MappingJSONEncoderClassBuilder(_Office, [
+    JsonPropertyMapping("name", "name"),
+    JsonPropertyMapping("address", "address", parent_json_properties=["location"])
+]).build()
+_EmployeeJSONEncoder = MappingJSONEncoderClassBuilder(_Employee, [
+    JsonPropertyMapping("name", "name"),
+    JsonPropertyMapping("title", "title", parent_json_properties=["job"]),
+    JsonPropertyMapping("expensive", "expensive"),
+    JsonPropertyMapping("office", "office", encoder_cls=_OfficeJSONEncoder),
+    JsonPropertyMapping("details", "details", optional=True),
+    JsonPropertyMapping(object_property_name="name", parent_json_properties=["names"],
+                        json_property_setter=lambda obj_as_json, value: obj_as_json.update(
+                            {"first": value.split()[0], "last": value.split()[-1]}))
+]).build()
+
+
+class TestFieldProjection(unittest.TestCase):
+    """
+    Tests for encoding sparse fieldsets using `fields`.
+    """
+    def setUp(self):
+        self.employee = _Employee("Bob Smith", "Software Dev", _Office("Cambridge", "Hinxton"))
+
+    def test_encode_with_fields(self):
+        encoded = _EmployeeJSONEncoder(fields=["name"]).default(self.employee)
+        self.assertEqual({"name": "Bob Smith"}, encoded)
+
+    def test_encode_with_nested_property_fields(self):
+        encoded = _EmployeeJSONEncoder(fields=["office.name"]).default(self.employee)
+        self.assertEqual({"office": {"name": "Cambridge"}}, encoded)
+
+    def test_encode_with_whole_nested_property_field(self):
+        encoded = _EmployeeJSONEncoder(fields=["office.name", "office"]).default(self.employee)
+        self.assertEqual({"office": {"name": "Cambridge", "location": {"address": "Hinxton"}}}, encoded)
+
+    def test_encode_with_parent_json_property_fields(self):
+        encoded = _EmployeeJSONEncoder(fields=["job", "office.location.address"]).default(self.employee)
+        self.assertEqual({"job": {"title": "Software Dev"}, "office": {"location": {"address": "Hinxton"}}}, encoded)
+
+    def test_encode_with_fields_with_collection(self):
+        encoded = _EmployeeJSONEncoder(fields=["name"]).default([self.employee, self.employee])
+        self.assertEqual([{"name": "Bob Smith"}, {"name": "Bob Smith"}], encoded)
+
+    def test_encode_with_fields_with_json_dumps(self):
+        encoded = json.dumps(self.employee, cls=_EmployeeJSONEncoder, fields=["name", "office.name"])
+        self.assertEqual({"name": "Bob Smith", "office": {"name": "Cambridge"}}, json.loads(encoded))
+
+    def test_encode_with_fields_of_unnamed_mapping(self):
+        encoded = _EmployeeJSONEncoder(fields=["names"]).default(self.employee)
+        self.assertEqual({"names": {"first": "Bob", "last": "Smith"}}, encoded)
+
+    def test_encode_with_nested_fields_of_unnamed_mapping(self):
+        encoded = _EmployeeJSONEncoder(fields=["names.last", "job"]).default(self.employee)
+        self.assertEqual({"names": {"last": "Smith"}, "job": {"title": "Software Dev"}}, encoded)
+
+    def test_encode_with_nested_fields_of_json_object(self):
+        self.employee.details = {"a": 1, "b": [{"c": 2, "d": 3}]}
+        encoded = _EmployeeJSONEncoder(fields=["details.b.c"]).default(self.employee)
+        self.assertEqual({"details": {"b": [{"c": 2}]}}, encoded)
+
+    def test_encode_with_nested_fields_of_primitive(self):
+        encoder = _EmployeeJSONEncoder(fields=["name.first"])
+        self.assertRaises(ValueError, encoder.default, self.employee)
+
+    def test_encoders_share_projected_serializers(self):
+        encoders = [_EmployeeJSONEncoder(fields=["office.name"]) for _ in range(2)]
+        serializer_classes = [
+            [mapping.serializer_cls for mapping in encoder._create_serializer()._property_mappings
+             if getattr(mapping, "json_property_name", None) == "office"][0] for encoder in encoders]
+        self.assertIs(serializer_classes[0], serializer_classes[1])
+
+    def test_encode_without_fields(self):
+        self.assertRaises(AssertionError, _EmployeeJSONEncoder().default, self.employee)
+
+
+if __name__ == "__main__":
+    unittest.main()
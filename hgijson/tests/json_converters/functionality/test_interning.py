@@ -0,0 +1,97 @@
+import json
+import unittest
+from collections import OrderedDict
+
+from hgijson import JsonPropertyMapping, MappingJSONDecoderClassBuilder
+from hgijson.tests._models import BaseModel
+
+
+class _Country(BaseModel):
+    def __init__(self, code):
+        self.code = code
+        self.languages = None
+
+
+class _Person(BaseModel):
+    def __init__(self):
+        self.status = None
+        self.country = None
+        self.tags = None
+        self.details = None
+
+
+_CountryJSONDecoder = MappingJSONDecoderClassBuilder(_Country, [
+    JsonPropertyMapping("code", object_constructor_parameter_name="code"),
+    JsonPropertyMapping("languages", "languages", intern_strings=True, collection_factory=set)
+]).build()
+
+_PersonJSONDecoder = MappingJSONDecoderClassBuilder(_Person, [
+    JsonPropertyMapping("status", "status", intern_strings=True),
+    JsonPropertyMapping("country", "country", decoder_cls=_CountryJSONDecoder, optional=True, canonicalize=True),
+    JsonPropertyMapping("tags", "tags", canonicalize=True),
+    JsonPropertyMapping("details", "details", optional=True)
+]).build()
+
+
+def _unique(string: str) -> str:
+    """
+    Creates a string equal to the given string that is not the same instance.
+    :param string: the string
+    :return: the new string
+    """
+    return "".join(list(string))
+
+
+class TestInterning(unittest.TestCase):
+    """
+    Tests for interning decoded strings and canonicalizing decoded values.
+    """
+    def setUp(self):
+        self.people_as_json = [
+            {"status": _unique("active"), "country": {"code": "GB", "languages": [_unique("en")]}, "tags": ["a"]},
+            {"status": _unique("active"), "country": {"code": "GB", "languages": [_unique("en")]}, "tags": ["a"]},
+            {"status": _unique("inactive"), "country": {"code": "FR", "languages": ["fr"]}, "tags": ["a", "b"]},
+            {"status": _unique("active"), "country": None, "tags": []}
+        ]
+
+    def test_strings_interned(self):
+        people = _PersonJSONDecoder().decode_parsed(self.people_as_json)
+        self.assertEqual(["active", "active", "inactive", "active"], [person.status for person in people])
+        self.assertIs(people[0].status, people[1].status)
+        self.assertIs(people[0].status, people[3].status)
+
+    def test_strings_in_collections_interned(self):
+        people = _PersonJSONDecoder().decode_parsed(self.people_as_json[:1])
+        decoded = _CountryJSONDecoder().decode_parsed({"code": "GB", "languages": [_unique("en")]})
+        self.assertEqual({"en"}, decoded.languages)
+        self.assertIs(next(iter(people[0].country.languages)), next(iter(decoded.languages)))
+
+    def test_equal_values_canonicalized(self):
+        people = _PersonJSONDecoder().decode_parsed(self.people_as_json)
+        self.assertIs(people[0].country, people[1].country)
+        self.assertIsNot(people[0].country, people[2].country)
+        self.assertEqual("FR", people[2].country.code)
+        self.assertIsNone(people[3].country)
+        self.assertIs(people[0].tags, people[1].tags)
+        self.assertEqual([["a"], ["a"], ["a", "b"], []], [person.tags for person in people])
+
+    def test_values_of_different_types_not_canonicalized(self):
+        people = _PersonJSONDecoder().decode_parsed(
+            [{"status": "active", "tags": [value]} for value in (1, True, 1.0)])
+        self.assertEqual([int, bool, float], [type(person.tags[0]) for person in people])
+
+    def test_intern_keys(self):
+        json_as_string = json.dumps({"status": "active", "tags": [], "details": {_unique("nested_key"): 1}})
+        people = [_PersonJSONDecoder(intern_keys=True).decode(json_as_string) for _ in range(2)]
+        self.assertEqual({"nested_key": 1}, people[0].details)
+        self.assertIs(next(iter(people[0].details)), next(iter(people[1].details)))
+
+    def test_intern_keys_with_object_pairs_hook(self):
+        json_as_string = json.dumps({"status": "active", "tags": [], "details": {"b": 1, "a": 2}})
+        person = _PersonJSONDecoder(intern_keys=True, object_pairs_hook=OrderedDict).decode(json_as_string)
+        self.assertIsInstance(person.details, OrderedDict)
+        self.assertEqual(["b", "a"], list(person.details))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import io
+import json
+import unittest
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder, MappingJSONDecoderClassBuilder, \
+    SerializationLimits, SerializationLimitExceededError
+from hgijson.tests._models import BaseModel
+
+
+class _Node(BaseModel):
+    def __init__(self, name="a", children=None, tags=None):
+        self.name = name
+        self.children = children if children is not None else []
+        self.tags = tags if tags is not None else []
+
+
+_NodeJSONEncoder = MappingJSONEncoderClassBuilder(_Node, [
+    JsonPropertyMapping("name", "name"),
+    JsonPropertyMapping("children", "children", encoder_cls=lambda: _NodeJSONEncoder),
+    JsonPropertyMapping("tags", "tags")
+]).build()
+
+_NodeJSONDecoder = MappingJSONDecoderClassBuilder(_Node, [
+    JsonPropertyMapping("name", "name"),
+    JsonPropertyMapping("children", "children", decoder_cls=lambda: _NodeJSONDecoder),
+    JsonPropertyMapping("tags", "tags")
+]).build()
+
+
+def _create_tree(depth: int, width: int) -> _Node:
+    """
+    Creates a tree of nodes of the given depth, where each node (other than leaves) has the given number of children.
+    :param depth: the depth of the tree
+    :param width: the number of children of each node
+    :return: the root of the tree
+    """
+    node = _Node()
+    for _ in range(depth - 1):
+        node = _Node(children=[node] * width)
+    return node
+
+
+class TestSerializationLimits(unittest.TestCase):
+    """
+    Tests for `SerializationLimits`.
+    """
+    def setUp(self):
+        self.tree = _create_tree(3, 2)
+        self.tree_as_json = json.dumps(self.tree, cls=_NodeJSONEncoder)
+
+    def assertLimitExceeded(self, limit: str, function, *args, **kwargs):
+        with self.assertRaises(SerializationLimitExceededError) as context:
+            function(*args, **kwargs)
+        self.assertEqual(limit, context.exception.limit)
+
+    def test_within_limits(self):
+        # Each JSON object has 3 properties
+        limits = SerializationLimits(max_bytes=len(self.tree_as_json), max_depth=3, max_collection_length=3,
+                                     max_objects=7)
+        self.assertEqual(self.tree_as_json, json.dumps(self.tree, cls=_NodeJSONEncoder, limits=limits))
+        self.assertEqual(self.tree, json.loads(self.tree_as_json, cls=_NodeJSONDecoder, limits=limits))
+
+    def test_max_bytes(self):
+        limits = SerializationLimits(max_bytes=len(self.tree_as_json) - 1)
+        self.assertLimitExceeded("max_bytes", json.dumps, self.tree, cls=_NodeJSONEncoder, limits=limits)
+        self.assertLimitExceeded("max_bytes", json.loads, self.tree_as_json, cls=_NodeJSONDecoder, limits=limits)
+
+    def test_max_bytes_streamed(self):
+        limits = SerializationLimits(max_bytes=len(self.tree_as_json) - 1)
+        written = io.StringIO()
+        self.assertLimitExceeded("max_bytes", json.dump, self.tree, written, cls=_NodeJSONEncoder, limits=limits)
+        # Chunks are written as they are encoded
+        self.assertTrue(self.tree_as_json.startswith(written.getvalue()))
+        self.assertGreater(len(written.getvalue()), 0)
+
+    def test_max_bytes_of_non_ascii(self):
+        limits = SerializationLimits(max_bytes=len(json.dumps(_Node("é"), cls=_NodeJSONEncoder, ensure_ascii=False)))
+        self.assertLimitExceeded("max_bytes", json.dumps, _Node("éé"), cls=_NodeJSONEncoder, ensure_ascii=False,
+                                 limits=limits)
+        self.assertLimitExceeded("max_bytes", _NodeJSONDecoder(limits=limits).decode,
+                                 json.dumps({"name": "éé", "children": [], "tags": []}, ensure_ascii=False))
+
+    def test_max_depth(self):
+        limits = SerializationLimits(max_depth=2)
+        self.assertLimitExceeded("max_depth", _NodeJSONEncoder(limits=limits).default, self.tree)
+        self.assertLimitExceeded("max_depth", json.loads, self.tree_as_json, cls=_NodeJSONDecoder, limits=limits)
+
+    def test_max_depth_of_deep_nesting(self):
+        limits = SerializationLimits(max_depth=100)
+        self.assertLimitExceeded("max_depth", _NodeJSONEncoder(limits=limits).default, _create_tree(10000, 1))
+
+    def test_max_collection_length(self):
+        limits = SerializationLimits(max_collection_length=1)
+        self.assertLimitExceeded("max_collection_length", json.dumps, self.tree, cls=_NodeJSONEncoder, limits=limits)
+        self.assertLimitExceeded("max_collection_length", json.loads, self.tree_as_json, cls=_NodeJSONDecoder,
+                                 limits=limits)
+
+    def test_max_collection_length_of_primitives(self):
+        limits = SerializationLimits(max_collection_length=1)
+        self.assertLimitExceeded("max_collection_length", _NodeJSONEncoder(limits=limits).default,
+                                 _Node(tags=["a", "b"]))
+        self.assertLimitExceeded("max_collection_length", _NodeJSONDecoder(limits=limits).decode_parsed,
+                                 {"name": "a", "children": [], "tags": ["a", "b"]})
+
+    def test_max_collection_length_of_top_level_list(self):
+        limits = SerializationLimits(max_collection_length=3)
+        nodes = [_Node()] * 4
+        nodes_as_json = json.dumps(nodes, cls=_NodeJSONEncoder)
+        self.assertLimitExceeded("max_collection_length", json.dumps, nodes, cls=_NodeJSONEncoder, limits=limits)
+        self.assertLimitExceeded("max_collection_length", _NodeJSONEncoder(limits=limits).default, nodes)
+        self.assertLimitExceeded("max_collection_length", json.loads, nodes_as_json, cls=_NodeJSONDecoder,
+                                 limits=limits)
+        self.assertLimitExceeded("max_collection_length", _NodeJSONDecoder(limits=limits).decode_parsed,
+                                 json.loads(nodes_as_json))
+        self.assertEqual(3, len(json.loads(json.dumps(nodes[:3], cls=_NodeJSONEncoder, limits=limits),
+                                           cls=_NodeJSONDecoder, limits=limits)))
+
+    def test_max_collection_length_of_nested_primitives(self):
+        limits = SerializationLimits(max_collection_length=3)
+        self.assertLimitExceeded("max_collection_length", _NodeJSONEncoder(limits=limits).default,
+                                 _Node(tags=[[1, 2, 3, 4]]))
+        self.assertLimitExceeded("max_collection_length", _NodeJSONDecoder(limits=limits).decode_parsed,
+                                 {"name": "a", "children": [], "tags": [[1, 2, 3, 4]]})
+        self.assertLimitExceeded("max_collection_length", _NodeJSONDecoder(limits=limits).decode_parsed,
+                                 {"name": "a", "children": [], "tags": [{"a": 1, "b": 2, "c": 3, "d": 4}]})
+
+    def test_max_collection_length_of_json_object(self):
+        limits = SerializationLimits(max_collection_length=3)
+        self.assertLimitExceeded("max_collection_length", _NodeJSONDecoder(limits=limits).decode_parsed,
+                                 {"name": "a", "children": [], "tags": [], "other": 1})
+
+    def test_max_objects(self):
+        limits = SerializationLimits(max_objects=6)
+        self.assertLimitExceeded("max_objects", json.dumps, self.tree, cls=_NodeJSONEncoder, limits=limits)
+        self.assertLimitExceeded("max_objects", json.loads, self.tree_as_json, cls=_NodeJSONDecoder, limits=limits)
+
+    def test_max_objects_of_list(self):
+        limits = SerializationLimits(max_objects=13)
+        self.assertLimitExceeded("max_objects", json.dumps, [self.tree, self.tree], cls=_NodeJSONEncoder,
+                                 limits=limits)
+        self.assertEqual(2, len(json.loads(json.dumps([self.tree, self.tree], cls=_NodeJSONEncoder),
+                                           cls=_NodeJSONDecoder, limits=SerializationLimits(max_objects=14))))
+
+    def test_limits_not_kept_after_exceeded(self):
+        limits = SerializationLimits(max_objects=6)
+        encoder = _NodeJSONEncoder(limits=limits)
+        self.assertLimitExceeded("max_objects", encoder.default, self.tree)
+        self.assertEqual(json.loads(self.tree_as_json), _NodeJSONEncoder().default(self.tree))
+
+    def test_invalid_limit(self):
+        self.assertRaises(ValueError, SerializationLimits, max_depth=0)
+
+    def test_is_value_error(self):
+        self.assertTrue(issubclass(SerializationLimitExceededError, ValueError))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,6 +73,31 @@ class TestParentJsonProperties(unittest.TestCase):
         del example_as_json["more"]["nesting"]
         self.assertRaises(KeyError, _ExampleJSONDecoder().decode_parsed, example_as_json)
 
+    def test_encode_and_decode_collection(self):
+        examples = [_EXAMPLE, _EXAMPLE_WITH_OPTIONAL, _EXAMPLE]
+        encoded = _ExampleJSONEncoder().default(examples)
+        self.assertEqual([_EXAMPLE_AS_JSON, _EXAMPLE_WITH_OPTIONAL_AS_JSON, _EXAMPLE_AS_JSON], encoded)
+        self.assertEqual(examples, _ExampleJSONDecoder().decode_parsed(encoded))
+
+    def test_encode_preserves_property_order(self):
+        obj_as_dict = _ExampleJSONEncoder().default(_EXAMPLE_WITH_OPTIONAL)
+        self.assertEqual(["lots", "more", "nesting"], list(obj_as_dict.keys()))
+
+    def test_parents_resolved_once_per_object(self):
+        class CountingDict(dict):
+            gets = 0
+
+            def get(self, *args, **kwargs):
+                CountingDict.gets += 1
+                return super().get(*args, **kwargs)
+
+        example_as_json = CountingDict(lots=CountingDict(of=CountingDict(nesting=CountingDict({
+            EXAMPLE_PROPERTY_1: EXAMPLE_VALUE_1, EXAMPLE_PROPERTY_2: EXAMPLE_VALUE_2}))),
+            more=CountingDict(nesting={EXAMPLE_PROPERTY_3: EXAMPLE_VALUE_3}))
+        self.assertEqual(_EXAMPLE, _ExampleJSONDecoder().decode_parsed(example_as_json))
+        # One get for each of: lots, lots.of, lots.of.nesting, more, more.nesting, nesting
+        self.assertEqual(6, CountingDict.gets)
+
 
 if __name__ == "__main__":
     unittest.main()
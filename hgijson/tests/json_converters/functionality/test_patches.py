@@ -0,0 +1,168 @@
+import copy
+import unittest
+from json import JSONEncoder
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder
+from hgijson.tests._models import BaseModel
+
+
+class _Address(BaseModel):
+    def __init__(self):
+        self.street = "High Street"
+        self.city = "London"
+
+
+class _Person(BaseModel):
+    def __init__(self):
+        self.name = "Alice"
+        self.age = 30
+        self.nickname = None
+        self.address = _Address()
+        self.friends = ["Bob"]
+        self.settings = {"theme": "dark", "language": "en"}
+
+
+class _CountingJSONEncoder(JSONEncoder):
+    """
+    JSON encoder that counts the number of values it has encoded.
+    """
+    encoded = 0
+
+    def default(self, o):
+        _CountingJSONEncoder.encoded += 1
+        return o
+
+
+_AddressJSONEncoder = MappingJSONEncoderClassBuilder(_Address, [
+    JsonPropertyMapping("street", "street", encoder_cls=_CountingJSONEncoder),
+    JsonPropertyMapping("city", "city", parent_json_properties=["region"], encoder_cls=_CountingJSONEncoder)
+]).build()
+
+_PersonJSONEncoder = MappingJSONEncoderClassBuilder(_Person, [
+    JsonPropertyMapping("name", "name"),
+    JsonPropertyMapping("age", "age", parent_json_properties=["details"]),
+    JsonPropertyMapping("nickname", "nickname", optional=True, parent_json_properties=["details", "extra"]),
+    JsonPropertyMapping("address", "address", optional=True, encoder_cls=_AddressJSONEncoder),
+    JsonPropertyMapping("friends", "friends"),
+    JsonPropertyMapping("settings", "settings")
+]).build()
+
+
+def _apply_merge_patch(target, patch):
+    """
+    Applies the given JSON Merge Patch to the given target (RFC 7396).
+    """
+    if not isinstance(patch, dict):
+        return patch
+    target = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        else:
+            target[key] = _apply_merge_patch(target.get(key, None), value)
+    return target
+
+
+def _apply_json_patch(target, patch):
+    """
+    Applies the given JSON Patch (RFC 6902), which only uses "add", "replace" and "remove", to the given target.
+    """
+    target = copy.deepcopy(target)
+    for operation in patch:
+        names = [name.replace("~1", "/").replace("~0", "~") for name in operation["path"].split("/")[1:]]
+        if len(names) == 0:
+            target = operation["value"]
+            continue
+        container = target
+        for name in names[:-1]:
+            container = container[name]
+        if operation["op"] == "remove":
+            del container[names[-1]]
+        else:
+            assert (names[-1] in container) == (operation["op"] == "replace")
+            container[names[-1]] = copy.deepcopy(operation["value"])
+    return target
+
+
+class TestPatches(unittest.TestCase):
+    """
+    Tests for encoding objects as patches of their previous encoding.
+    """
+    def setUp(self):
+        self.encoder = _PersonJSONEncoder()
+        self.person = _Person()
+        self.previous = self.encoder.default(self.person)
+
+    def _assert_patches(self, expected_json_patch):
+        json_patch, encoded = self.encoder.default_json_patch(self.person, self.previous)
+        self.assertEqual(self.encoder.default(self.person), encoded)
+        self.assertEqual(expected_json_patch, json_patch)
+        self.assertEqual(encoded, _apply_json_patch(self.previous, json_patch))
+
+        merge_patch, encoded = self.encoder.default_merge_patch(self.person, self.previous)
+        self.assertEqual(encoded, _apply_merge_patch(self.previous, merge_patch))
+        return merge_patch
+
+    def test_when_unchanged(self):
+        self.assertEqual({}, self._assert_patches([]))
+
+    def test_when_property_changed(self):
+        self.person.name = "Alicia"
+        self.person.age = 31
+        merge_patch = self._assert_patches([{"op": "replace", "path": "/name", "value": "Alicia"},
+                                            {"op": "replace", "path": "/details/age", "value": 31}])
+        self.assertEqual({"name": "Alicia", "details": {"age": 31}}, merge_patch)
+
+    def test_when_type_changed(self):
+        self.person.age = True
+        self._assert_patches([{"op": "replace", "path": "/details/age", "value": True}])
+
+    def test_when_optional_property_added_and_removed(self):
+        self.person.nickname = "Al"
+        self._assert_patches([{"op": "add", "path": "/details/extra", "value": {"nickname": "Al"}}])
+        self.previous = self.encoder.default(self.person)
+        self.person.nickname = None
+        self.person.address = None
+        self._assert_patches([{"op": "remove", "path": "/details/extra"}, {"op": "remove", "path": "/address"}])
+
+    def test_when_nested_object_changed(self):
+        self.person.address.city = "Paris"
+        _CountingJSONEncoder.encoded = 0
+        self._assert_patches([{"op": "replace", "path": "/address/region/city", "value": "Paris"}])
+        # Only the properties of the nested object are encoded (for each of the two patches and encoding)
+        self.assertEqual(2 + 2 + 2, _CountingJSONEncoder.encoded)
+
+    def test_when_nested_object_added(self):
+        self.previous.pop("address")
+        self._assert_patches([{"op": "add", "path": "/address",
+                               "value": {"street": "High Street", "region": {"city": "London"}}}])
+
+    def test_when_object_replaced_with_object(self):
+        self.person.settings = {"theme": "light", "language": "en"}
+        merge_patch = self._assert_patches([{"op": "replace", "path": "/settings", "value": self.person.settings}])
+        self.assertEqual({"settings": {"theme": "light"}}, merge_patch)
+
+    def test_when_property_set_to_null(self):
+        self.person.friends = None
+        self.assertEqual([{"op": "replace", "path": "/friends", "value": None}],
+                         self.encoder.default_json_patch(self.person, self.previous)[0])
+        self.assertRaises(ValueError, self.encoder.default_merge_patch, self.person, self.previous)
+
+    def test_when_no_previous_encoding(self):
+        json_patch, encoded = self.encoder.default_json_patch(self.person, None)
+        self.assertEqual([{"op": "replace", "path": "", "value": self.previous}], json_patch)
+        self.assertEqual(self.previous, self.encoder.default_merge_patch(self.person, None)[0])
+
+    def test_with_previous_encoding_containing_unknown_property(self):
+        self.previous["unknown"] = 1
+        self.previous["details"]["unknown"] = 2
+        self._assert_patches([{"op": "remove", "path": "/details/unknown"}, {"op": "remove", "path": "/unknown"}])
+
+    def test_unchanged_values_are_shared_with_previous_encoding(self):
+        self.person.name = "Alicia"
+        encoded = self.encoder.default_json_patch(self.person, self.previous)[1]
+        self.assertIs(self.previous["friends"], encoded["friends"])
+
+
+if __name__ == "__main__":
+    unittest.main()
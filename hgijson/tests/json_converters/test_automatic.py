@@ -1,8 +1,12 @@
 import json
 import unittest
+from abc import ABCMeta
 from json import JSONEncoder
 
-from hgijson.json_converters.automatic import AutomaticJSONEncoderClassBuilder
+from hgijson import JsonPropertyMapping, MappingJSONDecoderClassBuilder
+from hgijson.json_converters.automatic import AutomaticJSONEncoderClassBuilder, AutomaticJSONDecoderClassBuilder, \
+    _MAX_RESOLVED_JSON_ENCODERS
+from hgijson.tests._models import SimpleModel, BaseModel
 from hgijson.tests._stubs import StubModel, StubRegisteredTypeJSONEncoder
 
 
@@ -41,6 +45,54 @@ class TestAutomaticJSONEncoderClassBuilder(unittest.TestCase):
         self.encoder_builder.register_json_encoder(JSONEncoder, JSONEncoder)
         self.assertEqual(self.encoder_builder.get_json_encoders_for_type(JSONEncoder), JSONEncoder)
 
+    def test_get_json_encoders_for_type_if_superclass_registered(self):
+        class SubJSONEncoder(JSONEncoder):
+            pass
+
+        class SubSubJSONEncoder(SubJSONEncoder):
+            pass
+
+        self.encoder_builder.register_json_encoder(JSONEncoder, StubRegisteredTypeJSONEncoder)
+        self.encoder_builder.register_json_encoder(SubJSONEncoder, JSONEncoder)
+        self.assertEqual(self.encoder_builder.get_json_encoders_for_type(SubSubJSONEncoder), JSONEncoder)
+
+    def test_get_json_encoders_for_type_if_abstract_base_class_registered(self):
+        class AbstractModel(metaclass=ABCMeta):
+            pass
+
+        AbstractModel.register(StubModel)
+        self.encoder_builder.register_json_encoder(AbstractModel, JSONEncoder)
+        self.assertEqual(self.encoder_builder.get_json_encoders_for_type(StubModel), JSONEncoder)
+
+    def test_get_json_encoders_for_type_if_multiple_abstract_base_classes_registered(self):
+        class AbstractModel(metaclass=ABCMeta):
+            pass
+
+        class AbstractSubModel(AbstractModel):
+            pass
+
+        class OtherAbstractModel(metaclass=ABCMeta):
+            pass
+
+        class SubStubModel(StubModel):
+            pass
+
+        AbstractModel.register(StubModel)
+        AbstractSubModel.register(StubModel)
+        OtherAbstractModel.register(SubStubModel)
+        self.encoder_builder.register_json_encoder(AbstractModel, JSONEncoder)
+        self.encoder_builder.register_json_encoder(OtherAbstractModel, StubRegisteredTypeJSONEncoder)
+        self.assertEqual(self.encoder_builder.get_json_encoders_for_type(SubStubModel), StubRegisteredTypeJSONEncoder)
+        self.assertEqual(self.encoder_builder.get_json_encoders_for_type(StubModel), JSONEncoder)
+
+        self.encoder_builder.register_json_encoder(AbstractSubModel, StubRegisteredTypeJSONEncoder)
+        self.assertEqual(self.encoder_builder.get_json_encoders_for_type(StubModel), StubRegisteredTypeJSONEncoder)
+
+    def test_get_json_encoders_for_type_after_subsequent_registration(self):
+        self.assertIsNone(self.encoder_builder.get_json_encoders_for_type(StubModel))
+        self.encoder_builder.register_json_encoder(StubModel, JSONEncoder)
+        self.assertEqual(self.encoder_builder.get_json_encoders_for_type(StubModel), JSONEncoder)
+
     def test_reset_registered_json_encoders(self):
         self.encoder_builder.register_json_encoder(JSONEncoder, JSONEncoder)
         self.encoder_builder.reset_registered_json_encoders()
@@ -82,6 +134,105 @@ class TestAutomaticJSONEncoderClassBuilder(unittest.TestCase):
         self.assertRaises(TypeError, json.dumps, StubModel(), cls=Encoder)
         self.assertEqual(json.dumps(StubModel(), cls=self.encoder_builder.build()), json.dumps(expect_encode))
 
+    def test_build_bounds_resolved_encoders(self):
+        Encoder = self.encoder_builder.build()
+        for i in range(_MAX_RESOLVED_JSON_ENCODERS * 2):
+            self.assertIsNone(Encoder._get_json_encoders_for_type(type("Model%d" % i, (), {})))
+        self.assertEqual(_MAX_RESOLVED_JSON_ENCODERS, Encoder._get_json_encoders_for_type.cache_info().currsize)
+
+    def test_build_does_not_share_encoders_between_instances(self):
+        self.encoder_builder.register_json_encoder(StubModel, _CountingJSONEncoder)
+        Encoder = self.encoder_builder.build()
+        _CountingJSONEncoder.instances = 0
+
+        json.dumps([StubModel(), StubModel()], cls=Encoder)
+        self.assertEqual(1, _CountingJSONEncoder.instances)
+        json.dumps([StubModel(), StubModel()], cls=Encoder)
+        self.assertEqual(2, _CountingJSONEncoder.instances)
+
+
+_SimpleModelJSONDecoder = MappingJSONDecoderClassBuilder(SimpleModel, [
+    JsonPropertyMapping("a", "a")
+]).build()
+
+
+class _OtherModel(BaseModel):
+    def __init__(self):
+        self.c = None
+
+
+_OtherModelJSONDecoder = MappingJSONDecoderClassBuilder(_OtherModel, [
+    JsonPropertyMapping("c", "c")
+]).build()
+
+
+class TestAutomaticJSONDecoderClassBuilder(unittest.TestCase):
+    """
+    Tests for `AutomaticJSONDecoderClassBuilder`.
+    """
+    def setUp(self):
+        self.decoder_builder = AutomaticJSONDecoderClassBuilder("type")
+        self.decoder_builder.register_json_decoder("simple", _SimpleModelJSONDecoder)
+        self.decoder_builder.register_json_decoder("other_model", _OtherModelJSONDecoder)
+
+    def test_get_json_decoder_for_discriminator(self):
+        self.assertEqual(_SimpleModelJSONDecoder, self.decoder_builder.get_json_decoder_for_discriminator("simple"))
+        self.assertIsNone(self.decoder_builder.get_json_decoder_for_discriminator("other"))
+
+    def test_register_json_decoder_that_does_not_decode_parsed(self):
+        self.assertRaises(TypeError, self.decoder_builder.register_json_decoder, "other", json.JSONDecoder)
+
+    def test_reset_registered_json_decoders(self):
+        self.decoder_builder.reset_registered_json_decoders()
+        self.assertIsNone(self.decoder_builder.get_json_decoder_for_discriminator("simple"))
+
+    def test_build_decodes_object(self):
+        decoded = json.loads('{"type": "other_model", "c": 1}', cls=self.decoder_builder.build())
+        self.assertIsInstance(decoded, _OtherModel)
+        self.assertEqual(1, decoded.c)
+
+    def test_build_decodes_mixed_list(self):
+        json_as_string = '[{"type": "simple", "a": 1}, {"type": "other_model", "c": 2}, null, ' \
+                         '{"type": "simple", "a": 3}]'
+        decoded = json.loads(json_as_string, cls=self.decoder_builder.build())
+        self.assertEqual([SimpleModel, _OtherModel, type(None), SimpleModel], [type(item) for item in decoded])
+        self.assertEqual([1, 2, 3], [decoded[0].a, decoded[1].c, decoded[3].a])
+
+    def test_build_with_unknown_discriminator(self):
+        self.assertRaises(ValueError, json.loads, '{"type": "other"}', cls=self.decoder_builder.build())
+        self.assertRaises(ValueError, json.loads, '{"a": 1}', cls=self.decoder_builder.build())
+
+    def test_build_with_property_names_discriminator(self):
+        decoder_builder = AutomaticJSONDecoderClassBuilder()
+        decoder_builder.register_json_decoder(frozenset({"a"}), _SimpleModelJSONDecoder)
+        decoder_builder.register_json_decoder(frozenset({"c"}), _OtherModelJSONDecoder)
+        decoded = json.loads('[{"c": 1}, {"a": 2}]', cls=decoder_builder.build())
+        self.assertEqual([_OtherModel, SimpleModel], [type(item) for item in decoded])
+
+    def test_build_with_discriminator_function(self):
+        decoder_builder = AutomaticJSONDecoderClassBuilder(lambda parsed_json: parsed_json["kind"].lower())
+        decoder_builder.register_json_decoder("simple", _SimpleModelJSONDecoder)
+        self.assertIsInstance(json.loads('{"kind": "SIMPLE", "a": 1}', cls=decoder_builder.build()), SimpleModel)
+
+    def test_build_not_influenced_by_future_registrations(self):
+        Decoder = self.decoder_builder.build()
+        self.decoder_builder.reset_registered_json_decoders()
+        self.assertIsInstance(json.loads('{"type": "simple", "a": 1}', cls=Decoder), SimpleModel)
+
+
+class _CountingJSONEncoder(JSONEncoder):
+    """
+    JSON encoder that counts the number of times it has been instantiated.
+    """
+    instances = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _CountingJSONEncoder.instances += 1
+
+    def default(self, o):
+        return None
+
 
 if __name__ == "__main__":
     unittest.main()
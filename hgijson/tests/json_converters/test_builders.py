@@ -41,6 +41,22 @@ class _Container(BaseModel):
         self.contains = container
 
 
+class _Slotted:
+    __slots__ = ("name", "_size")
+
+    def __init__(self):
+        self.name = None
+        self._size = None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @size.setter
+    def size(self, size: int):
+        self._size = size
+
+
 class TestMappingJSONEncoderClassBuilder(unittest.TestCase):
     """
     Tests for `MappingJSONEncoderClassBuilder`.
@@ -234,6 +250,109 @@ class TestMappingJSONDecoderClassBuilder(unittest.TestCase):
         employee_as_json_string = json.dumps([employee_as_json])
         self.assertEqual(EmployeeJSONDecoder().decode(employee_as_json_string), [employee])
 
+    def test_build_with_slotted_target(self):
+        SlottedJSONDecoder = MappingJSONDecoderClassBuilder(_Slotted, [
+            JsonPropertyMapping("name", "name"),
+            JsonPropertyMapping("size", "size")
+        ]).build()
+        decoded = SlottedJSONDecoder().decode(json.dumps([{"name": "a", "size": 1}, {"name": "b", "size": 2}]))
+        self.assertEqual([("a", 1), ("b", 2)], [(slotted.name, slotted.size) for slotted in decoded])
+
+    def test_build_with_slotted_target_without_property(self):
+        builder = MappingJSONDecoderClassBuilder(_Slotted, [JsonPropertyMapping("other", "other")])
+        self.assertRaises(AttributeError, builder.build)
+
+    def test_build_with_target_without_property(self):
+        decoder = MappingJSONDecoderClassBuilder(_Named, [JsonPropertyMapping("other", "other")]).build()()
+        self.assertRaises(AttributeError, decoder.decode, json.dumps({"other": 1}))
+
+    def test_build_does_not_change_mappings(self):
+        mapping = JsonPropertyMapping("name", "name")
+        object_property_setter = mapping.object_property_setter
+        MappingJSONDecoderClassBuilder(_Slotted, [mapping]).build()
+        self.assertIs(object_property_setter, mapping.object_property_setter)
+
+    def test_build_bypassing_constructor(self):
+        decoder_cls = MappingJSONDecoderClassBuilder(SimpleModel, get_simple_model_json_property_mappings(),
+                                                     bypass_constructor=True).build()
+        decoded = decoder_cls().decode(json.dumps([self.simple_model_as_json]))
+        self.assertEqual([self.simple_model], decoded)
+
+    def test_build_bypassing_constructor_with_defaults(self):
+        decoder_cls = MappingJSONDecoderClassBuilder(_Container, [
+            JsonPropertyMapping("colour", "colour", object_constructor_parameter_name="colour"),
+            JsonPropertyMapping("contains", "contains", optional=True)
+        ], bypass_constructor=True).build()
+        decoded = decoder_cls().decode(json.dumps({"colour": "red"}))
+        self.assertEqual(_Container("red"), decoded)
+
+    def test_build_bypassing_constructor_of_slotted_target(self):
+        decoder_cls = MappingJSONDecoderClassBuilder(_Slotted, [
+            JsonPropertyMapping("name", "name"),
+            JsonPropertyMapping("size", "size")
+        ], bypass_constructor=True).build()
+        decoded = decoder_cls().decode(json.dumps({"name": "a", "size": 1}))
+        self.assertEqual(("a", 1), (decoded.name, decoded.size))
+
+    def test_build_bypassing_constructor_with_custom_setter(self):
+        builder = MappingJSONDecoderClassBuilder(SimpleModel, [
+            JsonPropertyMapping("a", object_property_setter=lambda obj, value: setattr(obj, "a", value))
+        ], bypass_constructor=True)
+        self.assertRaises(ValueError, builder.build)
+
+    def test_build_bypassing_constructor_of_target_with_new(self):
+        class WithNew(SimpleModel):
+            def __new__(cls, *args, **kwargs):
+                return super().__new__(cls)
+
+        builder = MappingJSONDecoderClassBuilder(WithNew, get_simple_model_json_property_mappings(),
+                                                 bypass_constructor=True)
+        self.assertRaises(ValueError, builder.build)
+
+    def test_build_trusted(self):
+        decoder_cls = MappingJSONDecoderClassBuilder(SimpleModel, get_simple_model_json_property_mappings(),
+                                                     trusted=True).build()
+        decoded = decoder_cls().decode(json.dumps([self.simple_model_as_json]))
+        self.assertEqual([self.simple_model], decoded)
+
+    def test_build_trusted_with_optional_and_parent_properties(self):
+        decoder_cls = MappingJSONDecoderClassBuilder(_Employee, [
+            JsonPropertyMapping("name", "name", parent_json_properties=["details"]),
+            JsonPropertyMapping("title", "title", parent_json_properties=["details"], optional=True),
+            JsonPropertyMapping("id", "id", optional=True)
+        ], trusted=True).build()
+        decoded = decoder_cls().decode(json.dumps([{"details": {"name": "a", "title": "b"}, "id": 1},
+                                                   {"details": {"name": "c"}}]))
+        self.assertEqual([("a", "b", 1), ("c", None, None)], [(employee.name, employee.title, employee.id)
+                                                                 for employee in decoded])
+
+    def test_build_trusted_uses_values_as_parsed(self):
+        decoder = MappingJSONDecoderClassBuilder(_Named, [JsonPropertyMapping("name", "name")], trusted=True).build()()
+        parsed = {"name": {"a": [1.5]}}
+        self.assertIs(parsed["name"], decoder.decode_parsed(parsed).name)
+
+    def test_build_uses_values_as_parsed(self):
+        decoder = MappingJSONDecoderClassBuilder(_Named, [JsonPropertyMapping("name", "name")]).build()()
+        parsed = {"name": {"a": [1.5]}}
+        self.assertIs(parsed["name"], decoder.decode_parsed(parsed).name)
+
+    def test_build_trusted_with_missing_property(self):
+        decoder = MappingJSONDecoderClassBuilder(_Named, [JsonPropertyMapping("name", "name")], trusted=True).build()()
+        with self.assertRaises(KeyError) as context:
+            decoder.decode(json.dumps({}))
+        self.assertEqual(("name", ), context.exception.args)
+
+    def test_build_trusted_with_target_without_property(self):
+        decoder = MappingJSONDecoderClassBuilder(_Named, [JsonPropertyMapping("other", "other")],
+                                                 trusted=True).build()()
+        self.assertEqual(1, decoder.decode(json.dumps({"other": 1})).other)
+
+    def test_build_trusted_does_not_change_mappings(self):
+        mapping = JsonPropertyMapping("name", "name")
+        json_property_getter = mapping.serialized_property_getter
+        MappingJSONDecoderClassBuilder(_Named, [mapping], trusted=True).build()
+        self.assertIs(json_property_getter, mapping.serialized_property_getter)
+
 
 if __name__ == "__main__":
     unittest.main()
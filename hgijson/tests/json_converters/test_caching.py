@@ -0,0 +1,121 @@
+import json
+import unittest
+from collections import namedtuple
+from operator import attrgetter
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder, EncodedObjectCache
+from hgijson.json_converters.caching import MISSING
+
+_Currency = namedtuple("_Currency", ["code", "name", "version"])
+_Price = namedtuple("_Price", ["amount", "currency"])
+
+
+class _CountingCurrency(_Currency):
+    """
+    Currency that counts the number of times its name has been got.
+    """
+    gets = 0
+
+    def __getattribute__(self, name):
+        if name == "name":
+            _CountingCurrency.gets += 1
+        return super().__getattribute__(name)
+
+
+def _create_currency_encoder(cache: EncodedObjectCache) -> type:
+    return MappingJSONEncoderClassBuilder(_Currency, [
+        JsonPropertyMapping("code", "code"),
+        JsonPropertyMapping("name", "name")
+    ], encoded_object_cache=cache).build()
+
+
+class TestEncodedObjectCache(unittest.TestCase):
+    """
+    Tests for `EncodedObjectCache`.
+    """
+    def setUp(self):
+        self.cache = EncodedObjectCache(max_size=2)
+
+    def test_get_when_missing(self):
+        self.assertIs(MISSING, self.cache.get("a"))
+        self.assertEqual(1, self.cache.misses)
+
+    def test_put_and_get(self):
+        self.cache.put("a", {"a": 1})
+        self.assertEqual({"a": 1}, self.cache.get("a"))
+        self.assertEqual(1, self.cache.hits)
+
+    def test_least_recently_used_evicted(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.get("a")
+        self.cache.put("c", 3)
+        self.assertEqual(2, len(self.cache))
+        self.assertIs(MISSING, self.cache.get("b"))
+        self.assertEqual(1, self.cache.get("a"))
+        self.assertEqual(1, self.cache.evictions)
+
+    def test_unhashable_key(self):
+        self.cache.put([], 1)
+        self.assertEqual(0, len(self.cache))
+        self.assertIs(MISSING, self.cache.get([]))
+
+    def test_clear(self):
+        self.cache.put("a", 1)
+        self.cache.get("a")
+        self.cache.clear()
+        self.assertEqual((0, 0, 0), (len(self.cache), self.cache.hits, self.cache.misses))
+
+    def test_invalid_max_size(self):
+        self.assertRaises(ValueError, EncodedObjectCache, 0)
+
+
+class TestEncodedObjectCaching(unittest.TestCase):
+    """
+    Tests for encoders built with an `EncodedObjectCache`.
+    """
+    def setUp(self):
+        _CountingCurrency.gets = 0
+
+    def test_encodings_reused(self):
+        cache = EncodedObjectCache()
+        Encoder = _create_currency_encoder(cache)
+        currencies = [_CountingCurrency("GBP", "Pound", 1), _CountingCurrency("EUR", "Euro", 1)]
+        expected = [{"code": "GBP", "name": "Pound"}, {"code": "EUR", "name": "Euro"}]
+        self.assertEqual(expected, Encoder().default(currencies))
+        self.assertEqual(2, _CountingCurrency.gets)
+        self.assertEqual(expected + expected[:1], json.loads(json.dumps(currencies + currencies[:1], cls=Encoder)))
+        self.assertEqual(2, _CountingCurrency.gets)
+        self.assertEqual(3, cache.hits)
+
+    def test_encodings_of_nested_objects_reused(self):
+        cache = EncodedObjectCache()
+        PriceEncoder = MappingJSONEncoderClassBuilder(_Price, [
+            JsonPropertyMapping("amount", "amount"),
+            JsonPropertyMapping("currency", "currency", encoder_cls=_create_currency_encoder(cache))
+        ]).build()
+        currency = _CountingCurrency("GBP", "Pound", 1)
+        prices = [_Price(1, currency), _Price(2, currency)]
+        self.assertEqual([{"amount": 1, "currency": {"code": "GBP", "name": "Pound"}},
+                          {"amount": 2, "currency": {"code": "GBP", "name": "Pound"}}], PriceEncoder().default(prices))
+        PriceEncoder().default(prices)
+        self.assertEqual(2, _CountingCurrency.gets)
+
+    def test_key(self):
+        cache = EncodedObjectCache(key=attrgetter("code", "version"))
+        Encoder = _create_currency_encoder(cache)
+        Encoder().default(_Currency("GBP", "Pound", 1))
+        self.assertEqual({"code": "GBP", "name": "Pound"}, Encoder().default(_Currency("GBP", "Other", 1)))
+        self.assertEqual({"code": "GBP", "name": "Sterling"}, Encoder().default(_Currency("GBP", "Sterling", 2)))
+
+    def test_not_used_with_sparse_fieldsets(self):
+        cache = EncodedObjectCache()
+        Encoder = _create_currency_encoder(cache)
+        currency = _Currency("GBP", "Pound", 1)
+        Encoder().default(currency)
+        self.assertEqual({"code": "GBP"}, Encoder(fields=["code"]).default(currency))
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder, MappingJSONDecoderClassBuilder, \
+    DatetimeISOFormatJSONEncoder, DatetimeISOFormatJSONDecoder, EncodedObjectCache, SerializationLimits
+from hgijson.json_converters.compilation import compile_codecs, load_compiled_codecs, fingerprint_codecs
+from hgijson.tests._models import BaseModel, SimpleModel
+
+
+class _Office(BaseModel):
+    def __init__(self, name):
+        self.name = name
+        self.floors = None
+
+
+class _Employee(BaseModel):
+    def __init__(self, name, joined=None):
+        self.name = name
+        self.joined = joined
+        self.offices = []
+        self.tags = set()
+        self.manager = None
+
+
+_OfficeJSONEncoder = MappingJSONEncoderClassBuilder(_Office, [
+    JsonPropertyMapping("name", "name", "name"),
+    JsonPropertyMapping("floors", "floors", optional=True, parent_json_properties=["building"])
+]).build()
+_OfficeJSONDecoder = MappingJSONDecoderClassBuilder(_Office, [
+    JsonPropertyMapping("name", "name", "name"),
+    JsonPropertyMapping("floors", "floors", optional=True, parent_json_properties=["building"])
+]).build()
+
+_employee_mappings = [
+    JsonPropertyMapping("name", "name", "name", parent_json_properties=["details"]),
+    JsonPropertyMapping("joined", "joined", "joined", optional=True, parent_json_properties=["details"],
+                        encoder_cls=DatetimeISOFormatJSONEncoder, decoder_cls=DatetimeISOFormatJSONDecoder),
+    JsonPropertyMapping("offices", "offices", encoder_cls=_OfficeJSONEncoder, decoder_cls=_OfficeJSONDecoder),
+    JsonPropertyMapping("tags", "tags", collection_factory=set),
+    JsonPropertyMapping("manager", "manager", optional=True, encoder_cls=lambda: _EmployeeJSONEncoder,
+                        decoder_cls=lambda: _EmployeeJSONDecoder)
+]
+_EmployeeJSONEncoder = MappingJSONEncoderClassBuilder(_Employee, _employee_mappings).build()
+_EmployeeJSONDecoder = MappingJSONDecoderClassBuilder(_Employee, _employee_mappings).build()
+
+
+def _create_employees():
+    manager = _Employee("Alice", datetime(2020, 1, 2, tzinfo=timezone.utc))
+    manager.offices = [_Office("London"), None]
+    manager.offices[0].floors = 3
+    employee = _Employee("Bob")
+    employee.tags = {"new"}
+    employee.manager = manager
+    return [employee, manager, None]
+
+
+class TestCompilation(unittest.TestCase):
+    """
+    Tests for `compile_codecs` and `load_compiled_codecs`.
+    """
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "codecs.py")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_compile_and_load(self):
+        fingerprint = compile_codecs([_EmployeeJSONEncoder, _EmployeeJSONDecoder], self.path)
+        codecs = load_compiled_codecs(self.path, fingerprint)
+        self.assertEqual(fingerprint, codecs.SCHEMA_FINGERPRINT)
+        self.assertEqual({_Employee}, codecs.ENCODERS.keys())
+        self.assertEqual({_Employee}, codecs.DECODERS.keys())
+
+    def test_encode_same_as_built_encoder(self):
+        fingerprint = compile_codecs([_EmployeeJSONEncoder], self.path)
+        Encoder = load_compiled_codecs(self.path, fingerprint).ENCODERS[_Employee]
+        employees = _create_employees()
+        self.assertEqual(json.dumps(employees, cls=_EmployeeJSONEncoder), json.dumps(employees, cls=Encoder))
+        self.assertEqual(Encoder().default(employees[0]), _EmployeeJSONEncoder().default(employees[0]))
+
+    def test_encode_with_sort_keys_same_as_built_encoder(self):
+        fingerprint = compile_codecs([_EmployeeJSONEncoder], self.path)
+        Encoder = load_compiled_codecs(self.path, fingerprint).ENCODERS[_Employee]
+        employees = _create_employees()
+        employees[0].tags = {"c", "a", "b", "d"}
+        self.assertEqual(json.dumps(employees, cls=_EmployeeJSONEncoder, sort_keys=True),
+                         json.dumps(employees, cls=Encoder, sort_keys=True))
+
+    def test_encode_with_unsupported_arguments(self):
+        fingerprint = compile_codecs([_EmployeeJSONEncoder, _EmployeeJSONDecoder], self.path)
+        codecs = load_compiled_codecs(self.path, fingerprint)
+        employees = _create_employees()
+        for kwargs in ({"fields": ["tags"]}, {"columnar": True}, {"limits": SerializationLimits(max_depth=2)}):
+            self.assertRaises(ValueError, json.dumps, employees, cls=codecs.ENCODERS[_Employee], **kwargs)
+        for kwargs in ({"intern_keys": True}, {"limits": SerializationLimits(max_depth=2)}):
+            self.assertRaises(ValueError, json.loads, "[]", cls=codecs.DECODERS[_Employee], **kwargs)
+
+    def test_compile_encoder_with_encoded_object_cache(self):
+        Encoder = MappingJSONEncoderClassBuilder(_Office, [JsonPropertyMapping("name", "name")],
+                                                 encoded_object_cache=EncodedObjectCache()).build()
+        self.assertRaises(ValueError, compile_codecs, [Encoder], self.path)
+
+    def test_decode_same_as_built_decoder(self):
+        fingerprint = compile_codecs([_EmployeeJSONDecoder], self.path)
+        Decoder = load_compiled_codecs(self.path, fingerprint).DECODERS[_Employee]
+        employees_as_json = json.dumps(_create_employees(), cls=_EmployeeJSONEncoder)
+        self.assertEqual(json.loads(employees_as_json, cls=_EmployeeJSONDecoder),
+                         json.loads(employees_as_json, cls=Decoder))
+
+    def test_decode_when_missing_property(self):
+        fingerprint = compile_codecs([_EmployeeJSONDecoder], self.path)
+        Decoder = load_compiled_codecs(self.path, fingerprint).DECODERS[_Employee]
+        self.assertRaises(KeyError, Decoder().decode_parsed, {"offices": [], "tags": []})
+        self.assertRaises(KeyError, Decoder().decode_parsed, {"details": {}, "offices": [], "tags": []})
+
+    def test_load_when_missing(self):
+        self.assertIsNone(load_compiled_codecs(self.path, "v1"))
+
+    def test_load_with_different_fingerprint(self):
+        compile_codecs([_OfficeJSONEncoder], self.path, "v1")
+        self.assertIsNone(load_compiled_codecs(self.path, "v2"))
+        self.assertEqual("v1", load_compiled_codecs(self.path, "v1").SCHEMA_FINGERPRINT)
+
+    def test_fingerprint_changes_with_schema(self):
+        fingerprint = compile_codecs([_OfficeJSONEncoder], self.path)
+        self.assertEqual(fingerprint, compile_codecs([_OfficeJSONEncoder], self.path))
+        self.assertNotEqual(fingerprint, compile_codecs([_OfficeJSONEncoder, _OfficeJSONDecoder], self.path))
+
+    def test_load_stale_module(self):
+        compile_codecs([_OfficeJSONEncoder], self.path)
+        self.assertIsNone(load_compiled_codecs(self.path, fingerprint_codecs([_OfficeJSONEncoder, _OfficeJSONDecoder])))
+        fingerprint = fingerprint_codecs([_OfficeJSONEncoder])
+        self.assertEqual(fingerprint, load_compiled_codecs(self.path, fingerprint).SCHEMA_FINGERPRINT)
+
+    def test_compile_custom_mapping(self):
+        Encoder = MappingJSONEncoderClassBuilder(_Office, [
+            JsonPropertyMapping("name", object_property_getter=lambda office: office.name.upper())
+        ]).build()
+        self.assertRaises(ValueError, compile_codecs, [Encoder], self.path)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_compile_canonicalizing_mapping(self):
+        Decoder = MappingJSONDecoderClassBuilder(_Office, [
+            JsonPropertyMapping("name", object_constructor_parameter_name="name", canonicalize=True)
+        ]).build()
+        self.assertRaises(ValueError, compile_codecs, [Decoder], self.path)
+
+    def test_compile_local_class(self):
+        class Local(BaseModel):
+            pass
+
+        Encoder = MappingJSONEncoderClassBuilder(Local, [JsonPropertyMapping("a", "a")]).build()
+        self.assertRaises(ValueError, compile_codecs, [Encoder], self.path)
+
+    def test_compile_multiple_encoders_for_class(self):
+        Encoder = MappingJSONEncoderClassBuilder(_Office, [JsonPropertyMapping("name", "name")]).build()
+        self.assertRaises(ValueError, compile_codecs, [_OfficeJSONEncoder, Encoder], self.path)
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Lazy imports are not supported")
+    def test_load_does_not_import_builders(self):
+        Decoder = MappingJSONDecoderClassBuilder(SimpleModel, [JsonPropertyMapping("a", "a")]).build()
+        fingerprint = compile_codecs([Decoder], self.path)
+        code = "import sys; from hgijson.json_converters.compilation import load_compiled_codecs; " \
+               "load_compiled_codecs(%r, %r); print('hgijson.json_converters.builders' in sys.modules)" \
+               % (self.path, fingerprint)
+        output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+        self.assertEqual("False", output.strip())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import hashlib
+import io
+import json
+import unittest
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder, iterencode_with_digest, dump_with_digest, \
+    dumps_with_digest, EncodedObjectCache
+from hgijson.tests._models import BaseModel
+
+
+class _Team(BaseModel):
+    def __init__(self, name, members):
+        self.name = name
+        self.members = members
+
+
+_TeamJSONEncoder = MappingJSONEncoderClassBuilder(_Team, [
+    JsonPropertyMapping("name", "name"),
+    JsonPropertyMapping("members", "members", collection_factory=set)
+]).build()
+
+_CachingTeamJSONEncoder = MappingJSONEncoderClassBuilder(_Team, [
+    JsonPropertyMapping("name", "name"),
+    JsonPropertyMapping("members", "members", collection_factory=set)
+], encoded_object_cache=EncodedObjectCache(key=lambda team: team.name)).build()
+
+
+class _Collision(str):
+    """
+    String with a constant hash, so that the iteration order of a set of collisions depends on insertion order.
+    """
+    def __hash__(self):
+        return 0
+
+
+class TestDigests(unittest.TestCase):
+    """
+    Tests for encoding JSON whilst computing its digest.
+    """
+    def setUp(self):
+        self.team = _Team("a", {"x", "y", "z", 1})
+
+    def test_iterencode_with_digest(self):
+        digest = hashlib.sha256()
+        json_as_string = "".join(iterencode_with_digest(self.team, digest, _TeamJSONEncoder))
+        self.assertEqual(hashlib.sha256(json_as_string.encode("utf-8")).hexdigest(), digest.hexdigest())
+        self.assertEqual({"name": "a", "members": ["x", "y", "z", 1]}, json.loads(json_as_string))
+
+    def test_dump_with_digest(self):
+        file = io.StringIO()
+        digest = dump_with_digest(self.team, file, _TeamJSONEncoder, algorithm="md5")
+        self.assertEqual(hashlib.md5(file.getvalue().encode("utf-8")).hexdigest(), digest)
+
+    def test_dumps_with_digest(self):
+        json_as_string, digest = dumps_with_digest({"b": "é", "a": [self.team]}, _TeamJSONEncoder, ensure_ascii=False)
+        self.assertTrue(json_as_string.startswith("{\"a\": [{\"members\": [\"x\", "))
+        self.assertEqual(hashlib.sha256(json_as_string.encode("utf-8")).hexdigest(), digest)
+        self.assertEqual((json_as_string, digest), dumps_with_digest({"a": [self.team], "b": "é"}, _TeamJSONEncoder,
+                                                                      ensure_ascii=False))
+
+    def test_sets_sorted_deterministically(self):
+        first = _Team("a", {_Collision("x"), _Collision("y")})
+        second = _Team("a", {_Collision("y"), _Collision("x")})
+        self.assertNotEqual(list(first.members), list(second.members))
+        self.assertEqual(dumps_with_digest(first, _TeamJSONEncoder), dumps_with_digest(second, _TeamJSONEncoder))
+
+    def test_sets_sorted_with_encoded_object_cache(self):
+        team = _Team("a", {_Collision("y"), _Collision("x")})
+        unsorted = json.loads(json.dumps(team, cls=_CachingTeamJSONEncoder))["members"]
+        self.assertEqual(list(team.members), unsorted)
+        json_as_string, _ = dumps_with_digest(team, _CachingTeamJSONEncoder)
+        self.assertEqual(["x", "y"], json.loads(json_as_string)["members"])
+        self.assertEqual(unsorted, json.loads(json.dumps(team, cls=_CachingTeamJSONEncoder))["members"])
+
+    def test_sets_not_sorted_without_sort_keys(self):
+        team = _Team("a", {_Collision("y"), _Collision("x")})
+        self.assertEqual(list(team.members), json.loads(json.dumps(team, cls=_TeamJSONEncoder))["members"])
+
+
+if __name__ == "__main__":
+    unittest.main()
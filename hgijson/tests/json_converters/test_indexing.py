@@ -0,0 +1,137 @@
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from hgijson import JsonPropertyMapping, MappingJSONDecoderClassBuilder, JSONRecordIndex
+from hgijson.tests._models import BaseModel
+
+
+class _Record(BaseModel):
+    def __init__(self, name):
+        self.name = name
+        self.values = None
+
+
+_RecordJSONDecoder = MappingJSONDecoderClassBuilder(_Record, [
+    JsonPropertyMapping("name", object_constructor_parameter_name="name"),
+    JsonPropertyMapping("values", "values")
+]).build()
+
+_RECORDS_AS_JSON = [
+    {"name": "a", "values": [1, 2]},
+    {"name": "b,]}\"[{", "values": [{"c": [3]}]},
+    {"name": "é", "values": []}
+]
+
+
+class _TestJSONRecordIndex(unittest.TestCase):
+    """
+    Base class of tests for `JSONRecordIndex`.
+    """
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "records.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, content: str):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(content)
+
+
+class TestJSONRecordIndexOfJSONLines(_TestJSONRecordIndex):
+    """
+    Tests for `JSONRecordIndex` of NDJSON.
+    """
+    def setUp(self):
+        super().setUp()
+        self._write("\n".join(json.dumps(record, ensure_ascii=False) for record in _RECORDS_AS_JSON) + "\n\n  \n")
+        self.index = JSONRecordIndex.build(self.path)
+
+    def test_build(self):
+        self.assertEqual(3, len(self.index))
+
+    def test_read(self):
+        with self.index.open() as content:
+            self.assertEqual(_RECORDS_AS_JSON[1:], [json.loads(record.decode("utf-8"))
+                                                    for record in self.index.read(content, 1)])
+
+    def test_read_from_file(self):
+        with open(self.path, "rb") as file:
+            self.assertEqual(_RECORDS_AS_JSON[2], json.loads(self.index.read(file, 2, 3)[0].decode("utf-8")))
+
+    def test_decode(self):
+        with self.index.open() as content:
+            records = self.index.decode(_RecordJSONDecoder(), content, 1, 3)
+        self.assertEqual(["b,]}\"[{", "é"], [record.name for record in records])
+        self.assertEqual([{"c": [3]}], records[0].values)
+
+    def test_decode_with_json_decoder(self):
+        with self.index.open() as content:
+            self.assertEqual(_RECORDS_AS_JSON[:1], self.index.decode(json.JSONDecoder(), content, 0, 1))
+
+    def test_save_and_load(self):
+        self.index.save()
+        loaded = JSONRecordIndex.load(self.path)
+        self.assertEqual((list(self.index.starts), list(self.index.ends)), (list(loaded.starts), list(loaded.ends)))
+        self.assertFalse(loaded.json_array)
+
+    def test_load_when_missing(self):
+        self.assertIsNone(JSONRecordIndex.load(self.path))
+
+    def test_load_when_file_changed(self):
+        self.index.save()
+        self._write("{}\n")
+        self.assertIsNone(JSONRecordIndex.load(self.path))
+        self.assertEqual(1, len(JSONRecordIndex.load_or_build(self.path)))
+        self.assertEqual(1, len(JSONRecordIndex.load(self.path)))
+
+    def test_split(self):
+        ranges = self.index.split(2)
+        self.assertEqual(0, ranges[0][0])
+        self.assertEqual(3, ranges[-1][1])
+        self.assertEqual([end for _, end in ranges[:-1]], [start for start, _ in ranges[1:]])
+        self.assertEqual([(0, 3)], self.index.split(1))
+        self.assertEqual(3, len(self.index.split(10)))
+
+    def test_pickle(self):
+        self.assertEqual(list(self.index.ends), list(pickle.loads(pickle.dumps(self.index)).ends))
+
+
+class TestJSONRecordIndexOfJSONArray(_TestJSONRecordIndex):
+    """
+    Tests for `JSONRecordIndex` of a JSON array.
+    """
+    def test_build(self):
+        self._write(json.dumps(_RECORDS_AS_JSON, indent=2, ensure_ascii=False))
+        index = JSONRecordIndex.build(self.path, json_array=True)
+        with index.open() as content:
+            self.assertEqual(_RECORDS_AS_JSON, index.decode(json.JSONDecoder(), content))
+
+    def test_build_with_scalars(self):
+        self._write(" [1, \"a\\\"]\" , null,[],{} ] ")
+        index = JSONRecordIndex.build(self.path, json_array=True)
+        with index.open() as content:
+            self.assertEqual([1, "a\"]", None, [], {}], index.decode(json.JSONDecoder(), content))
+
+    def test_build_when_empty(self):
+        self._write("[ ]")
+        self.assertEqual(0, len(JSONRecordIndex.build(self.path, json_array=True)))
+
+    def test_build_when_not_array(self):
+        for content in ("{\"a\": [1]}", "[1, 2", "[1, , 2]", " "):
+            self._write(content)
+            self.assertRaises(ValueError, JSONRecordIndex.build, self.path, True)
+
+    def test_save_and_load(self):
+        self._write(json.dumps(_RECORDS_AS_JSON))
+        JSONRecordIndex.build(self.path, json_array=True).save()
+        self.assertTrue(JSONRecordIndex.load(self.path).json_array)
+
+
+if __name__ == "__main__":
+    unittest.main()
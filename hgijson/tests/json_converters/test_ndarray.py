@@ -0,0 +1,112 @@
+import json
+import unittest
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder, MappingJSONDecoderClassBuilder
+from hgijson.json_converters.ndarray import NumpyArrayJSONEncoder, NumpyArrayJSONDecoder, \
+    NumpyArrayBase64JSONEncoder, NumpyArrayBase64JSONDecoder
+from hgijson.tests._models import SimpleModel
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestNumpyArrayJSONEncoder(unittest.TestCase):
+    """
+    Tests for `NumpyArrayJSONEncoder`.
+    """
+    def test_default(self):
+        self.assertEqual([[1, 2], [3, 4]], NumpyArrayJSONEncoder().default(numpy.array([[1, 2], [3, 4]])))
+
+    def test_default_many(self):
+        arrays = [numpy.array([1.5, 2]), numpy.array([3, 4.5]), numpy.array([5.0])]
+        self.assertEqual([[1.5, 2.0], [3.0, 4.5], [5.0]], NumpyArrayJSONEncoder().default_many(arrays))
+        self.assertEqual([[1.5, 2.0], [3.0, 4.5]], NumpyArrayJSONEncoder().default_many(arrays[:2]))
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestNumpyArrayJSONDecoder(unittest.TestCase):
+    """
+    Tests for `NumpyArrayJSONDecoder`.
+    """
+    def test_decode(self):
+        decoded = json.loads("[1.5, 2.5]", cls=NumpyArrayJSONDecoder)
+        numpy.testing.assert_array_equal(numpy.array([1.5, 2.5]), decoded)
+
+    def test_decode_parsed_with_dtype(self):
+        class Int8ArrayJSONDecoder(NumpyArrayJSONDecoder):
+            DTYPE = numpy.int8
+
+        decoded = Int8ArrayJSONDecoder().decode_parsed([1, 2])
+        self.assertEqual(numpy.int8, decoded.dtype)
+
+    def test_decode_parsed_many(self):
+        decoded = NumpyArrayJSONDecoder().decode_parsed_many([[1, 2], [3, 4], None])
+        self.assertEqual([[1, 2], [3, 4], None], [array.tolist() if array is not None else None for array in decoded])
+        decoded = NumpyArrayJSONDecoder().decode_parsed_many([[1, 2], [3, 4]])
+        self.assertEqual([[1, 2], [3, 4]], [array.tolist() for array in decoded])
+        decoded = NumpyArrayJSONDecoder().decode_parsed_many([[[1], [2]], [[3, 4], [5, 6]]])
+        self.assertEqual([[[1], [2]], [[3, 4], [5, 6]]], [array.tolist() for array in decoded])
+
+    def test_decode_parsed_many_keeps_dtype_of_each_array(self):
+        decoded = NumpyArrayJSONDecoder().decode_parsed_many([[1, 2], [3.5, 4]])
+        self.assertEqual([NumpyArrayJSONDecoder().decode_parsed([1, 2]).dtype, numpy.float64],
+                         [array.dtype for array in decoded])
+
+    def test_decode_parsed_many_with_dtype(self):
+        class Int8ArrayJSONDecoder(NumpyArrayJSONDecoder):
+            DTYPE = numpy.int8
+
+        decoded = Int8ArrayJSONDecoder().decode_parsed_many([[1, 2], [3, 4]])
+        self.assertEqual([[1, 2], [3, 4]], [array.tolist() for array in decoded])
+        self.assertEqual([numpy.int8, numpy.int8], [array.dtype for array in decoded])
+        self.assertIsNone(decoded[0].base)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestNumpyArrayBase64Converters(unittest.TestCase):
+    """
+    Tests for `NumpyArrayBase64JSONEncoder` and `NumpyArrayBase64JSONDecoder`.
+    """
+    def test_encode_and_decode(self):
+        array = numpy.arange(6, dtype=numpy.float32).reshape((2, 3)).T
+        encoded = json.dumps(array, cls=NumpyArrayBase64JSONEncoder)
+        self.assertEqual({"dtype", "shape", "data"}, json.loads(encoded).keys())
+
+        decoded = json.loads(encoded, cls=NumpyArrayBase64JSONDecoder)
+        numpy.testing.assert_array_equal(array, decoded)
+        self.assertEqual(array.dtype, decoded.dtype)
+        decoded[0, 0] = 1
+
+    def test_encode_objects(self):
+        self.assertRaises(ValueError, NumpyArrayBase64JSONEncoder().default, numpy.array([object()]))
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestNumpyArrayMappings(unittest.TestCase):
+    """
+    Tests for using numpy array converters in property mappings.
+    """
+    def test_encode_and_decode(self):
+        mappings = [
+            JsonPropertyMapping("a", "a", encoder_cls=NumpyArrayJSONEncoder, decoder_cls=NumpyArrayJSONDecoder),
+            JsonPropertyMapping("b", "b", encoder_cls=NumpyArrayBase64JSONEncoder,
+                                decoder_cls=NumpyArrayBase64JSONDecoder)
+        ]
+        encoder_cls = MappingJSONEncoderClassBuilder(SimpleModel, mappings).build()
+        decoder_cls = MappingJSONDecoderClassBuilder(SimpleModel, mappings).build()
+
+        models = [SimpleModel(numpy.array([i, i + 1.5])) for i in range(3)]
+        for model in models:
+            model.a = numpy.array([1, 2, 3])
+
+        decoded = json.loads(json.dumps(models, cls=encoder_cls), cls=decoder_cls)
+        for model, decoded_model in zip(models, decoded):
+            numpy.testing.assert_array_equal(model.a, decoded_model.a)
+            numpy.testing.assert_array_equal(model.b, decoded_model.b)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import json
 import unittest
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
 from hgijson.json_converters.primitive import StrJSONDecoder, IntJSONEncoder, FloatJSONEncoder, FloatJSONDecoder, \
     DatetimeEpochJSONEncoder, DatetimeEpochJSONDecoder, DatetimeISOFormatJSONDecoder, DatetimeISOFormatJSONEncoder, \
@@ -91,6 +91,17 @@ class TestDatetimeEpochJSONEncoder(unittest.TestCase):
         value = datetime(1970, 1, 1, tzinfo=timezone.utc)
         self.assertEqual(0, DatetimeEpochJSONEncoder().default(value))
 
+    def test_default_many(self):
+        values = [datetime(1970, 1, 1, tzinfo=timezone.utc), datetime(1970, 1, 2, tzinfo=timezone.utc)]
+        self.assertEqual([0, 86400], DatetimeEpochJSONEncoder().default_many(values))
+
+    def test_default_many_with_subclass(self):
+        class _Datetime(datetime):
+            def timestamp(self):
+                return 1
+
+        self.assertEqual([1], DatetimeEpochJSONEncoder().default_many([_Datetime(1970, 1, 1)]))
+
 
 class TestDatetimeEpochJSONDecoder(unittest.TestCase):
     """
@@ -104,6 +115,15 @@ class TestDatetimeEpochJSONDecoder(unittest.TestCase):
         expected_value = datetime(1970, 1, 1, tzinfo=timezone.utc)
         self.assertEqual(expected_value, json.loads("0", cls=DatetimeEpochJSONDecoder))
 
+    def test_decode_parsed_many(self):
+        expected_values = [datetime(1970, 1, 1, tzinfo=timezone.utc), datetime(1970, 1, 2, tzinfo=timezone.utc)]
+        self.assertEqual(expected_values, DatetimeEpochJSONDecoder().decode_parsed_many([0, 86400]))
+
+    def test_decode_parsed_many_with_non_integers(self):
+        for value in (1234.5, True, "0", None):
+            self.assertRaises(ValueError, DatetimeEpochJSONDecoder().decode_parsed_many, [0, value])
+            self.assertRaises(ValueError, DatetimeEpochJSONDecoder().decode, json.dumps(value))
+
 
 class TestDatetimeISOFormatJSONEncoder(unittest.TestCase):
     """
@@ -113,6 +133,14 @@ class TestDatetimeISOFormatJSONEncoder(unittest.TestCase):
         value = datetime(1970, 1, 1, tzinfo=timezone.utc)
         self.assertEqual("1970-01-01T00:00:00+00:00", DatetimeISOFormatJSONEncoder().default(value))
 
+    def test_default_many(self):
+        values = [datetime(1970, 1, 1, tzinfo=timezone.utc), datetime(1970, 1, 2, tzinfo=timezone.utc)]
+        self.assertEqual(["1970-01-01T00:00:00+00:00", "1970-01-02T00:00:00+00:00"],
+                         DatetimeISOFormatJSONEncoder().default_many(values))
+
+    def test_default_many_with_date(self):
+        self.assertEqual(["1970-01-01"], DatetimeISOFormatJSONEncoder().default_many([date(1970, 1, 1)]))
+
 
 class TestDatetimeISOFormatJSONDecoder(unittest.TestCase):
     """
@@ -130,6 +158,11 @@ class TestDatetimeISOFormatJSONDecoder(unittest.TestCase):
         expected_value = datetime(1970, 1, 1, tzinfo=timezone.utc)
         self.assertEqual(expected_value, json.loads('"1970-01-01T00:00:00+00:00"', cls=DatetimeISOFormatJSONDecoder))
 
+    def test_decode_parsed_many(self):
+        expected_values = [datetime(1970, 1, 1, tzinfo=timezone.utc), datetime(1970, 1, 2, tzinfo=timezone.utc)]
+        self.assertEqual(expected_values, DatetimeISOFormatJSONDecoder().decode_parsed_many(
+            ["1970-01-01T00:00:00+00:00", "1970-01-02T00:00:00Z"]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,127 @@
+import json
+import unittest
+
+from hgijson import JsonPropertyMapping, MappingJSONEncoderClassBuilder, MappingJSONDecoderClassBuilder, RawJSON, \
+    RawJSONEncoder, RawJSONDecoder
+from hgijson.json_converters.automatic import AutomaticJSONEncoderClassBuilder
+from hgijson.tests._models import BaseModel
+
+
+class _Document(BaseModel):
+    def __init__(self, name, body=None):
+        self.name = name
+        self.body = body
+
+
+_DOCUMENT_MAPPINGS = [
+    JsonPropertyMapping("name", "name", "name"),
+    JsonPropertyMapping("body", "body", encoder_cls=RawJSONEncoder, decoder_cls=RawJSONDecoder, optional=True)
+]
+_DocumentJSONEncoder = MappingJSONEncoderClassBuilder(_Document, _DOCUMENT_MAPPINGS).build()
+_DocumentJSONDecoder = MappingJSONDecoderClassBuilder(_Document, _DOCUMENT_MAPPINGS).build()
+
+_FOLDER_MAPPINGS = [
+    JsonPropertyMapping("name", "name", "name"),
+    JsonPropertyMapping("documents", "body", encoder_cls=_DocumentJSONEncoder, decoder_cls=_DocumentJSONDecoder,
+                        parent_json_properties=["contents"])
+]
+_FolderJSONEncoder = MappingJSONEncoderClassBuilder(_Document, _FOLDER_MAPPINGS).build()
+_FolderJSONDecoder = MappingJSONDecoderClassBuilder(_Document, _FOLDER_MAPPINGS).build()
+
+
+class TestRawJSON(unittest.TestCase):
+    """
+    Tests for `RawJSON`.
+    """
+    def test_text(self):
+        self.assertEqual("[1,  2]", RawJSON("[1,  2]").text)
+
+    def test_text_from_parsed(self):
+        self.assertEqual([1, 2], json.loads(RawJSON.from_parsed([1, 2]).text))
+
+    def test_parse(self):
+        raw_json = RawJSON("{\"a\": [1]}")
+        self.assertEqual({"a": [1]}, raw_json.parse())
+        self.assertIs(raw_json.parse(), raw_json.parse())
+
+    def test_equal(self):
+        self.assertEqual(RawJSON("[1,  2]"), RawJSON.from_parsed([1, 2]))
+        self.assertNotEqual(RawJSON("[1]"), RawJSON("[2]"))
+
+
+class TestRawJSONEncoding(unittest.TestCase):
+    """
+    Tests for encoding and decoding `RawJSON`.
+    """
+    def test_encode(self):
+        self.assertEqual("{\"b\":  [1,2]}", json.dumps(RawJSON("{\"b\":  [1,2]}"), cls=RawJSONEncoder))
+
+    def test_encode_property(self):
+        document = _Document("a", RawJSON("{\"b\":  [1,2]}"))
+        self.assertEqual("{\"name\": \"a\", \"body\": {\"b\":  [1,2]}}", json.dumps(document, cls=_DocumentJSONEncoder))
+
+    def test_encode_properties_of_list(self):
+        documents = [_Document("a", RawJSON("1.50")), _Document("b", RawJSON("\"x\"")), _Document("c")]
+        self.assertEqual("[{\"name\": \"a\", \"body\": 1.50}, {\"name\": \"b\", \"body\": \"x\"}, {\"name\": \"c\"}]",
+                         json.dumps(documents, cls=_DocumentJSONEncoder))
+
+    def test_encode_string_like_placeholder(self):
+        documents = [_Document("%s:0" % ("0" * 32), RawJSON("[1 ]"))]
+        self.assertEqual("[{\"name\": \"%s:0\", \"body\": [1 ]}]" % ("0" * 32),
+                         json.dumps(documents, cls=_DocumentJSONEncoder))
+
+    def test_iterencode_property(self):
+        documents = [_Document("a", RawJSON("[ ]")), _Document("b", RawJSON("{ }"))]
+        encoded = "".join(_DocumentJSONEncoder(indent=1).iterencode(documents))
+        self.assertIn("\"body\": [ ]", encoded)
+        self.assertIn("\"body\": { }", encoded)
+
+    def test_default_keeps_raw_json(self):
+        raw_json = RawJSON("[1]")
+        self.assertIs(raw_json, _DocumentJSONEncoder().default(_Document("a", raw_json))["body"])
+
+    def test_encode_with_automatic_encoder(self):
+        builder = AutomaticJSONEncoderClassBuilder()
+        builder.register_json_encoder(_Document, _DocumentJSONEncoder)
+        Encoder = builder.build()
+        encoded = json.dumps([_Document("a", RawJSON("[1 ]"))], cls=Encoder)
+        self.assertEqual("[{\"name\": \"a\", \"body\": [1 ]}]", encoded)
+
+    def test_decode_property(self):
+        document = json.loads("{\"name\": \"a\", \"body\": {\"b\": [1, 2]}}", cls=_DocumentJSONDecoder)
+        self.assertEqual(RawJSON("{\"b\": [1, 2]}"), document.body)
+
+    def test_decode_and_encode_property(self):
+        document = json.loads("{\"name\": \"a\", \"body\": {\"b\": [1, 2]}}", cls=_DocumentJSONDecoder)
+        encoded = json.dumps(document, cls=_DocumentJSONEncoder)
+        self.assertEqual({"name": "a", "body": {"b": [1, 2]}}, json.loads(encoded))
+
+    def test_decode_property_verbatim(self):
+        document = json.loads("{\"name\": \"a\", \"body\" : {\"b\":  [1,2] } }", cls=_DocumentJSONDecoder)
+        self.assertEqual("{\"b\":  [1,2] }", document.body.text)
+        self.assertEqual({"b": [1, 2]}, document.body.parse())
+
+    def test_decode_and_encode_property_verbatim(self):
+        json_as_string = "[{\"name\": \"a\", \"body\": {\"b\":  [1,2]}}, {\"name\": \"b\", \"body\": null}]"
+        documents = json.loads(json_as_string, cls=_DocumentJSONDecoder)
+        self.assertIsNone(documents[1].body)
+        self.assertEqual("[{\"name\": \"a\", \"body\": {\"b\":  [1,2]}}, {\"name\": \"b\"}]",
+                         json.dumps(documents, cls=_DocumentJSONEncoder))
+
+    def test_decode_and_encode_nested_property_verbatim(self):
+        json_as_string = "{\"name\": \"f\", \"contents\": {\"documents\": [{\"name\": \"a\", \"body\": [1 ]}]}}"
+        folder = json.loads(json_as_string, cls=_FolderJSONDecoder)
+        self.assertEqual("[1 ]", folder.body[0].body.text)
+        self.assertEqual(json_as_string, json.dumps(folder, cls=_FolderJSONEncoder))
+
+    def test_decode_invalid_with_raw_properties(self):
+        for json_as_string in ("{\"name\": \"a\", \"body\": }", "{\"name\": \"a\",}", "{\"name\" \"a\"}",
+                               "{\"name\": \"a\" \"body\": 1}", "{\"name\": \"a\"} 1", "[{\"name\": \"a\"},]"):
+            self.assertRaises(json.JSONDecodeError, json.loads, json_as_string, cls=_DocumentJSONDecoder)
+
+    def test_decode_verbatim(self):
+        self.assertEqual("{\"b\":  1}", json.loads("{\"b\":  1}", cls=RawJSONDecoder).text)
+
+
+if __name__ == "__main__":
+    unittest.main()
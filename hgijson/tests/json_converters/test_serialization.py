@@ -1,5 +1,10 @@
 import json
 import unittest
+from json import JSONDecoder, JSONEncoder
+
+from hgijson.json_converters.builders import MappingJSONDecoderClassBuilder, MappingJSONEncoderClassBuilder
+from hgijson.json_converters.models import JsonPropertyMapping
+from hgijson.tests._models import SimpleModel
 
 from hgijson.tests.json_converters._helpers import create_complex_model_with_json_representation, \
     create_simple_model_with_json_representation
@@ -59,6 +64,29 @@ class TestMappingJSONEncoder(unittest.TestCase):
         encoded_as_dict = json.loads(encoded)
         self.assertCountEqual(encoded_as_dict, complex_models_as_json)
 
+    def test_default_with_iterable_uses_batch_encoding(self):
+        encoded_batches = []
+
+        class BatchJSONEncoder(JSONEncoder):
+            def default_many(self, values):
+                encoded_batches.append(list(values))
+                return [value * 2 for value in values]
+
+        encoder_cls = MappingJSONEncoderClassBuilder(SimpleModel, [
+            JsonPropertyMapping("serialized_a", "a", encoder_cls=BatchJSONEncoder, optional=True)
+        ]).build()
+        simple_models = [create_simple_model_with_json_representation(i)[0] for i in range(5)]
+        simple_models[-1].a = None
+        encoded = encoder_cls().default(simple_models + [None, [simple_models[1]]])
+
+        self.assertEqual([[0, 1, 2, 3, 1]], encoded_batches)
+        self.assertEqual([{"serialized_a": 0}, {"serialized_a": 2}, {"serialized_a": 4}, {"serialized_a": 6}, {}, None,
+                          [{"serialized_a": 2}]], encoded)
+
+        encoded_batches.clear()
+        json.dumps(simple_models, cls=encoder_cls)
+        self.assertEqual([[0, 1, 2, 3]], encoded_batches)
+
 
 class TestMappingJSONDecoder(unittest.TestCase):
     """
@@ -118,6 +146,39 @@ class TestMappingJSONDecoder(unittest.TestCase):
         decoded = json.loads(json_as_string, cls=ComplexModelMappingJSONDecoder)
         self.assertEqual(decoded, complex_models)
 
+    def test_decode_with_iterable_uses_batch_decoding(self):
+        decoded_batches = []
+
+        class BatchJSONDecoder(JSONDecoder):
+            def decode_parsed_many(self, values):
+                decoded_batches.append(list(values))
+                return [value * 2 for value in values]
+
+        decoder_cls = MappingJSONDecoderClassBuilder(SimpleModel, [
+            JsonPropertyMapping("serialized_a", "a", decoder_cls=BatchJSONDecoder, optional=True)
+        ]).build()
+        json_as_string = json.dumps([{"serialized_a": i} for i in range(5)] + [{}, [{"serialized_a": 5}]])
+        decoded = decoder_cls().decode(json_as_string)
+
+        self.assertEqual([[0, 1, 2, 3, 4, 5]], decoded_batches)
+        self.assertEqual([0, 2, 4, 6, 8, None], [model.a for model in decoded[:-1]])
+        self.assertEqual(10, decoded[-1][0].a)
+
+    def test_decode_with_property_decoder_with_custom_decode_parsed(self):
+        class CustomSimpleModelJSONDecoder(SimpleModelMappingJSONDecoder):
+            def decode_parsed(self, parsed_json):
+                decoded = super().decode_parsed(parsed_json)
+                decoded.a = "CUSTOM"
+                return decoded
+
+        decoder_cls = MappingJSONDecoderClassBuilder(SimpleModel, [
+            JsonPropertyMapping("serialized_a", "a", decoder_cls=CustomSimpleModelJSONDecoder)
+        ]).build()
+        decoded = decoder_cls().decode(json.dumps([{"serialized_a": self.simple_model_as_json}]))
+        self.assertEqual("CUSTOM", decoded[0].a.a)
+        self.assertEqual(["CUSTOM"], [model.a for model in CustomSimpleModelJSONDecoder().decode_parsed_many(
+            [self.simple_model_as_json])])
+
 
 if __name__ == "__main__":
     unittest.main()
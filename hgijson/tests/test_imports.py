@@ -0,0 +1,68 @@
+import subprocess
+import sys
+import unittest
+
+import hgijson
+
+# Maximum time, in seconds, that importing the package can take
+_MAX_IMPORT_TIME = 0.05
+
+
+def _get_modules_imported_by(statement: str):
+    """
+    Gets the modules that are imported by the given statement, executed in a new interpreter.
+    :param statement: the statement to execute
+    :return: the names of the modules that are imported
+    """
+    code = "import sys; before = set(sys.modules); %s; print('\\n'.join(set(sys.modules) - before))" % statement
+    return set(subprocess.check_output([sys.executable, "-c", code], universal_newlines=True).split())
+
+
+def _get_import_time(statement: str) -> float:
+    """
+    Gets the time taken to import the `hgijson` package (and the modules that it imports) when executing the given
+    statement in a new interpreter, measured by the interpreter (`-X importtime`).
+    :param statement: the statement to execute
+    :return: the time taken in seconds
+    """
+    output = subprocess.check_output([sys.executable, "-X", "importtime", "-c", statement],
+                                     stderr=subprocess.STDOUT, universal_newlines=True)
+    for line in output.splitlines():
+        # e.g. "import time:      1622 |       2135 | hgijson"
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "hgijson":
+            return int(fields[1]) / 1000000
+    raise AssertionError("Import time of the package not reported: %s" % output)
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "Lazy imports are not supported")
+class TestImports(unittest.TestCase):
+    """
+    Tests that importing the package does not import slow to import modules before they are used.
+    """
+    def test_import_package(self):
+        imported = _get_modules_imported_by("import hgijson")
+        self.assertNotIn("dateutil", imported)
+        self.assertNotIn("hgijson.json_converters.builders", imported)
+        self.assertNotIn("typing", imported)
+
+    def test_import_builders(self):
+        imported = _get_modules_imported_by("from hgijson import MappingJSONEncoderClassBuilder, JsonPropertyMapping")
+        self.assertNotIn("dateutil", imported)
+        self.assertNotIn("hgijson.json_converters.derivation", imported)
+
+    def test_import_package_time(self):
+        # Generous bound (the package imports in a few milliseconds), which importing the builders, the derivation of
+        # mappings and the binary formats when the package is imported exceeds
+        import_time = min(_get_import_time("import hgijson") for _ in range(3))
+        self.assertLess(import_time, _MAX_IMPORT_TIME)
+
+    def test_import_unknown(self):
+        self.assertRaises(AttributeError, getattr, hgijson, "Unknown")
+
+    def test_dir(self):
+        self.assertTrue(set(hgijson.__all__).issubset(dir(hgijson)))
+
+
+if __name__ == "__main__":
+    unittest.main()